@@ -8,6 +8,11 @@ from typing import Any, Dict, List, Union
 
 from app.ai_services.schema import BaseSegment, TranscriptionResult
 
+# Audio file extensions accepted by every transcription service
+SUPPORTED_AUDIO_FORMATS = frozenset(
+    {".mp3", ".wav", ".m4a", ".flac", ".ogg", ".mp4", ".webm", ".aac", ".wma"}
+)
+
 
 class TranscriptionService(ABC):
     """
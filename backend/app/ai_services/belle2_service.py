@@ -10,18 +10,19 @@ over baseline Whisper models.
 import logging
 import os
 import time
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import torch
-from app.ai_services.base import TranscriptionService
+from app.ai_services.base import SUPPORTED_AUDIO_FORMATS, TranscriptionService
 from app.ai_services.schema import BaseSegment, TranscriptionResult, build_transcription_result
 from app.config import settings
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+_SUPPORTED_LANGUAGES = ("zh", "zh-CN", "zh-TW", "zh-HK")
+
 
 class Belle2Service(TranscriptionService):
     """
@@ -380,7 +381,8 @@ class Belle2Service(TranscriptionService):
         Returns:
             List of ISO 639-1 language codes
         """
-        return ["zh", "zh-CN", "zh-TW", "zh-HK"]
+        # Copy so callers cannot mutate the shared constant
+        return list(_SUPPORTED_LANGUAGES)
 
     def validate_audio_file(self, audio_path: str) -> bool:
         """
@@ -392,15 +394,13 @@ class Belle2Service(TranscriptionService):
         Returns:
             True if valid, False otherwise
         """
-        # Check file exists
-        if not os.path.exists(audio_path):
+        # Check file extension first: rejecting unsupported formats needs no syscall
+        file_ext = os.path.splitext(audio_path)[1].lower()
+        if file_ext not in SUPPORTED_AUDIO_FORMATS:
             return False
 
-        # Check file extension
-        supported_formats = {".mp3", ".wav", ".m4a", ".flac", ".ogg", ".mp4", ".webm", ".aac", ".wma"}
-        file_ext = Path(audio_path).suffix.lower()
-
-        return file_ext in supported_formats
+        # Check file exists (a single stat)
+        return os.path.exists(audio_path)
 
     def get_model_info(self) -> Dict[str, Any]:
         """
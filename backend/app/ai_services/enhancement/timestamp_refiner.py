@@ -205,19 +205,19 @@ class TimestampRefiner(BaseRefiner):
         end = float(raw_segment.get("end", start))
         if end < start:
             end = start
-        normalized: EnhancedSegment = EnhancedSegment(
-            start=start,
-            end=end,
-            text=str(raw_segment.get("text", "")).strip(),
-            words=list(raw_segment.get("words", [])),
-            chars=list(raw_segment.get("chars", [])),
-            confidence=raw_segment.get("confidence"),
-            no_speech_prob=raw_segment.get("no_speech_prob"),
-            avg_logprob=raw_segment.get("avg_logprob"),
-            source_model=raw_segment.get("source_model"),
-            enhancements_applied=list(raw_segment.get("enhancements_applied", [])),
-            speaker=raw_segment.get("speaker"),
-        )
+        normalized: EnhancedSegment = {
+            "start": start,
+            "end": end,
+            "text": str(raw_segment.get("text", "")).strip(),
+            "words": list(raw_segment.get("words", [])),
+            "chars": list(raw_segment.get("chars", [])),
+            "confidence": raw_segment.get("confidence"),
+            "no_speech_prob": raw_segment.get("no_speech_prob"),
+            "avg_logprob": raw_segment.get("avg_logprob"),
+            "source_model": raw_segment.get("source_model"),
+            "enhancements_applied": list(raw_segment.get("enhancements_applied", [])),
+            "speaker": raw_segment.get("speaker"),
+        }
         if "alignment_model" in raw_segment:
             normalized["alignment_model"] = raw_segment["alignment_model"]
         return normalized
@@ -276,13 +276,13 @@ class TimestampRefiner(BaseRefiner):
                 start = float(entry.get("start", segment["start"]))
                 end = float(entry.get("end", start))
                 normalized.append(
-                    WordTiming(
-                        word=word_text,
-                        start=max(segment["start"], start),
-                        end=min(segment["end"], max(start, end)),
-                        score=float(entry.get("score", 0.95)),
-                        language=entry.get("language") or language_hint,
-                    )
+                    {
+                        "word": word_text,
+                        "start": max(segment["start"], start),
+                        "end": min(segment["end"], max(start, end)),
+                        "score": float(entry.get("score", 0.95)),
+                        "language": entry.get("language") or language_hint,
+                    }
                 )
             if normalized:
                 return normalized
@@ -296,13 +296,13 @@ class TimestampRefiner(BaseRefiner):
             start = segment["start"] + idx * slice_duration
             end = start + slice_duration if slice_duration else segment["end"]
             normalized.append(
-                WordTiming(
-                    word=token,
-                    start=float(start),
-                    end=float(end),
-                    score=0.95,
-                    language=language_hint,
-                )
+                {
+                    "word": token,
+                    "start": float(start),
+                    "end": float(end),
+                    "score": 0.95,
+                    "language": language_hint,
+                }
             )
         return normalized
 
@@ -332,12 +332,12 @@ class TimestampRefiner(BaseRefiner):
                     start = word["start"] + idx * slice_duration
                     end = start + slice_duration if slice_duration else word["end"]
                     char_timings.append(
-                        CharTiming(
-                            char=char,
-                            start=float(start),
-                            end=float(end),
-                            score=word.get("score", 0.95),
-                        )
+                        {
+                            "char": char,
+                            "start": float(start),
+                            "end": float(end),
+                            "score": word.get("score", 0.95),
+                        }
                     )
         else:
             chars = [ch for ch in segment["text"] if self._is_cjk(ch)]
@@ -349,7 +349,7 @@ class TimestampRefiner(BaseRefiner):
                 start = segment["start"] + idx * slice_duration
                 end = start + slice_duration if slice_duration else segment["end"]
                 char_timings.append(
-                    CharTiming(char=char, start=float(start), end=float(end), score=0.9)
+                    {"char": char, "start": float(start), "end": float(end), "score": 0.9}
                 )
         return char_timings
 
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Tuple
+import threading
+from typing import List, Optional, Tuple
 
 from app.ai_services.enhancement.vad_engines.base_vad import BaseVAD, SpeechSpans
 
@@ -15,6 +16,16 @@ class SileroVAD(BaseVAD):
 
     name = "silero"
 
+    # torch.hub model + utils shared across instances. VADManager (and with it
+    # SileroVAD) is rebuilt for every enhancement pipeline, i.e. per transcription,
+    # so a per-instance cache would reload the model for each job.
+    _shared_model: Optional[Tuple[object, object, object]] = None
+    _load_lock = threading.Lock()
+    # The Silero model is stateful (reset_states() plus recurrent context carried
+    # between chunks), so concurrent get_speech_timestamps calls on the shared
+    # instance would corrupt each other's state.
+    _inference_lock = threading.Lock()
+
     def __init__(
         self,
         *,
@@ -44,13 +55,14 @@ class SileroVAD(BaseVAD):
             model, get_speech_timestamps, read_audio = self._load_model()
             # read_audio resamples to 16000 Hz
             wav = read_audio(audio_path, sampling_rate=16000)
-            speech_segments = get_speech_timestamps(
-                wav,
-                model,
-                sampling_rate=16000,
-                threshold=self.threshold,
-                min_silence_duration_ms=self.min_silence_ms,
-            )
+            with SileroVAD._inference_lock:
+                speech_segments = get_speech_timestamps(
+                    wav,
+                    model,
+                    sampling_rate=16000,
+                    threshold=self.threshold,
+                    min_silence_duration_ms=self.min_silence_ms,
+                )
             return [
                 (segment["start"] / 16000.0, segment["end"] / 16000.0)
                 for segment in speech_segments
@@ -63,16 +75,21 @@ class SileroVAD(BaseVAD):
         if self._model is not None:
             return self._model, self._get_speech_timestamps, self._read_audio
 
-        import torch
+        # Lock so concurrent first calls do not each download/load the model
+        with SileroVAD._load_lock:
+            if SileroVAD._shared_model is None:
+                import torch
 
-        logger.info("Loading Silero VAD model via torch.hub")
-        model, utils = torch.hub.load(
-            repo_or_dir="snakers4/silero-vad",
-            model="silero_vad",
-            trust_repo=True,
-        )
-        (get_speech_timestamps, _, read_audio, _, _) = utils
+                logger.info("Loading Silero VAD model via torch.hub")
+                model, utils = torch.hub.load(
+                    repo_or_dir="snakers4/silero-vad",
+                    model="silero_vad",
+                    trust_repo=True,
+                )
+                (get_speech_timestamps, _, read_audio, _, _) = utils
+                SileroVAD._shared_model = (model, get_speech_timestamps, read_audio)
 
+        model, get_speech_timestamps, read_audio = SileroVAD._shared_model
         self._model = model
         self._get_speech_timestamps = get_speech_timestamps
         self._read_audio = read_audio
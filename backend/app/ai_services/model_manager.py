@@ -5,6 +5,7 @@ Implements singleton pattern with LRU eviction to manage GPU memory efficiently.
 Ensures maximum 2 concurrent models in memory to prevent OOM errors.
 """
 
+import importlib.util
 import logging
 import time
 from typing import Dict, Any, Tuple, Optional
@@ -12,6 +13,8 @@ from functools import lru_cache
 from collections import OrderedDict
 import torch
 
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,9 +45,15 @@ class ModelManager:
             # Max 2 models to fit within GPU memory constraints
             self.loaded_models: OrderedDict[str, Tuple[Any, Any]] = OrderedDict()
             self.max_models = 2
+            # 4-bit BELLE-2 weights need roughly a quarter of the fp16 VRAM, so a
+            # cache holding only such models may keep one more
+            self.max_quantized_models = 3
+            self.low_vram: set[str] = set()
 
             # Track model load times for performance monitoring
             self.load_times: Dict[str, float] = {}
+            # Track which cached models were loaded with quantized weights
+            self.quantized: Dict[str, bool] = {}
 
             ModelManager._initialized = True
             logger.info(f"ModelManager initialized (max {self.max_models} concurrent models)")
@@ -60,6 +69,11 @@ class ModelManager:
         First call: Downloads model (~3.1GB, 5-10 minutes)
         Subsequent calls: Loads from cache (<5 seconds)
 
+        Quantization:
+        - CPU: Linear layers use PyTorch dynamic int8 quantization
+        - CUDA: NF4 4-bit weights via bitsandbytes when BELLE2_LOAD_IN_4BIT is set;
+          while only 4-bit models are cached the limit is max_quantized_models
+
         Args:
             model_name: HuggingFace model ID
             device: 'cuda' or 'cpu'
@@ -79,20 +93,13 @@ class ModelManager:
             self.loaded_models.move_to_end(cache_key)
             return self.loaded_models[cache_key]
 
-        # Evict oldest model if at capacity
-        if len(self.loaded_models) >= self.max_models:
-            evicted_key, (evicted_model, _) = self.loaded_models.popitem(last=False)
-            logger.info(f"Evicting model from cache: {evicted_key}")
+        load_in_4bit = device == "cuda" and settings.BELLE2_LOAD_IN_4BIT
 
-            # Clear CUDA cache if on GPU
-            if device == "cuda" and torch.cuda.is_available():
-                del evicted_model
-                torch.cuda.empty_cache()
-                logger.info(f"GPU memory released: {self.get_vram_usage():.2f}GB remaining")
+        self._evict_until_room(load_in_4bit, device)
 
         # Load new model
         logger.info(f"Loading BELLE-2 model: {model_name} on {device}")
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
             from transformers import WhisperProcessor, WhisperForConditionalGeneration
@@ -100,21 +107,53 @@ class ModelManager:
             # Load processor (tokenizer + feature extractor)
             processor = WhisperProcessor.from_pretrained(model_name)
 
+            load_kwargs: Dict[str, Any] = {
+                "torch_dtype": torch.float16 if device == "cuda" else torch.float32
+            }
+            if load_in_4bit:
+                if importlib.util.find_spec("bitsandbytes") is None:
+                    raise RuntimeError(
+                        "BELLE2_LOAD_IN_4BIT is set but bitsandbytes is not installed "
+                        "(see requirements-belle2.txt)"
+                    )
+                from transformers import BitsAndBytesConfig
+
+                load_kwargs["quantization_config"] = BitsAndBytesConfig(
+                    load_in_4bit=True,
+                    bnb_4bit_quant_type="nf4",
+                    bnb_4bit_compute_dtype=torch.float16,
+                )
+                # bitsandbytes models are placed at load time and cannot be moved with .to()
+                load_kwargs["device_map"] = device
+
             # Load model with appropriate dtype
             model = WhisperForConditionalGeneration.from_pretrained(
                 model_name,
-                torch_dtype=torch.float16 if device == "cuda" else torch.float32
-            ).to(device)
+                **load_kwargs
+            )
+            if not load_in_4bit:
+                model = model.to(device)
+
+            if device == "cpu":
+                # Dynamic int8 quantization of Linear layers speeds up CPU inference
+                model = torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
 
-            load_time = time.time() - start_time
+            quantized = load_in_4bit or device == "cpu"
+            if load_in_4bit:
+                self.low_vram.add(cache_key)
+
+            load_time = (time.monotonic_ns() - start_ns) / 1e9
             self.load_times[cache_key] = load_time
+            self.quantized[cache_key] = quantized
 
             # Cache the model
             self.loaded_models[cache_key] = (model, processor)
 
             logger.info(
                 f"BELLE-2 model loaded in {load_time:.2f}s "
-                f"(VRAM: {self.get_vram_usage():.2f}GB)"
+                f"(quantized: {quantized}, VRAM: {self.get_vram_usage():.2f}GB)"
             )
 
             return model, processor
@@ -154,20 +193,11 @@ class ModelManager:
             self.loaded_models.move_to_end(cache_key)
             return self.loaded_models[cache_key][0]  # Return model only (no processor)
 
-        # Evict oldest model if at capacity
-        if len(self.loaded_models) >= self.max_models:
-            evicted_key, (evicted_model, _) = self.loaded_models.popitem(last=False)
-            logger.info(f"Evicting model from cache: {evicted_key}")
-
-            # Clear CUDA cache if on GPU
-            if device == "cuda" and torch.cuda.is_available():
-                del evicted_model
-                torch.cuda.empty_cache()
-                logger.info(f"GPU memory released: {self.get_vram_usage():.2f}GB remaining")
+        self._evict_until_room(False, device)
 
         # Load new model
         logger.info(f"Loading WhisperX model: {model_name} on {device}")
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
             from faster_whisper import WhisperModel
@@ -178,8 +208,9 @@ class ModelManager:
                 compute_type=compute_type
             )
 
-            load_time = time.time() - start_time
+            load_time = (time.monotonic_ns() - start_ns) / 1e9
             self.load_times[cache_key] = load_time
+            self.quantized[cache_key] = compute_type.startswith("int8")
 
             # Cache the model (WhisperX doesn't need processor)
             self.loaded_models[cache_key] = (model, None)
@@ -197,6 +228,110 @@ class ModelManager:
                 f"Failed to load WhisperX model '{model_name}': {str(e)}"
             )
 
+    def load_detection(
+        self,
+        model_name: str = "small",
+        device: str = "cuda",
+        compute_type: str = "int8"
+    ) -> Any:
+        """
+        Load faster-whisper language detection model with LRU caching
+
+        The detection model shares the LRU budget with transcription models so
+        it is evicted once the BELLE-2/WhisperX model for the job is loaded.
+
+        Args:
+            model_name: Whisper model size used for detection
+            device: 'cuda' or 'cpu'
+            compute_type: 'float16', 'int8', or 'float32'
+
+        Returns:
+            faster-whisper WhisperModel instance
+
+        Raises:
+            RuntimeError: If model loading fails
+        """
+        cache_key = f"detect_{model_name}_{device}_{compute_type}"
+
+        # Check if model is already loaded
+        if cache_key in self.loaded_models:
+            logger.info(f"Using cached detection model: {model_name}")
+            # Move to end (most recently used)
+            self.loaded_models.move_to_end(cache_key)
+            return self.loaded_models[cache_key][0]
+
+        self._evict_until_room(False, device)
+
+        # Load new model
+        logger.info(f"Loading detection model: {model_name} on {device}")
+        start_ns = time.monotonic_ns()
+
+        try:
+            from faster_whisper import WhisperModel
+
+            model = WhisperModel(
+                model_name,
+                device=device,
+                compute_type=compute_type
+            )
+
+            load_time = (time.monotonic_ns() - start_ns) / 1e9
+            self.load_times[cache_key] = load_time
+            self.quantized[cache_key] = compute_type.startswith("int8")
+
+            self.loaded_models[cache_key] = (model, None)
+
+            logger.info(
+                f"Detection model loaded in {load_time:.2f}s "
+                f"(VRAM: {self.get_vram_usage():.2f}GB)"
+            )
+
+            return model
+
+        except Exception as e:
+            logger.error(f"Failed to load detection model: {e}", exc_info=True)
+            raise RuntimeError(
+                f"Failed to load detection model '{model_name}': {str(e)}"
+            )
+
+    def _evict_until_room(self, low_vram: bool, device: str) -> None:
+        """
+        Evict least recently used models until one more fits under the limit
+
+        Args:
+            low_vram: Whether the incoming model is loaded with 4-bit weights
+            device: Device of the incoming model; CUDA memory is released after
+                each eviction
+        """
+        while len(self.loaded_models) >= self._capacity(low_vram):
+            evicted_key, (evicted_model, _) = self.loaded_models.popitem(last=False)
+            self.low_vram.discard(evicted_key)
+            logger.info(f"Evicting model from cache: {evicted_key}")
+
+            # Clear CUDA cache if on GPU
+            if device == "cuda" and torch.cuda.is_available():
+                del evicted_model
+                torch.cuda.empty_cache()
+                logger.info(f"GPU memory released: {self.get_vram_usage():.2f}GB remaining")
+
+    def _capacity(self, low_vram: bool) -> int:
+        """
+        Return the cache limit that applies to the model being loaded
+
+        The raised limit only holds while every cached model, and the incoming
+        one, uses 4-bit weights; any full-precision model brings the cache back
+        to max_models.
+
+        Args:
+            low_vram: Whether the incoming model is loaded with 4-bit weights
+
+        Returns:
+            Maximum number of cached models
+        """
+        if low_vram and all(key in self.low_vram for key in self.loaded_models):
+            return self.max_quantized_models
+        return self.max_models
+
     def get_vram_usage(self) -> float:
         """
         Get current VRAM usage in GB
@@ -230,6 +365,7 @@ class ModelManager:
             logger.info(f"Removed model from cache: {cache_key}")
 
         self.loaded_models.clear()
+        self.low_vram.clear()
 
         if torch.cuda.is_available():
             torch.cuda.empty_cache()
@@ -247,5 +383,6 @@ class ModelManager:
             "model_count": len(self.loaded_models),
             "max_models": self.max_models,
             "vram_usage_gb": self.get_vram_usage(),
-            "load_times": self.load_times.copy()
+            "load_times": self.load_times.copy(),
+            "quantized": self.quantized.copy()
         }
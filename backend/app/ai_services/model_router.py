@@ -16,12 +16,13 @@ import os
 import subprocess
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as DetectionTimeout
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as DetectionTimeout
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import TYPE_CHECKING
 
 # Lazy imports to avoid loading PyTorch in web container
@@ -36,7 +37,7 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-MANDARIN_CODES = {
+MANDARIN_CODES = frozenset({
     "zh",
     "zh-cn",
     "zh-hans",
@@ -46,7 +47,9 @@ MANDARIN_CODES = {
     "zh-sg",
     "cmn",
     "mandarin",
-}
+})
+# First characters of every MANDARIN_CODES entry, used to reject most codes cheaply
+_MANDARIN_INITIALS = frozenset(code[0] for code in MANDARIN_CODES)
 DEFAULT_ENGINE = "whisperx"
 
 
@@ -64,6 +67,8 @@ class DetectionResult:
 class RouterConfig(BaseModel):
     """Configuration envelope for the model router."""
 
+    model_config = ConfigDict(frozen=True)
+
     enable_belle2: bool = Field(default=True)
     enable_sensevoice: bool = Field(default=False)
     default_engine: str = Field(default=DEFAULT_ENGINE)
@@ -72,11 +77,19 @@ class RouterConfig(BaseModel):
     language_detection_timeout: float = Field(default=5.0, gt=0)
     detection_device: str = Field(default="cuda")
     detection_compute_type: str = Field(default="int8")
+    detection_batching: bool = Field(default=False)
     log_selection_events: bool = Field(default=True)
 
     @classmethod
+    @lru_cache(maxsize=1)
     def from_settings(cls) -> "RouterConfig":
-        """Build config from runtime settings with sane fallbacks."""
+        """
+        Build config from runtime settings with sane fallbacks.
+
+        Settings are snapshotted once and the resulting config is cached for the
+        process lifetime; the model is frozen so the shared instance cannot be
+        mutated by one caller for all others.
+        """
         return cls(
             enable_belle2=getattr(settings, "ROUTER_ENABLE_BELLE2", True),
             enable_sensevoice=getattr(settings, "ROUTER_ENABLE_SENSEVOICE", False),
@@ -94,16 +107,14 @@ class RouterConfig(BaseModel):
             detection_compute_type=getattr(
                 settings, "ROUTER_DETECTION_COMPUTE_TYPE", "int8"
             ),
-            log_selection_events=getattr(
-                settings, "ROUTER_LOG_SELECTION_EVENTS", True
-            ),
+            detection_batching=getattr(settings, "ROUTER_DETECTION_BATCHING", False),
+            log_selection_events=getattr(settings, "ROUTER_LOG_SELECTION_EVENTS", True),
         )
 
 
 class LanguageDetector:
     """Thin wrapper around Whisper-small language detection with timeout safety."""
 
-    _model_cache: Dict[str, Any] = {}
     _model_lock = threading.Lock()
 
     def __init__(self, config: RouterConfig):
@@ -113,7 +124,7 @@ class LanguageDetector:
 
     def detect(self, audio_path: str) -> DetectionResult:
         """Detect the dominant language by sampling the first N seconds of audio."""
-        start = time.perf_counter()
+        start_ns = time.monotonic_ns()
         try:
             with ThreadPoolExecutor(max_workers=1) as executor:
                 future = executor.submit(self._detect_sync, audio_path)
@@ -121,7 +132,7 @@ class LanguageDetector:
                     timeout=self.config.language_detection_timeout
                 )
 
-            duration_ms = round((time.perf_counter() - start) * 1000, 3)
+            duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             return DetectionResult(
                 language=language,
                 confidence=confidence,
@@ -130,7 +141,7 @@ class LanguageDetector:
             )
 
         except DetectionTimeout:
-            duration_ms = round((time.perf_counter() - start) * 1000, 3)
+            duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             logger.warning(
                 "Language detection timed out after %.2fs for %s",
                 self.config.language_detection_timeout,
@@ -144,7 +155,7 @@ class LanguageDetector:
                 error="detection_timeout",
             )
         except Exception as exc:  # pragma: no cover - defensive logging
-            duration_ms = round((time.perf_counter() - start) * 1000, 3)
+            duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             logger.warning(
                 "Language detection failed for %s: %s", audio_path, exc, exc_info=True
             )
@@ -160,9 +171,15 @@ class LanguageDetector:
     # Internal helpers
     # --------------------------------------------------------------------- #
     def _detect_sync(self, audio_path: str) -> Tuple[str, float]:
+        model, segment = self._prepare_features(audio_path)
+        encoder_output = model.encode(segment)
+        results = model.model.detect_language(encoder_output)
+        return self._parse_detection(results[0])
+
+    def _prepare_features(self, audio_path: str) -> Tuple[Any, Any]:
+        """Load the detection model and compute the log-mel features for a sample."""
         # Lazy import to avoid loading PyTorch in web container
-        from app.ai_services.whisperx_shim import ensure_whisperx_available
-        ensure_whisperx_available()
+        import app.ai_services.whisperx_shim  # noqa: F401 - registers vendored whisperx
         from app.ai_services.whisperx.whisperx.audio import (
             SAMPLE_RATE,
             log_mel_spectrogram,
@@ -186,40 +203,25 @@ class LanguageDetector:
             n_mels=self._infer_mel_count(model),
             device=self.device,
         )
-        encoder_output = model.encode(segment)
-        results = model.model.detect_language(encoder_output)
+        return model, segment
 
-        language_token, probability = results[0][0]
+    @staticmethod
+    def _parse_detection(language_probs: Any) -> Tuple[str, float]:
+        language_token, probability = language_probs[0]
         language_code = language_token[2:-2].lower()
         return language_code, float(probability)
 
     def _load_model(self):
-        cache_key = (
-            self.config.language_detection_model,
-            self.device,
-            self.compute_type,
-        )
-        if cache_key in self._model_cache:
-            return self._model_cache[cache_key]
+        # Delegate to ModelManager so the detection model participates in the
+        # shared LRU budget instead of pinning VRAM for the process lifetime
+        from app.ai_services.model_manager import ModelManager
 
         with self._model_lock:
-            if cache_key in self._model_cache:
-                return self._model_cache[cache_key]
-
-            try:
-                from faster_whisper import WhisperModel
-            except ImportError as exc:  # pragma: no cover - dependency guard
-                raise RuntimeError(
-                    "faster-whisper is required for language detection"
-                ) from exc
-
-            model = WhisperModel(
+            return ModelManager().load_detection(
                 self.config.language_detection_model,
-                device=self.device,
-                compute_type=self.compute_type,
+                self.device,
+                self.compute_type,
             )
-            self._model_cache[cache_key] = model
-            return model
 
     @staticmethod
     def _resolve_device(preferred: str) -> str:
@@ -238,6 +240,90 @@ class LanguageDetector:
         return int(getattr(dims, "n_mels", 80))
 
 
+class BatchingDetector(LanguageDetector):
+    """
+    LanguageDetector that coalesces concurrent detections into one encoder pass.
+
+    Features from detections arriving within ``batch_window_seconds`` of each
+    other (up to ``max_batch_size``) are stacked and encoded together by a
+    shared consumer thread, so concurrent jobs fill the GPU instead of each
+    running a batch-of-one encode.
+    """
+
+    max_batch_size = 8
+    batch_window_seconds = 0.05
+
+    _pending: List[Tuple[Any, Any, Future]] = []
+    _pending_cond = threading.Condition()
+    _consumer: Optional[threading.Thread] = None
+
+    def _detect_sync(self, audio_path: str) -> Tuple[str, float]:
+        model, segment = self._prepare_features(audio_path)
+        future: Future = Future()
+        cls = BatchingDetector
+        with cls._pending_cond:
+            cls._pending.append((model, segment, future))
+            if cls._consumer is None or not cls._consumer.is_alive():
+                cls._consumer = threading.Thread(
+                    target=cls._consume,
+                    name="language-detection-batcher",
+                    daemon=True,
+                )
+                cls._consumer.start()
+            cls._pending_cond.notify()
+        # Bounded so a lost batch cannot block detect()'s executor shutdown
+        return future.result(timeout=self.config.language_detection_timeout)
+
+    @classmethod
+    def _consume(cls) -> None:
+        while True:
+            with cls._pending_cond:
+                while not cls._pending:
+                    cls._pending_cond.wait()
+                # Hold the batch open until it is full or the window elapses
+                deadline = time.monotonic() + cls.batch_window_seconds
+                while len(cls._pending) < cls.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    cls._pending_cond.wait(remaining)
+                batch = cls._pending[: cls.max_batch_size]
+                del cls._pending[: cls.max_batch_size]
+            try:
+                cls._run_batch(batch)
+            except BaseException as exc:
+                # Fail the batch's callers rather than leave them waiting on a
+                # dead consumer; the next detection starts a new one
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                if not isinstance(exc, Exception):
+                    raise
+
+    @classmethod
+    def _run_batch(cls, batch: List[Tuple[Any, Any, Future]]) -> None:
+        import torch
+
+        # Requests can only share an encoder pass when they use the same model
+        groups: Dict[int, List[Tuple[Any, Any, Future]]] = {}
+        for item in batch:
+            groups.setdefault(id(item[0]), []).append(item)
+
+        for items in groups.values():
+            model = items[0][0]
+            try:
+                encoder_output = model.encode(
+                    torch.stack([segment for _, segment, _ in items])
+                )
+                results = model.model.detect_language(encoder_output)
+                for (_, _, future), language_probs in zip(items, results):
+                    future.set_result(cls._parse_detection(language_probs))
+            except Exception as exc:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(exc)
+
+
 def select_engine(
     job_id: str,
     audio_path: str,
@@ -272,7 +358,10 @@ def select_engine(
         _emit_selection_log(selection_details, router_config)
         return service, engine_name, selection_details
 
-    detection_client = detector or LanguageDetector(router_config)
+    detector_cls = (
+        BatchingDetector if router_config.detection_batching else LanguageDetector
+    )
+    detection_client = detector or detector_cls(router_config)
     detection_result = detection_client.detect(audio_path)
     selection_details["detected_language"] = detection_result.language
     selection_details["detection_confidence"] = detection_result.confidence
@@ -396,7 +485,9 @@ def _is_mandarin(language: Optional[str]) -> bool:
     if not language:
         return False
     normalized = _normalize_language_code(language)
-    return normalized in MANDARIN_CODES if normalized else False
+    if not normalized or normalized[0] not in _MANDARIN_INITIALS:
+        return False
+    return normalized in MANDARIN_CODES
 
 
 def _load_audio_snippet(audio_path: str, duration_seconds: int):
@@ -406,8 +497,7 @@ def _load_audio_snippet(audio_path: str, duration_seconds: int):
     """
     # Lazy imports to avoid loading PyTorch/numpy in web container
     import numpy as np
-    from app.ai_services.whisperx_shim import ensure_whisperx_available
-    ensure_whisperx_available()
+    import app.ai_services.whisperx_shim  # noqa: F401 - registers vendored whisperx
     from app.ai_services.whisperx.whisperx.audio import SAMPLE_RATE
 
     cmd = [
@@ -85,6 +85,8 @@ class TimestampOptimizer(ABC):
         result = optimizer.optimize(segments, audio_path, language="zh")
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def optimize(
         self,
@@ -8,6 +8,9 @@ Story 3.2a: Pluggable Optimizer Architecture Design
 """
 
 import logging
+import sys
+from functools import lru_cache
+from typing import Callable, Dict
 from .base import TimestampOptimizer
 from .whisperx_optimizer import WhisperXOptimizer
 from .heuristic_optimizer import HeuristicOptimizer
@@ -15,6 +18,61 @@ from .heuristic_optimizer import HeuristicOptimizer
 
 logger = logging.getLogger(__name__)
 
+# One optimizer per engine so lazily loaded models (e.g. the WhisperX
+# alignment model) are reused across jobs instead of reloaded per request
+_INSTANCES: Dict[str, TimestampOptimizer] = {}
+
+
+@lru_cache(maxsize=1)
+def _default_engine() -> str:
+    """
+    Resolve settings.OPTIMIZER_ENGINE once per process.
+
+    The value is interned so it is the same object as the _DISPATCH and
+    _INSTANCES keys (source literals are interned already), letting dict
+    lookups succeed on identity without comparing characters.
+    """
+    from app.config import settings
+    return sys.intern(settings.OPTIMIZER_ENGINE)
+
+
+def _create_whisperx() -> TimestampOptimizer:
+    """Mode: whisperx (try WhisperX, fallback to Heuristic)."""
+    if WhisperXOptimizer.is_available():
+        logger.info("Creating WhisperXOptimizer (engine=whisperx)")
+        return WhisperXOptimizer()
+    logger.warning(
+        "WhisperX dependencies unavailable (whisperx or pyannote.audio missing). "
+        "Falling back to HeuristicOptimizer."
+    )
+    return HeuristicOptimizer()
+
+
+def _create_heuristic() -> TimestampOptimizer:
+    """Mode: heuristic (always use Heuristic)."""
+    logger.info("Creating HeuristicOptimizer (engine=heuristic)")
+    return HeuristicOptimizer()
+
+
+def _create_auto() -> TimestampOptimizer:
+    """Mode: auto (prefer WhisperX, fallback to Heuristic)."""
+    if WhisperXOptimizer.is_available():
+        logger.info("Auto-selecting WhisperXOptimizer (WhisperX available)")
+        return WhisperXOptimizer()
+    logger.info(
+        "Auto-selecting HeuristicOptimizer (WhisperX unavailable). "
+        "Install whisperx and pyannote.audio for improved optimization."
+    )
+    return HeuristicOptimizer()
+
+
+# Engine name -> zero-arg builder; register new engines here
+_DISPATCH: Dict[str, Callable[[], TimestampOptimizer]] = {
+    "whisperx": _create_whisperx,
+    "heuristic": _create_heuristic,
+    "auto": _create_auto,
+}
+
 
 class OptimizerFactory:
     """
@@ -39,12 +97,19 @@ class OptimizerFactory:
             OPTIMIZER_ENGINE=auto    # Prefer WhisperX, fallback to Heuristic
             OPTIMIZER_ENGINE=whisperx  # Force WhisperX (with fallback)
             OPTIMIZER_ENGINE=heuristic  # Force Heuristic
+
+    Instances are cached per engine; call reset_cache() to force re-creation.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def create(engine: str = None) -> TimestampOptimizer:
         """
-        Create optimizer instance based on engine configuration.
+        Get the optimizer instance for the engine configuration.
+
+        The first call per engine builds the optimizer; later calls return the
+        same instance.
 
         Args:
             engine: Optimizer engine to use. Valid values:
@@ -71,41 +136,22 @@ class OptimizerFactory:
         """
         # Read from settings if engine not explicitly provided
         if engine is None:
-            from app.config import settings
-            engine = settings.OPTIMIZER_ENGINE
-
-        # Mode: whisperx (try WhisperX, fallback to Heuristic)
-        if engine == "whisperx":
-            if WhisperXOptimizer.is_available():
-                logger.info("Creating WhisperXOptimizer (engine=whisperx)")
-                return WhisperXOptimizer()
-            else:
-                logger.warning(
-                    "WhisperX dependencies unavailable (whisperx or pyannote.audio missing). "
-                    "Falling back to HeuristicOptimizer."
-                )
-                return HeuristicOptimizer()
-
-        # Mode: heuristic (always use Heuristic)
-        elif engine == "heuristic":
-            logger.info("Creating HeuristicOptimizer (engine=heuristic)")
-            return HeuristicOptimizer()
-
-        # Mode: auto (prefer WhisperX, fallback to Heuristic)
-        elif engine == "auto":
-            if WhisperXOptimizer.is_available():
-                logger.info("Auto-selecting WhisperXOptimizer (WhisperX available)")
-                return WhisperXOptimizer()
-            else:
-                logger.info(
-                    "Auto-selecting HeuristicOptimizer (WhisperX unavailable). "
-                    "Install whisperx and pyannote.audio for improved optimization."
-                )
-                return HeuristicOptimizer()
-
-        # Invalid engine value
-        else:
-            raise ValueError(
-                f"Unknown optimizer engine: '{engine}'. "
-                f"Valid engines: 'whisperx', 'heuristic', 'auto'"
-            )
+            engine = _default_engine()
+
+        optimizer = _INSTANCES.get(engine)
+        if optimizer is None:
+            try:
+                build = _DISPATCH[engine]
+            except KeyError:
+                raise ValueError(
+                    f"Unknown optimizer engine: '{engine}'. "
+                    f"Valid engines: 'whisperx', 'heuristic', 'auto'"
+                ) from None
+            optimizer = _INSTANCES[engine] = build()
+        return optimizer
+
+    @staticmethod
+    def reset_cache() -> None:
+        """Drop cached optimizer instances and default engine (used by tests and config reloads)."""
+        _INSTANCES.clear()
+        _default_engine.cache_clear()
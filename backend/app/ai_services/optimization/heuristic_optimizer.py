@@ -30,6 +30,8 @@ class HeuristicOptimizer(TimestampOptimizer):
     Note: Stub implementation in Story 3.2a. Full implementation in Stories 3.3-3.5.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def is_available() -> bool:
         """
@@ -70,18 +72,16 @@ class HeuristicOptimizer(TimestampOptimizer):
         Raises:
             ValueError: If segments payload is empty
         """
-        if not segments:
+        segment_count = len(segments)
+        if not segment_count:
             raise ValueError("Cannot optimize empty segment list.")
 
-        result_segments: List[TimestampSegment] = [
-            segment.copy() for segment in segments
-        ]
-        metrics = {
-            "segments_optimized": float(len(result_segments)),
-            "latency_ms": 0.0,
-        }
+        # Pass-through: a new list shares the caller's segment dicts (no per-segment copy)
         return OptimizationResult(
-            segments=result_segments,
-            metrics=metrics,
+            segments=list(segments),
+            metrics={
+                "segments_optimized": float(segment_count),
+                "latency_ms": 0.0,
+            },
             optimizer_name="heuristic",
         )
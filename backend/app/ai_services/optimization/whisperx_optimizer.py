@@ -8,14 +8,71 @@ Story 3.2a: Stub implementation (architecture foundation)
 Story 3.2b: Full implementation with dependency validation and alignment logic
 """
 
+import importlib.util
 import time
 import logging
-from typing import List, Any, Dict, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Any, Dict, Optional, Tuple
 from .base import OptimizationResult, TimestampOptimizer, TimestampSegment
 
 
 logger = logging.getLogger(__name__)
 
+# Fetches the fields WhisperX needs from a TimestampSegment in one C-level call
+_ALIGN_FIELDS = itemgetter("start", "end", "text")
+
+
+def _has_module(name: str) -> bool:
+    """Check whether a module can be imported without executing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """
+    Probe for a usable CUDA device once per process.
+
+    torch.cuda.is_available() goes through the driver on every call; GPUs are
+    not hot-plugged on transcription workers, so the first answer is final.
+    """
+    import torch
+
+    return torch.cuda.is_available()
+
+
+@lru_cache(maxsize=1)
+def _whisperx_available() -> bool:
+    """
+    Probe WhisperX dependencies and CUDA once per process.
+
+    Dependency availability cannot change while the process runs, so the
+    probe runs only on the first call. Packages are located with find_spec
+    rather than imported; torch is only imported for the CUDA check once
+    every dependency is known to be installed.
+    """
+    missing = [
+        name for name in ("whisperx", "pyannote.audio", "torch")
+        if not _has_module(name)
+    ]
+    if missing:
+        logger.debug("WhisperX unavailable: missing %s", ", ".join(missing))
+        return False
+
+    # Also verify CUDA is available (WhisperX requires GPU)
+    if not _cuda_available():
+        logger.warning(
+            "WhisperX dependencies found but CUDA unavailable. "
+            "WhisperX requires GPU acceleration."
+        )
+        return False
+
+    return True
+
 
 class WhisperXOptimizer(TimestampOptimizer):
     """
@@ -33,6 +90,11 @@ class WhisperXOptimizer(TimestampOptimizer):
     Quality: 10-30% segment length improvement, no accuracy loss
     """
 
+    __slots__ = ("_align_cache", "_whisperx_module")
+
+    # wav2vec2 alignment models kept resident per language (LRU)
+    ALIGN_CACHE_SIZE = 2
+
     def __init__(self):
         """
         Initialize WhisperXOptimizer with lazy model loading.
@@ -46,36 +108,60 @@ class WhisperXOptimizer(TimestampOptimizer):
                 "Install with: uv pip install whisperx pyannote.audio==3.1.1"
             )
 
-        # Lazy-loaded on first optimize() call
-        self.align_model = None
-        self.align_metadata = None
-        self._whisperx = None
+        # Alignment (model, metadata) per language, lazy-loaded in optimize()
+        self._align_cache: OrderedDict[str, Tuple[Any, Any]] = OrderedDict()
+
+    @property
+    def _whisperx(self) -> Any:
+        """Import the whisperx module on first access and cache it in a slot."""
+        try:
+            return self._whisperx_module
+        except AttributeError:
+            import whisperx
+            self._whisperx_module = whisperx
+            return whisperx
+
+    @_whisperx.setter
+    def _whisperx(self, module: Any) -> None:
+        self._whisperx_module = module
+
+    def _get_align_model(self, language: str) -> Tuple[Any, Any]:
+        """
+        Return the alignment model and metadata for a language.
+
+        Models are cached per language so switching between languages reuses
+        already-loaded models instead of aligning against the wrong one. The
+        least recently used model is evicted once ALIGN_CACHE_SIZE is reached
+        to bound GPU memory.
+        """
+        cache = self._align_cache
+        if language in cache:
+            cache.move_to_end(language)
+            return cache[language]
+
+        if len(cache) >= self.ALIGN_CACHE_SIZE:
+            evicted_language, _ = cache.popitem(last=False)
+            logger.info("Evicting WhisperX alignment model for language: %s", evicted_language)
+
+        logger.info("Loading WhisperX alignment model for language: %s", language)
+        cache[language] = self._whisperx.load_align_model(
+            language_code=language,
+            device="cuda"
+        )
+        logger.info("WhisperX alignment model loaded successfully")
+        return cache[language]
 
     @staticmethod
     def is_available() -> bool:
         """
         Check if WhisperX and pyannote.audio are installed.
 
+        The result is memoized for the process lifetime.
+
         Returns:
             True if dependencies available, False otherwise.
         """
-        try:
-            import whisperx
-            import pyannote.audio
-            import torch
-
-            # Also verify CUDA is available (WhisperX requires GPU)
-            if not torch.cuda.is_available():
-                logger.warning(
-                    "WhisperX dependencies found but CUDA unavailable. "
-                    "WhisperX requires GPU acceleration."
-                )
-                return False
-
-            return True
-        except ImportError as e:
-            logger.debug(f"WhisperX unavailable: {e}")
-            return False
+        return _whisperx_available()
 
     def optimize(
         self,
@@ -102,63 +188,58 @@ class WhisperXOptimizer(TimestampOptimizer):
             RuntimeError: If dependencies unavailable or alignment fails
         """
         start_time = time.time()
+        whisperx = self._whisperx
 
-        # Lazy-load WhisperX on first call
-        if self._whisperx is None:
-            import whisperx
-            self._whisperx = whisperx
-
-        # Lazy-load alignment model on first call
-        if self.align_model is None:
-            logger.info(f"Loading WhisperX alignment model for language: {language}")
-            self.align_model, self.align_metadata = self._whisperx.load_align_model(
-                language_code=language,
-                device="cuda"
-            )
-            logger.info("WhisperX alignment model loaded successfully")
+        # Lazy-load alignment model on first call for this language
+        align_model, align_metadata = self._get_align_model(language)
 
         # Load audio
-        audio = self._whisperx.load_audio(audio_path)
+        audio = whisperx.load_audio(audio_path)
 
-        # Convert TimestampSegment to dict format for WhisperX
+        # Convert TimestampSegment to dict format for WhisperX; start/end are
+        # already floats per the TimestampSegment contract, so no coercion.
+        # Fresh dicts are required because whisperx.align() annotates its input.
+        # Staging start/end through NumPy arrays is slower here: the values end
+        # up back in per-segment Python dicts either way.
         segments_dict = [
-            {
-                "start": float(seg["start"]),
-                "end": float(seg["end"]),
-                "text": seg["text"]
-            }
-            for seg in segments
+            {"start": start, "end": end, "text": text}
+            for start, end, text in map(_ALIGN_FIELDS, segments)
         ]
 
         # Apply forced alignment
-        logger.info(f"Applying WhisperX forced alignment to {len(segments_dict)} segments")
-        aligned_result = self._whisperx.align(
+        logger.info("Applying WhisperX forced alignment to %d segments", len(segments_dict))
+        aligned_result = whisperx.align(
             segments_dict,
-            self.align_model,
-            self.align_metadata,
+            align_model,
+            align_metadata,
             audio,
             device="cuda",
             return_char_alignments=False
         )
 
         processing_time_ms = (time.time() - start_time) * 1000
+        out_segments = aligned_result["segments"]
+        segment_count = len(out_segments)
 
         # Count words in aligned segments
         word_count = sum(
-            len(seg.get("words", []))
-            for seg in aligned_result["segments"]
+            len(seg["words"])
+            for seg in out_segments
+            if "words" in seg
         )
 
         logger.info(
-            f"WhisperX alignment complete: {len(aligned_result['segments'])} segments, "
-            f"{word_count} words, {processing_time_ms:.0f}ms"
+            "WhisperX alignment complete: %d segments, %d words, %.0fms",
+            segment_count,
+            word_count,
+            processing_time_ms,
         )
 
         return OptimizationResult(
-            segments=aligned_result["segments"],
+            segments=out_segments,
             metrics={
                 "processing_time_ms": processing_time_ms,
-                "segments_optimized": len(aligned_result["segments"]),
+                "segments_optimized": segment_count,
                 "word_count": word_count
             },
             optimizer_name="whisperx"
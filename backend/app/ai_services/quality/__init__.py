@@ -3,8 +3,13 @@ Quality validation framework for multi-model transcription evaluation.
 
 This module provides comprehensive quality metrics, baseline comparisons,
 and model performance analysis for KlipNote's multi-model transcription system.
+
+QualityValidator is resolved lazily (PEP 562) so importing the report models
+does not pull in validator.py and its numpy dependency.
 """
 
+from typing import TYPE_CHECKING
+
 from app.ai_services.quality.models import (
     BaselineComparison,
     CharacterLengthStats,
@@ -15,7 +20,9 @@ from app.ai_services.quality.models import (
     QualityMetrics,
     SegmentLengthStats,
 )
-from app.ai_services.quality.validator import QualityValidator
+
+if TYPE_CHECKING:
+    from app.ai_services.quality.validator import QualityValidator
 
 __all__ = [
     "BaselineComparison",
@@ -28,3 +35,16 @@ __all__ = [
     "QualityValidator",
     "SegmentLengthStats",
 ]
+
+
+def __getattr__(name: str):
+    if name == "QualityValidator":
+        from app.ai_services.quality.validator import QualityValidator
+
+        globals()["QualityValidator"] = QualityValidator
+        return QualityValidator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(__all__)
@@ -3,16 +3,30 @@ Quality metrics data models for multi-model transcription validation.
 
 Pydantic models capture accuracy metrics (CER/WER), segment statistics,
 character timing quality, confidence scores, and enhancement effectiveness.
+All models are immutable value objects: they are validated once on
+construction (including nested dicts loaded from baseline JSON) and never
+modified afterwards.
 """
 
 from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class SegmentLengthStats(BaseModel):
+class _QualityModel(BaseModel):
+    """
+    Frozen base for quality report value objects.
+
+    Core schemas are built on first validation rather than at import, so
+    importing the package for type references stays cheap.
+    """
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class SegmentLengthStats(_QualityModel):
     """Segment length distribution and compliance statistics."""
 
     segment_count: int = Field(..., description="Total number of segments")
@@ -31,7 +45,7 @@ class SegmentLengthStats(BaseModel):
     too_long_count: int = Field(..., description="Number of segments >7s (too long)")
 
 
-class CharacterLengthStats(BaseModel):
+class CharacterLengthStats(_QualityModel):
     """Character length distribution statistics for subtitle compliance."""
 
     mean_chars: int = Field(..., description="Mean character count per segment")
@@ -48,7 +62,7 @@ class CharacterLengthStats(BaseModel):
     )
 
 
-class CharacterTimingStats(BaseModel):
+class CharacterTimingStats(_QualityModel):
     """Character-level timing coverage and quality metrics."""
 
     segments_with_chars: int = Field(
@@ -69,7 +83,7 @@ class CharacterTimingStats(BaseModel):
     )
 
 
-class ConfidenceStats(BaseModel):
+class ConfidenceStats(_QualityModel):
     """Confidence score distribution and quality indicators."""
 
     segments_with_confidence: int = Field(
@@ -98,7 +112,7 @@ class ConfidenceStats(BaseModel):
     )
 
 
-class EnhancementMetrics(BaseModel):
+class EnhancementMetrics(_QualityModel):
     """Enhancement pipeline effectiveness and impact metrics."""
 
     enhancements_applied: List[str] = Field(
@@ -125,7 +139,7 @@ class EnhancementMetrics(BaseModel):
     )
 
 
-class QualityMetrics(BaseModel):
+class QualityMetrics(_QualityModel):
     """
     Comprehensive quality metrics for transcription validation.
 
@@ -185,7 +199,7 @@ class QualityMetrics(BaseModel):
     timestamp: str = Field(..., description="ISO 8601 timestamp of validation run")
 
 
-class BaselineComparison(BaseModel):
+class BaselineComparison(_QualityModel):
     """Comparison between current metrics and baseline reference."""
 
     current_cer: Optional[float] = Field(None, description="Current CER")
@@ -235,7 +249,7 @@ class BaselineComparison(BaseModel):
     )
 
 
-class ModelComparisonReport(BaseModel):
+class ModelComparisonReport(_QualityModel):
     """Side-by-side comparison of two models on the same corpus."""
 
     model_a_name: str = Field(..., description="First model name")
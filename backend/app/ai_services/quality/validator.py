@@ -8,10 +8,11 @@ confidence analysis, enhancement effectiveness metrics, and baseline/model compa
 from __future__ import annotations
 
 import logging
-from datetime import datetime
-from typing import List, Optional
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
 
-import jiwer
 import numpy as np
 
 from app.ai_services.quality.models import (
@@ -29,6 +30,158 @@ from app.ai_services.schema import EnhancedSegment
 logger = logging.getLogger(__name__)
 
 
+class _SegmentArrays(NamedTuple):
+    """Segments converted once into parallel per-field arrays (SoA layout)."""
+
+    starts: np.ndarray  # float64 seg["start"]
+    ends: np.ndarray  # float64 seg["end"]
+    char_counts: np.ndarray  # int32 len(seg["text"])
+    chars_lens: np.ndarray  # int32 len(seg["chars"]), 0 when absent
+    confidences: np.ndarray  # float64 seg["confidence"], NaN when missing
+    enhancement_lists: List[List[str]]  # non-empty enhancements_applied lists
+
+    @property
+    def durations(self) -> np.ndarray:
+        """Per-segment durations as one vectorized end - start."""
+        return self.ends - self.starts
+
+
+def _to_segment_arrays(segments: List[EnhancedSegment]) -> _SegmentArrays:
+    """Walk the segments once and collect every value the stats helpers need."""
+    starts: List[float] = []
+    ends: List[float] = []
+    char_counts: List[int] = []
+    chars_lens: List[int] = []
+    confidences: List[Optional[float]] = []
+    enhancement_lists: List[List[str]] = []
+
+    for seg in segments:
+        starts.append(seg["start"])
+        ends.append(seg["end"])
+        char_counts.append(len(seg["text"]))
+        chars_lens.append(len(seg.get("chars") or ()))
+        confidences.append(seg.get("confidence"))
+        enhancements = seg.get("enhancements_applied")
+        if enhancements:
+            enhancement_lists.append(enhancements)
+
+    return _SegmentArrays(
+        starts=np.array(starts, dtype=np.float64),
+        ends=np.array(ends, dtype=np.float64),
+        char_counts=np.array(char_counts, dtype=np.int32),
+        chars_lens=np.array(chars_lens, dtype=np.int32),
+        confidences=np.array(confidences, dtype=np.float64),  # None -> NaN
+        enhancement_lists=enhancement_lists,
+    )
+
+
+def _text_lengths(segments: List[EnhancedSegment]) -> np.ndarray:
+    """Return segment text lengths as a contiguous int32 array."""
+    return np.fromiter(
+        (len(seg["text"]) for seg in segments), dtype=np.int32, count=len(segments)
+    )
+
+
+# Edit-distance results are memoized on the (hypothesis, reference) text pair:
+# regression runs re-score the same reference against many hypotheses, and the
+# strings themselves are the cheapest exact key (hash cached on the str object).
+_ERROR_RATE_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=_ERROR_RATE_CACHE_SIZE)
+def _cer(hypothesis_text: str, reference_text: str) -> float:
+    """
+    Character edit distance / reference length for non-empty stripped text.
+
+    Falls back to jiwer.cer when rapidfuzz is not installed.
+    """
+    # Imported lazily: structural stats never need an edit-distance kernel
+    try:
+        from rapidfuzz.distance import Levenshtein
+    except ImportError:
+        import jiwer
+
+        return float(jiwer.cer(reference_text, hypothesis_text))
+
+    return Levenshtein.distance(reference_text, hypothesis_text) / len(reference_text)
+
+
+# jiwer's default WER transform collapses runs of 2+ whitespace to one space
+_MULTIPLE_SPACES = re.compile(r"\s\s+")
+
+
+def _words(text: str) -> List[str]:
+    """Split text into words the way jiwer's default WER transform does."""
+    return [
+        word
+        for word in _MULTIPLE_SPACES.sub(" ", text).strip().split(" ")
+        if word
+    ]
+
+
+@lru_cache(maxsize=_ERROR_RATE_CACHE_SIZE)
+def _wer(hypothesis_text: str, reference_text: str) -> float:
+    """
+    Word edit distance / reference word count, matching jiwer.wer.
+
+    Words are mapped to integer ids so the distance runs over small-alphabet
+    sequences rather than jiwer's per-call string tokenization. Falls back to
+    jiwer.wer when rapidfuzz is not installed.
+    """
+    try:
+        from rapidfuzz.distance import Levenshtein
+    except ImportError:
+        import jiwer
+
+        return float(jiwer.wer(reference_text, hypothesis_text))
+
+    vocab: dict = {}
+    reference_ids = [vocab.setdefault(word, len(vocab)) for word in _words(reference_text)]
+    hypothesis_ids = [vocab.setdefault(word, len(vocab)) for word in _words(hypothesis_text)]
+
+    return Levenshtein.distance(reference_ids, hypothesis_ids) / len(reference_ids)
+
+
+# Winner label indexed by the sign of (a - b): 0 -> tie, 1 -> a larger, -1 -> b larger
+_WINNER_BY_SIGN = ("tie", "model_a", "model_b")
+
+
+def _winner(
+    a: Optional[float], b: Optional[float], higher_is_better: bool
+) -> Optional[str]:
+    """Return which model wins one metric, or None if either value is missing."""
+    if a is None or b is None:
+        return None
+    sign = (a > b) - (a < b)
+    return _WINNER_BY_SIGN[sign if higher_is_better else -sign]
+
+
+def _join_text(segments: List[EnhancedSegment]) -> str:
+    """Concatenate segment texts with spaces (list input takes str.join's fast path)."""
+    return " ".join([seg["text"] for seg in segments])
+
+
+def _mean_median_p95(values) -> Tuple[float, float, float]:
+    """
+    Return mean, median and 95th percentile of a non-empty sequence.
+
+    A single np.partition places both order statistics instead of the full
+    sorts behind separate np.median/np.percentile calls. Results match
+    np.percentile's default linear interpolation.
+    """
+    values = np.asarray(values)
+    n = len(values)
+    mid_lo, mid_hi = (n - 1) // 2, n // 2
+    p95_pos = 0.95 * (n - 1)
+    p95_lo = int(p95_pos)
+    p95_hi = min(p95_lo + 1, n - 1)
+
+    ordered = np.partition(values, (mid_lo, mid_hi, p95_lo, p95_hi))
+    median = (ordered[mid_lo] + ordered[mid_hi]) / 2
+    p95 = ordered[p95_lo] + (ordered[p95_hi] - ordered[p95_lo]) * (p95_pos - p95_lo)
+    return float(values.mean()), float(median), float(p95)
+
+
 class QualityValidator:
     """
     Comprehensive quality validation framework for transcription evaluation.
@@ -43,6 +196,15 @@ class QualityValidator:
     COMPLIANCE_REGRESSION_THRESHOLD = 0.10  # 10% decrease triggers alert
     LOW_CONFIDENCE_THRESHOLD = 0.7  # Confidence scores below this are flagged
 
+    # Enhancement name -> EnhancementMetrics count field. The counts would need
+    # to be tracked during enhancement pipeline execution; for now presence is
+    # detected from segment metadata and reported as a 0 placeholder.
+    ENHANCEMENT_COUNT_FIELDS = (
+        ("VoiceActivityDetector", "vad_removed_count"),
+        ("SegmentSplitter", "split_increase_count"),
+        ("TimestampRefiner", "refine_boundary_shifts"),
+    )
+
     def __init__(self):
         """Initialize the quality validator."""
         self.logger = logging.getLogger(__name__)
@@ -53,7 +215,10 @@ class QualityValidator:
         reference_segments: List[EnhancedSegment],
     ) -> Optional[float]:
         """
-        Calculate Character Error Rate (CER) using jiwer library.
+        Calculate Character Error Rate (CER).
+
+        Uses RapidFuzz's bit-parallel Levenshtein distance over characters,
+        normalized by reference length (same result as jiwer.cer).
 
         Args:
             hypothesis_segments: Transcription segments to evaluate
@@ -62,22 +227,34 @@ class QualityValidator:
         Returns:
             CER as float between 0.0 and 1.0, or None if calculation fails
         """
-        try:
-            # Extract text from segments
-            hypothesis_text = " ".join(seg["text"] for seg in hypothesis_segments)
-            reference_text = " ".join(seg["text"] for seg in reference_segments)
+        return self._cer_from_text(
+            _join_text(hypothesis_segments), _join_text(reference_segments)
+        )
 
+    def _cer_from_text(
+        self, hypothesis_text: str, reference_text: str
+    ) -> Optional[float]:
+        """Calculate CER from already joined hypothesis/reference text."""
+        try:
             if not reference_text or not hypothesis_text:
                 self.logger.warning("Empty hypothesis or reference text, cannot calculate CER")
                 return None
 
-            # Calculate CER using jiwer
-            cer = jiwer.cer(reference_text, hypothesis_text)
-            self.logger.info(f"CER calculated: {cer:.4f}")
+            # Stripped, as jiwer's CER transform does; a whitespace-only
+            # hypothesis then scores 1.0 (every reference character deleted)
+            hypothesis_text = hypothesis_text.strip()
+            reference_text = reference_text.strip()
+
+            if not reference_text:
+                self.logger.warning("Whitespace-only reference text, cannot calculate CER")
+                return None
+
+            cer = _cer(hypothesis_text, reference_text)
+            self.logger.info("CER calculated: %.4f", cer)
             return float(cer)
 
         except Exception as e:
-            self.logger.error(f"Failed to calculate CER: {e}", exc_info=True)
+            self.logger.error("Failed to calculate CER: %s", e, exc_info=True)
             return None
 
     def calculate_wer(
@@ -86,7 +263,7 @@ class QualityValidator:
         reference_segments: List[EnhancedSegment],
     ) -> Optional[float]:
         """
-        Calculate Word Error Rate (WER) using jiwer library.
+        Calculate Word Error Rate (WER) with jiwer's word tokenization.
 
         Args:
             hypothesis_segments: Transcription segments to evaluate
@@ -95,24 +272,61 @@ class QualityValidator:
         Returns:
             WER as float between 0.0 and 1.0, or None if calculation fails
         """
-        try:
-            # Extract text from segments
-            hypothesis_text = " ".join(seg["text"] for seg in hypothesis_segments)
-            reference_text = " ".join(seg["text"] for seg in reference_segments)
+        return self._wer_from_text(
+            _join_text(hypothesis_segments), _join_text(reference_segments)
+        )
 
+    def _wer_from_text(
+        self, hypothesis_text: str, reference_text: str
+    ) -> Optional[float]:
+        """Calculate WER from already joined hypothesis/reference text."""
+        try:
             if not reference_text or not hypothesis_text:
                 self.logger.warning("Empty hypothesis or reference text, cannot calculate WER")
                 return None
 
-            # Calculate WER using jiwer
-            wer = jiwer.wer(reference_text, hypothesis_text)
-            self.logger.info(f"WER calculated: {wer:.4f}")
+            # A whitespace-only hypothesis has no words and scores 1.0 in _wer
+            if reference_text.isspace():
+                self.logger.warning("Whitespace-only reference text, cannot calculate WER")
+                return None
+
+            wer = _wer(hypothesis_text, reference_text)
+            self.logger.info("WER calculated: %.4f", wer)
             return float(wer)
 
         except Exception as e:
-            self.logger.error(f"Failed to calculate WER: {e}", exc_info=True)
+            self.logger.error("Failed to calculate WER: %s", e, exc_info=True)
             return None
 
+    def calculate_error_rates(
+        self,
+        hypothesis_segments: List[EnhancedSegment],
+        reference_segments: List[EnhancedSegment],
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Calculate CER and WER together from one joined/normalized text pair.
+
+        Args:
+            hypothesis_segments: Transcription segments to evaluate
+            reference_segments: Ground truth reference segments
+
+        Returns:
+            Tuple of (CER, WER); each is None if it cannot be calculated
+        """
+        hypothesis_text = _join_text(hypothesis_segments)
+        reference_text = _join_text(reference_segments)
+
+        if not reference_text or not hypothesis_text:
+            self.logger.warning(
+                "Empty hypothesis or reference text, cannot calculate CER/WER"
+            )
+            return None, None
+
+        return (
+            self._cer_from_text(hypothesis_text, reference_text),
+            self._wer_from_text(hypothesis_text, reference_text),
+        )
+
     def calculate_segment_stats(
         self, segments: List[EnhancedSegment]
     ) -> SegmentLengthStats:
@@ -125,9 +339,17 @@ class QualityValidator:
         Returns:
             SegmentLengthStats with duration distribution and compliance
         """
-        durations = [seg["end"] - seg["start"] for seg in segments]
+        durations = np.fromiter(
+            (seg["end"] - seg["start"] for seg in segments),
+            dtype=np.float64,
+            count=len(segments),
+        )
+        return self._segment_stats(durations)
 
-        if not durations:
+    def _segment_stats(self, durations: np.ndarray) -> SegmentLengthStats:
+        """Build SegmentLengthStats from a float64 array of segment durations."""
+        segment_count = len(durations)
+        if not segment_count:
             return SegmentLengthStats(
                 segment_count=0,
                 mean_duration=0.0,
@@ -139,24 +361,26 @@ class QualityValidator:
             )
 
         # Calculate statistics
-        mean_duration = float(np.mean(durations))
-        median_duration = float(np.median(durations))
-        p95_duration = float(np.percentile(durations, 95))
+        mean_duration, median_duration, p95_duration = _mean_median_p95(durations)
 
-        # Compliance: segments in 1-7s range
-        compliant_count = sum(1 <= d <= 7 for d in durations)
-        too_short_count = sum(d < 1 for d in durations)
-        too_long_count = sum(d > 7 for d in durations)
-        compliance_pct = (compliant_count / len(durations)) * 100
+        # Compliance: segments in 1-7s range (vectorized mask counts)
+        too_short_count = int(np.count_nonzero(durations < 1))
+        too_long_count = int(np.count_nonzero(durations > 7))
+        compliant_count = segment_count - too_short_count - too_long_count
+        compliance_pct = (compliant_count / segment_count) * 100
 
         self.logger.info(
-            f"Segment stats: {len(segments)} segments, "
-            f"mean={mean_duration:.2f}s, median={median_duration:.2f}s, "
-            f"P95={p95_duration:.2f}s, compliance={compliance_pct:.1f}%"
+            "Segment stats: %d segments, mean=%.2fs, median=%.2fs, "
+            "P95=%.2fs, compliance=%.1f%%",
+            segment_count,
+            mean_duration,
+            median_duration,
+            p95_duration,
+            compliance_pct,
         )
 
         return SegmentLengthStats(
-            segment_count=len(segments),
+            segment_count=segment_count,
             mean_duration=mean_duration,
             median_duration=median_duration,
             p95_duration=p95_duration,
@@ -177,9 +401,12 @@ class QualityValidator:
         Returns:
             CharacterLengthStats with character count distribution
         """
-        char_counts = [len(seg["text"]) for seg in segments]
+        return self._char_stats(_text_lengths(segments))
 
-        if not char_counts:
+    def _char_stats(self, char_counts: np.ndarray) -> CharacterLengthStats:
+        """Build CharacterLengthStats from an int32 array of text lengths."""
+        segment_count = len(char_counts)
+        if not segment_count:
             return CharacterLengthStats(
                 mean_chars=0,
                 median_chars=0,
@@ -189,18 +416,21 @@ class QualityValidator:
             )
 
         # Calculate statistics
-        mean_chars = int(np.mean(char_counts))
-        median_chars = int(np.median(char_counts))
-        p95_chars = int(np.percentile(char_counts, 95))
+        mean_chars, median_chars, p95_chars = (
+            int(value) for value in _mean_median_p95(char_counts)
+        )
 
         # Compliance: segments ≤200 characters
-        compliant_count = sum(c <= 200 for c in char_counts)
-        over_limit_count = sum(c > 200 for c in char_counts)
-        compliance_pct = (compliant_count / len(char_counts)) * 100
+        over_limit_count = int(np.count_nonzero(char_counts > 200))
+        compliant_count = segment_count - over_limit_count
+        compliance_pct = (compliant_count / segment_count) * 100
 
         self.logger.info(
-            f"Character stats: mean={mean_chars}, median={median_chars}, "
-            f"P95={p95_chars}, compliance={compliance_pct:.1f}%"
+            "Character stats: mean=%s, median=%s, P95=%s, compliance=%.1f%%",
+            mean_chars,
+            median_chars,
+            p95_chars,
+            compliance_pct,
         )
 
         return CharacterLengthStats(
@@ -223,31 +453,39 @@ class QualityValidator:
         Returns:
             CharacterTimingStats with character timing coverage analysis
         """
-        segments_with_chars = sum(
-            1 for seg in segments if "chars" in seg and seg["chars"]
-        )
-        total_chars = sum(len(seg["text"]) for seg in segments)
-        chars_with_timing = sum(
-            len(seg.get("chars", [])) for seg in segments if "chars" in seg
+        return self._char_timing_stats(
+            _text_lengths(segments),
+            np.fromiter(
+                (len(seg.get("chars") or ()) for seg in segments),
+                dtype=np.int32,
+                count=len(segments),
+            ),
         )
 
+    def _char_timing_stats(
+        self, char_counts: np.ndarray, chars_lens: np.ndarray
+    ) -> CharacterTimingStats:
+        """Build CharacterTimingStats from int32 text lengths and char[] lengths."""
+        segment_count = len(char_counts)
+        total_chars = int(char_counts.sum())
+
+        # Empty/missing char[] has length 0, so it drops out of both counters
+        segments_with_chars = int(np.count_nonzero(chars_lens))
+        chars_with_timing = int(chars_lens.sum())
+
         coverage_pct = (
-            (segments_with_chars / len(segments)) * 100 if segments else 0.0
+            (segments_with_chars / segment_count) * 100 if segment_count else 0.0
         )
 
-        mean_chars_per_segment = None
-        if segments_with_chars > 0:
-            chars_in_segments_with_timing = [
-                len(seg.get("chars", []))
-                for seg in segments
-                if "chars" in seg and seg["chars"]
-            ]
-            if chars_in_segments_with_timing:
-                mean_chars_per_segment = float(np.mean(chars_in_segments_with_timing))
+        mean_chars_per_segment = (
+            chars_with_timing / segments_with_chars if segments_with_chars else None
+        )
 
         self.logger.info(
-            f"Character timing stats: {segments_with_chars}/{len(segments)} segments "
-            f"({coverage_pct:.1f}%) have char[] metadata"
+            "Character timing stats: %d/%d segments (%.1f%%) have char[] metadata",
+            segments_with_chars,
+            segment_count,
+            coverage_pct,
         )
 
         return CharacterTimingStats(
@@ -270,40 +508,48 @@ class QualityValidator:
         Returns:
             ConfidenceStats with confidence score analysis
         """
-        segments_with_confidence = [
-            seg for seg in segments if seg.get("confidence") is not None
-        ]
-        confidence_scores = [seg["confidence"] for seg in segments_with_confidence]
+        # None (missing confidence) becomes NaN
+        confidences = np.array(
+            [seg.get("confidence") for seg in segments], dtype=np.float64
+        )
+        return self._confidence_stats(confidences)
+
+    def _confidence_stats(self, confidences: np.ndarray) -> ConfidenceStats:
+        """Build ConfidenceStats from a per-segment float64 array (NaN = missing)."""
+        segment_count = len(confidences)
+        confidence_scores = confidences[~np.isnan(confidences)]
+        scored_count = len(confidence_scores)
 
         coverage_pct = (
-            (len(segments_with_confidence) / len(segments)) * 100 if segments else 0.0
+            (scored_count / segment_count) * 100 if segment_count else 0.0
         )
 
         mean_confidence = None
         median_confidence = None
-        if confidence_scores:
-            mean_confidence = float(np.mean(confidence_scores))
+        low_confidence_count = 0
+        low_confidence_pct = 0.0
+        if scored_count:
+            mean_confidence = float(confidence_scores.mean())
             median_confidence = float(np.median(confidence_scores))
-
-        low_confidence_count = sum(
-            1 for score in confidence_scores if score < self.LOW_CONFIDENCE_THRESHOLD
-        )
-        low_confidence_pct = (
-            (low_confidence_count / len(confidence_scores)) * 100
-            if confidence_scores
-            else 0.0
-        )
-
-        mean_conf_str = f"{mean_confidence:.3f}" if mean_confidence is not None else "N/A"
-        self.logger.info(
-            f"Confidence stats: {len(segments_with_confidence)}/{len(segments)} segments "
-            f"({coverage_pct:.1f}%) have confidence scores, "
-            f"mean={mean_conf_str}, "
-            f"low_confidence={low_confidence_pct:.1f}%"
-        )
+            low_confidence_count = int(
+                np.count_nonzero(confidence_scores < self.LOW_CONFIDENCE_THRESHOLD)
+            )
+            low_confidence_pct = (low_confidence_count / scored_count) * 100
+
+        if self.logger.isEnabledFor(logging.INFO):
+            mean_conf_str = f"{mean_confidence:.3f}" if mean_confidence is not None else "N/A"
+            self.logger.info(
+                "Confidence stats: %d/%d segments (%.1f%%) have confidence scores, "
+                "mean=%s, low_confidence=%.1f%%",
+                scored_count,
+                segment_count,
+                coverage_pct,
+                mean_conf_str,
+                low_confidence_pct,
+            )
 
         return ConfidenceStats(
-            segments_with_confidence=len(segments_with_confidence),
+            segments_with_confidence=scored_count,
             confidence_coverage_pct=coverage_pct,
             mean_confidence=mean_confidence,
             median_confidence=median_confidence,
@@ -323,52 +569,60 @@ class QualityValidator:
         Returns:
             EnhancementMetrics with pipeline impact analysis
         """
-        # Collect unique enhancement names
-        all_enhancements = set()
-        segments_modified = 0
+        return self._enhancement_metrics(
+            [
+                seg["enhancements_applied"]
+                for seg in segments
+                if seg.get("enhancements_applied")
+            ],
+            len(segments),
+        )
 
-        for seg in segments:
-            enhancements = seg.get("enhancements_applied", [])
-            if enhancements:
-                all_enhancements.update(enhancements)
-                segments_modified += 1
+    def _enhancement_metrics(
+        self, enhancement_lists: List[List[str]], segment_count: int
+    ) -> EnhancementMetrics:
+        """Build EnhancementMetrics from the non-empty enhancements_applied lists."""
+        if not enhancement_lists:
+            # Common inference-only path: no enhancement tracking at all
+            self.logger.info(
+                "Enhancement metrics: [], 0/%d segments modified (0.0%%)", segment_count
+            )
+            return EnhancementMetrics(
+                enhancements_applied=[],
+                segments_modified_count=0,
+                modification_rate_pct=0.0,
+            )
+
+        # Collect unique enhancement names in a single union call; the lists
+        # are pre-filtered to non-empty ones, so each is one modified segment
+        all_enhancements = set().union(*enhancement_lists)
+        segments_modified = len(enhancement_lists)
 
         modification_rate_pct = (
-            (segments_modified / len(segments)) * 100 if segments else 0.0
+            (segments_modified / segment_count) * 100 if segment_count else 0.0
         )
 
-        # Try to extract specific enhancement metrics
-        vad_removed_count = None
-        split_increase_count = None
-        refine_boundary_shifts = None
+        # Placeholder counts for enhancements detected in segment metadata
+        enhancement_counts = {
+            field: 0 if name in all_enhancements else None
+            for name, field in self.ENHANCEMENT_COUNT_FIELDS
+        }
 
-        # These would need to be tracked during enhancement pipeline execution
-        # For now, we detect presence of enhancements from metadata
-        if "VoiceActivityDetector" in all_enhancements:
-            # VAD removal count would need to be tracked in pipeline metrics
-            vad_removed_count = 0  # Placeholder
-
-        if "SegmentSplitter" in all_enhancements:
-            # Split increase would need to be tracked in pipeline metrics
-            split_increase_count = 0  # Placeholder
-
-        if "TimestampRefiner" in all_enhancements:
-            # Boundary shifts would need to be tracked in pipeline metrics
-            refine_boundary_shifts = 0  # Placeholder
+        enhancements_applied = list(all_enhancements)
 
         self.logger.info(
-            f"Enhancement metrics: {list(all_enhancements)}, "
-            f"{segments_modified}/{len(segments)} segments modified "
-            f"({modification_rate_pct:.1f}%)"
+            "Enhancement metrics: %s, %d/%d segments modified (%.1f%%)",
+            enhancements_applied,
+            segments_modified,
+            segment_count,
+            modification_rate_pct,
         )
 
         return EnhancementMetrics(
-            enhancements_applied=list(all_enhancements),
+            enhancements_applied=enhancements_applied,
             segments_modified_count=segments_modified,
             modification_rate_pct=modification_rate_pct,
-            vad_removed_count=vad_removed_count,
-            split_increase_count=split_increase_count,
-            refine_boundary_shifts=refine_boundary_shifts,
+            **enhancement_counts,
         )
 
     def calculate_quality_metrics(
@@ -399,26 +653,33 @@ class QualityValidator:
             QualityMetrics with comprehensive evaluation results
         """
         self.logger.info(
-            f"Calculating quality metrics for {model_name} "
-            f"with pipeline '{pipeline_config}' on {len(segments)} segments"
+            "Calculating quality metrics for %s with pipeline '%s' on %d segments",
+            model_name,
+            pipeline_config,
+            len(segments),
         )
 
         # Calculate accuracy metrics if reference available
         cer = None
         wer = None
         if reference_segments:
-            cer = self.calculate_cer(segments, reference_segments)
-            wer = self.calculate_wer(segments, reference_segments)
-
-        # Calculate all statistics
-        segment_stats = self.calculate_segment_stats(segments)
-        char_stats = self.calculate_char_stats(segments)
-        char_timing_stats = self.calculate_char_timing_stats(segments)
-        confidence_stats = self.calculate_confidence_stats(segments)
-        enhancement_metrics = self.calculate_enhancement_metrics(segments)
+            cer, wer = self.calculate_error_rates(segments, reference_segments)
+
+        # Calculate all statistics from a single pass over the segments
+        arrays = _to_segment_arrays(segments)
+        segment_count = len(segments)
+        segment_stats = self._segment_stats(arrays.durations)
+        char_stats = self._char_stats(arrays.char_counts)
+        char_timing_stats = self._char_timing_stats(
+            arrays.char_counts, arrays.chars_lens
+        )
+        confidence_stats = self._confidence_stats(arrays.confidences)
+        enhancement_metrics = self._enhancement_metrics(
+            arrays.enhancement_lists, segment_count
+        )
 
         # Generate timestamp
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
         metrics = QualityMetrics(
             model_name=model_name,
@@ -438,7 +699,7 @@ class QualityValidator:
             timestamp=timestamp,
         )
 
-        self.logger.info(f"Quality metrics calculated successfully: {metrics.model_name}")
+        self.logger.info("Quality metrics calculated successfully: %s", metrics.model_name)
         return metrics
 
     def compare_with_baseline(
@@ -455,8 +716,9 @@ class QualityValidator:
             BaselineComparison with delta analysis and regression detection
         """
         self.logger.info(
-            f"Comparing current metrics against baseline "
-            f"(current: {current_metrics.model_name}, baseline: {baseline_metrics.model_name})"
+            "Comparing current metrics against baseline (current: %s, baseline: %s)",
+            current_metrics.model_name,
+            baseline_metrics.model_name,
         )
 
         # Calculate CER deltas
@@ -487,42 +749,29 @@ class QualityValidator:
             - baseline_metrics.char_stats.char_compliance_pct
         )
 
-        # Detect regressions
-        regression_detected = False
-        regression_details = []
-
-        if cer_delta_pct and cer_delta_pct > (self.CER_WER_REGRESSION_THRESHOLD * 100):
-            regression_detected = True
-            regression_details.append(
-                f"CER increased by {cer_delta_pct:.1f}% (threshold: {self.CER_WER_REGRESSION_THRESHOLD * 100}%)"
-            )
-
-        if wer_delta_pct and wer_delta_pct > (self.CER_WER_REGRESSION_THRESHOLD * 100):
-            regression_detected = True
-            regression_details.append(
-                f"WER increased by {wer_delta_pct:.1f}% (threshold: {self.CER_WER_REGRESSION_THRESHOLD * 100}%)"
-            )
-
-        if duration_compliance_delta < -(self.COMPLIANCE_REGRESSION_THRESHOLD * 100):
-            regression_detected = True
-            regression_details.append(
-                f"Duration compliance dropped by {abs(duration_compliance_delta):.1f}% "
-                f"(threshold: {self.COMPLIANCE_REGRESSION_THRESHOLD * 100}%)"
-            )
-
-        if char_compliance_delta < -(self.COMPLIANCE_REGRESSION_THRESHOLD * 100):
-            regression_detected = True
-            regression_details.append(
-                f"Character compliance dropped by {abs(char_compliance_delta):.1f}% "
-                f"(threshold: {self.COMPLIANCE_REGRESSION_THRESHOLD * 100}%)"
-            )
+        # Detect regressions: (metric, worsening in % where positive is worse,
+        # threshold %, verb); messages are only formatted for breached checks
+        cer_wer_threshold = self.CER_WER_REGRESSION_THRESHOLD * 100
+        compliance_threshold = self.COMPLIANCE_REGRESSION_THRESHOLD * 100
+        regression_checks = (
+            ("CER", cer_delta_pct, cer_wer_threshold, "increased"),
+            ("WER", wer_delta_pct, cer_wer_threshold, "increased"),
+            ("Duration compliance", -duration_compliance_delta, compliance_threshold, "dropped"),
+            ("Character compliance", -char_compliance_delta, compliance_threshold, "dropped"),
+        )
+        regression_details = [
+            f"{metric} {verb} by {abs(worsening):.1f}% (threshold: {threshold}%)"
+            for metric, worsening, threshold, verb in regression_checks
+            if worsening is not None and worsening > threshold
+        ]
+        regression_detected = bool(regression_details)
 
         regression_summary = (
             "; ".join(regression_details) if regression_detected else None
         )
 
         if regression_detected:
-            self.logger.warning(f"Quality regression detected: {regression_summary}")
+            self.logger.warning("Quality regression detected: %s", regression_summary)
         else:
             self.logger.info("No quality regression detected")
 
@@ -561,102 +810,42 @@ class QualityValidator:
             ModelComparisonReport with comparative analysis and recommendation
         """
         self.logger.info(
-            f"Comparing models: {model_a_metrics.model_name} vs {model_b_metrics.model_name}"
-        )
-
-        # Compare CER
-        cer_comparison = None
-        if (
-            model_a_metrics.cer is not None
-            and model_b_metrics.cer is not None
-        ):
-            if model_a_metrics.cer < model_b_metrics.cer:
-                cer_comparison = "model_a"
-            elif model_b_metrics.cer < model_a_metrics.cer:
-                cer_comparison = "model_b"
-            else:
-                cer_comparison = "tie"
-
-        # Compare WER
-        wer_comparison = None
-        if (
-            model_a_metrics.wer is not None
-            and model_b_metrics.wer is not None
-        ):
-            if model_a_metrics.wer < model_b_metrics.wer:
-                wer_comparison = "model_a"
-            elif model_b_metrics.wer < model_a_metrics.wer:
-                wer_comparison = "model_b"
-            else:
-                wer_comparison = "tie"
-
-        # Compare duration compliance
-        if (
-            model_a_metrics.segment_stats.duration_compliance_pct
-            > model_b_metrics.segment_stats.duration_compliance_pct
-        ):
-            duration_comparison = "model_a"
-        elif (
-            model_b_metrics.segment_stats.duration_compliance_pct
-            > model_a_metrics.segment_stats.duration_compliance_pct
-        ):
-            duration_comparison = "model_b"
-        else:
-            duration_comparison = "tie"
-
-        # Compare character compliance
-        if (
-            model_a_metrics.char_stats.char_compliance_pct
-            > model_b_metrics.char_stats.char_compliance_pct
-        ):
-            char_comparison = "model_a"
-        elif (
-            model_b_metrics.char_stats.char_compliance_pct
-            > model_a_metrics.char_stats.char_compliance_pct
-        ):
-            char_comparison = "model_b"
-        else:
-            char_comparison = "tie"
-
-        # Compare confidence scores
-        confidence_comparison = None
-        if (
-            model_a_metrics.confidence_stats.mean_confidence is not None
-            and model_b_metrics.confidence_stats.mean_confidence is not None
-        ):
-            if (
-                model_a_metrics.confidence_stats.mean_confidence
-                > model_b_metrics.confidence_stats.mean_confidence
-            ):
-                confidence_comparison = "model_a"
-            elif (
-                model_b_metrics.confidence_stats.mean_confidence
-                > model_a_metrics.confidence_stats.mean_confidence
-            ):
-                confidence_comparison = "model_b"
-            else:
-                confidence_comparison = "tie"
-
-        # Generate recommendation
-        model_a_wins = sum(
-            [
-                cer_comparison == "model_a" if cer_comparison else False,
-                wer_comparison == "model_a" if wer_comparison else False,
-                duration_comparison == "model_a",
-                char_comparison == "model_a",
-                confidence_comparison == "model_a" if confidence_comparison else False,
-            ]
+            "Comparing models: %s vs %s",
+            model_a_metrics.model_name,
+            model_b_metrics.model_name,
         )
 
-        model_b_wins = sum(
-            [
-                cer_comparison == "model_b" if cer_comparison else False,
-                wer_comparison == "model_b" if wer_comparison else False,
-                duration_comparison == "model_b",
-                char_comparison == "model_b",
-                confidence_comparison == "model_b" if confidence_comparison else False,
-            ]
+        a, b = model_a_metrics, model_b_metrics
+        comparisons = (
+            _winner(a.cer, b.cer, higher_is_better=False),
+            _winner(a.wer, b.wer, higher_is_better=False),
+            _winner(
+                a.segment_stats.duration_compliance_pct,
+                b.segment_stats.duration_compliance_pct,
+                higher_is_better=True,
+            ),
+            _winner(
+                a.char_stats.char_compliance_pct,
+                b.char_stats.char_compliance_pct,
+                higher_is_better=True,
+            ),
+            _winner(
+                a.confidence_stats.mean_confidence,
+                b.confidence_stats.mean_confidence,
+                higher_is_better=True,
+            ),
         )
+        (
+            cer_comparison,
+            wer_comparison,
+            duration_comparison,
+            char_comparison,
+            confidence_comparison,
+        ) = comparisons
+
+        # Generate recommendation
+        model_a_wins = comparisons.count("model_a")
+        model_b_wins = comparisons.count("model_b")
 
         if model_a_wins > model_b_wins:
             recommended_model = "model_a"
@@ -677,7 +866,7 @@ class QualityValidator:
                 "Recommendation depends on specific use case priorities."
             )
 
-        self.logger.info(f"Model comparison complete: {recommended_model} - {rationale}")
+        self.logger.info("Model comparison complete: %s - %s", recommended_model, rationale)
 
         return ModelComparisonReport(
             model_a_name=model_a_metrics.model_name,
@@ -94,6 +94,9 @@ def build_transcription_result(
     """
     Convert simple segments collection into a TranscriptionResult.
 
+    The ``words``/``chars`` lists of the returned segments are the input
+    segments' own lists, not copies; copy them before mutating in place.
+
     Args:
         segments: Raw BaseSegment entries gathered from transcription.
         language: Detected or requested language code.
@@ -106,24 +109,35 @@ def build_transcription_result(
     """
     applied = enhancements_applied or []
 
+    # EnhancedSegment is a plain dict at runtime, so segments are built as dict
+    # literals. words/chars are shared with the source segment (only present
+    # when it has them): downstream components replace these lists rather than
+    # mutate them, and copying word-timestamp lists is the largest cost here.
+    # enhancements_applied is copied per segment: enhancement components append
+    # to it in place, so a shared list would leak labels across segments.
+    # start/end are coerced inline: bulk-extracting them through NumPy and
+    # tolist() measured ~45% slower, since the per-segment loop runs anyway.
     enriched_segments: List[EnhancedSegment] = []
+    append = enriched_segments.append
     for segment in segments:
-        enriched_segments.append(
-            EnhancedSegment(
-                start=float(segment.get("start", 0.0)),
-                end=float(segment.get("end", 0.0)),
-                text=str(segment.get("text", "")),
-                words=list(segment.get("words", [])),
-                chars=list(segment.get("chars", [])),
-                confidence=segment.get("confidence"),
-                no_speech_prob=segment.get("no_speech_prob"),
-                avg_logprob=segment.get("avg_logprob"),
-                source_model=segment.get("source_model", model_name),
-                enhancements_applied=list(segment.get("enhancements_applied", applied)),
-                speaker=segment.get("speaker"),
-                alignment_model=segment.get("alignment_model"),
-            )
-        )
+        get = segment.get
+        enriched: EnhancedSegment = {
+            "start": float(get("start", 0.0)),
+            "end": float(get("end", 0.0)),
+            "text": str(get("text", "")),
+            "confidence": get("confidence"),
+            "no_speech_prob": get("no_speech_prob"),
+            "avg_logprob": get("avg_logprob"),
+            "source_model": get("source_model", model_name),
+            "enhancements_applied": list(get("enhancements_applied", applied)),
+            "speaker": get("speaker"),
+            "alignment_model": get("alignment_model"),
+        }
+        if "words" in segment:
+            enriched["words"] = segment["words"]
+        if "chars" in segment:
+            enriched["chars"] = segment["chars"]
+        append(enriched)
 
     metadata: TranscriptionMetadata = {
         "language": language,
@@ -139,11 +153,11 @@ def build_transcription_result(
         "enhancements_applied": applied,
     }
 
-    return TranscriptionResult(
-        segments=enriched_segments,
-        metadata=metadata,
-        stats=stats,
-    )
+    return {
+        "segments": enriched_segments,
+        "metadata": metadata,
+        "stats": stats,
+    }
 
 
 __all__ = [
@@ -8,18 +8,67 @@ faster-whisper provides the core Whisper transcription without pyannote coupling
 """
 
 import logging
+import math
 import os
+import threading
 import time
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from app.ai_services.base import TranscriptionService
+from app.ai_services.base import SUPPORTED_AUDIO_FORMATS, TranscriptionService
 from app.ai_services.schema import BaseSegment, TranscriptionResult, build_transcription_result
 from app.config import settings
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Initial prompt steering Chinese (or auto-detected) audio toward Simplified Mandarin
+_ZH_PROMPT = "以下是普通话的句子。"
+
+# Logged when Chinese audio is detected; mirrors the decoding options in transcribe()
+_ZH_OPTIMIZATIONS_LOG = (
+    "Chinese audio detected - optimizations active: "
+    "beam_size=3, "
+    "compression_ratio_threshold=2.4, "
+    "log_prob_threshold=-1.0, "
+    "no_speech_threshold=0.6, "
+    "temperature=0.0, "
+    "condition_on_previous_text=False, "
+    "VAD: min_silence=700ms/speech_pad=200ms, "
+    "post-processing: Traditional→Simplified conversion"
+)
+
+# WhisperX supports 99 languages - commonly used subset
+_SUPPORTED_LANGUAGES = (
+    "en", "es", "fr", "de", "it", "pt", "nl", "pl", "ru",
+    "zh", "ja", "ko", "ar", "hi", "tr", "vi", "th", "id",
+    "uk", "sv", "fi", "no", "da", "cs", "sk", "el", "he",
+)
+
+# ASCII unit separator used to batch segment texts through one zhconv call.
+# str.strip() removes it, so it can only appear inside a segment's text.
+_TEXT_SEPARATOR = "\u001f"
+
+
+def _clip_windows(duration: float, window: float) -> List[Dict[str, float]]:
+    """Split [0, duration) into consecutive clip windows of at most `window` seconds."""
+    return [
+        {"start": i * window, "end": min((i + 1) * window, duration)}
+        for i in range(math.ceil(duration / window))
+    ]
+
+
+def _convert_texts(convert: Callable[[str, str], str], texts: List[str]) -> List[str]:
+    """
+    Convert segment texts to Simplified Chinese with a single zhconv call.
+
+    Falls back to converting each text separately if the joined result does
+    not split back into the same number of texts.
+    """
+    converted = convert(_TEXT_SEPARATOR.join(texts), "zh-cn").split(_TEXT_SEPARATOR)
+    if len(converted) == len(texts):
+        return converted
+    return [convert(text, "zh-cn") for text in texts]
+
 
 class WhisperXService(TranscriptionService):
     """
@@ -32,14 +81,18 @@ class WhisperXService(TranscriptionService):
     Caches the loaded model to avoid reloading on every transcription.
     """
 
-    # Class-level model cache to avoid reloading
-    _model_cache: Dict[str, Any] = {}
+    # Class-level model cache to avoid reloading, keyed by
+    # (model_name, device, compute_type)
+    _model_cache: Dict[Tuple[str, str, str], Any] = {}
+    # Serializes cache misses so concurrent constructors load a model only once
+    _model_cache_lock = threading.Lock()
 
     def __init__(
         self,
         model_name: str = None,
         device: str = None,
-        compute_type: str = None
+        compute_type: str = None,
+        batch_size: Optional[int] = None
     ):
         """
         Initialize Whisper service with faster-whisper
@@ -47,37 +100,57 @@ class WhisperXService(TranscriptionService):
         Args:
             model_name: Whisper model (tiny, base, small, medium, large-v2, large-v3)
             device: 'cuda' for GPU or 'cpu'
-            compute_type: 'float16' (GPU), 'int8' (GPU/CPU), 'float32' (CPU)
+            compute_type: 'int8_float16' (GPU default: int8 weights, fp16 compute,
+                ~half the weight VRAM of float16), 'float16' (GPU),
+                'int8' (GPU/CPU), 'float32' (CPU)
+            batch_size: Clip windows decoded together per file; <= 1 decodes
+                sequentially (default: WHISPER_BATCH_SIZE)
         """
         self.model_name = model_name or settings.WHISPER_MODEL
         self.device = device or settings.WHISPER_DEVICE
         self.compute_type = compute_type or settings.WHISPER_COMPUTE_TYPE
-
-        # Check if model is cached
-        cache_key = f"{self.model_name}_{self.device}_{self.compute_type}"
-        if cache_key not in WhisperXService._model_cache:
-            logger.info(f"Loading Whisper model: {self.model_name} on {self.device}")
-            try:
-                # Import faster-whisper directly (no whisperx/pyannote dependencies)
-                from faster_whisper import WhisperModel
-
-                # Load model
-                self.model = WhisperModel(
-                    self.model_name,
-                    device=self.device,
-                    compute_type=self.compute_type
-                )
-                # Cache the model
-                WhisperXService._model_cache[cache_key] = self.model
-                logger.info("Whisper model loaded and cached successfully")
-            except Exception as e:
-                logger.error(f"Failed to load Whisper model: {e}")
-                raise RuntimeError(
-                    f"Failed to load Whisper model '{self.model_name}': {str(e)}"
-                )
+        self.batch_size = (
+            settings.WHISPER_BATCH_SIZE if batch_size is None else batch_size
+        )
+
+        # Check if model is cached; the lock is only taken on a miss, and the
+        # cache is re-checked under it in case another thread just loaded it
+        cache_key = (self.model_name, self.device, self.compute_type)
+        model = WhisperXService._model_cache.get(cache_key)
+        if model is None:
+            with WhisperXService._model_cache_lock:
+                model = WhisperXService._model_cache.get(cache_key)
+                if model is None:
+                    model = self._load_model()
+                    # Cache the model
+                    WhisperXService._model_cache[cache_key] = model
         else:
             logger.info(f"Using cached Whisper model: {self.model_name}")
-            self.model = WhisperXService._model_cache[cache_key]
+        self.model = model
+
+    def _load_model(self) -> Any:
+        """Load the faster-whisper model for this service's configuration."""
+        logger.info(f"Loading Whisper model: {self.model_name} on {self.device}")
+        try:
+            # Import faster-whisper directly (no whisperx/pyannote dependencies)
+            from faster_whisper import WhisperModel
+
+            model = WhisperModel(
+                self.model_name,
+                device=self.device,
+                compute_type=self.compute_type,
+                # Pin intra-op threads so CPU workers sharing a host do not
+                # oversubscribe; one transcription runs per worker at a time
+                cpu_threads=settings.WHISPER_CPU_THREADS,
+                num_workers=1,
+            )
+            logger.info("Whisper model loaded and cached successfully")
+            return model
+        except Exception as e:
+            logger.error(f"Failed to load Whisper model: {e}")
+            raise RuntimeError(
+                f"Failed to load Whisper model '{self.model_name}': {str(e)}"
+            )
 
     def transcribe(
         self,
@@ -114,13 +187,14 @@ class WhisperXService(TranscriptionService):
             raise FileNotFoundError(f"Audio file not found or invalid: {audio_path}")
 
         try:
-            logger.info(f"Transcribing audio file: {audio_path}")
+            logger.info("Transcribing audio file: %s", audio_path)
 
             # Transcribe with faster-whisper
             # Returns: (segments, info) where segments is an iterator
             # Apply Chinese-specific optimizations when language is Chinese or auto-detect
-            segments_iter, info = self.model.transcribe(
-                audio_path,
+            transcribe_fn, audio, batch_kwargs = self._decoder_inputs(audio_path)
+            segments_iter, info = transcribe_fn(
+                audio,
                 language=language,
                 
                 # Beam search: smaller beam reduces hallucination tendency
@@ -133,69 +207,67 @@ class WhisperXService(TranscriptionService):
                 vad_filter=False,                 # Unified VAD handles silence
                 
                 # Chinese optimization: guide to Simplified Mandarin
-                initial_prompt="以下是普通话的句子。" if (language == "zh" or language is None) else None,
+                initial_prompt=_ZH_PROMPT if (language == "zh" or language is None) else None,
                 # Fully deterministic: eliminates sampling randomness
                 temperature=0.0,  # Changed from 0.2 for maximum stability
                 # Critical for Chinese: prevents context pollution and error propagation
                 condition_on_previous_text=False,
                 
                 # Segment-level timestamps (better for Chinese than word-level)
-                word_timestamps=False
+                word_timestamps=False,
+                **batch_kwargs
             )
 
-            logger.info(f"Detected language: {info.language} with probability {info.language_probability:.2f}")
-
-            # Enhanced logging to show auto-detection vs manual specification
             detected_lang = info.language
             lang_prob = info.language_probability
-            detection_mode = "auto-detected" if language is None else "user-specified"
+            logger.info("Detected language: %s with probability %.2f", detected_lang, lang_prob)
+
+            # Enhanced logging to show auto-detection vs manual specification
             logger.info(
-                f"Audio language: {detected_lang.upper()} "
-                f"(probability: {lang_prob:.2%}, "
-                f"{detection_mode})"
+                "Audio language: %s (probability: %.2f%%, %s)",
+                detected_lang.upper(),
+                lang_prob * 100,
+                "auto-detected" if language is None else "user-specified",
             )
 
             # Log Chinese-specific optimizations when applied
             if detected_lang == "zh":
-                logger.info(
-                    "Chinese audio detected - optimizations active: "
-                    "beam_size=3, "
-                    "compression_ratio_threshold=2.4, "
-                    "log_prob_threshold=-1.0, "
-                    "no_speech_threshold=0.6, "
-                    "temperature=0.0, "
-                    "condition_on_previous_text=False, "
-                    "VAD: min_silence=700ms/speech_pad=200ms, "
-                    "post-processing: Traditional→Simplified conversion"
-                )
+                logger.info(_ZH_OPTIMIZATIONS_LOG)
 
-            # Extract segments with timestamps
-            segments: List[BaseSegment] = []
-            for segment in segments_iter:
-                # faster-whisper segments have: start, end, text, words (optional)
-                text = segment.text.strip()
-
-                # Convert Traditional Chinese to Simplified Chinese for zh language
-                if detected_lang == "zh":
-                    try:
-                        import zhconv
-                        # zh-cn = Simplified Chinese
-                        text = zhconv.convert(text, 'zh-cn')
-                    except ImportError:
-                        logger.warning(
-                            "zhconv library not installed - skipping Traditional→Simplified conversion. "
-                            "Install with: uv pip install zhconv"
-                        )
-                    except Exception as e:
-                        logger.warning(f"Chinese conversion failed: {e} - using original text")
+            # Resolve the Traditional→Simplified converter once per transcription
+            to_simplified = None
+            if detected_lang == "zh":
+                try:
+                    from zhconv import convert as to_simplified
+                except ImportError:
+                    logger.warning(
+                        "zhconv library not installed - skipping Traditional→Simplified conversion. "
+                        "Install with: uv pip install zhconv"
+                    )
 
-                segments.append({
+            # Extract segments with timestamps
+            # faster-whisper segments have: start, end, text, words (optional)
+            segments: List[BaseSegment] = [
+                {
                     "start": float(segment.start),
                     "end": float(segment.end),
-                    "text": text
-                })
+                    "text": segment.text.strip(),
+                }
+                for segment in segments_iter
+            ]
+
+            # Convert Traditional Chinese to Simplified Chinese for zh language
+            if to_simplified is not None and segments:
+                try:
+                    converted = _convert_texts(
+                        to_simplified, [segment["text"] for segment in segments]
+                    )
+                    for segment, text in zip(segments, converted):
+                        segment["text"] = text
+                except Exception as e:
+                    logger.warning(f"Chinese conversion failed: {e} - using original text")
 
-            logger.info(f"Transcription complete: {len(segments)} segments")
+            logger.info("Transcription complete: %d segments", len(segments))
 
             # Enhancement pipeline integration (Story 4.5)
             # Services now delegate to pipeline for consistent enhancement orchestration
@@ -213,7 +285,7 @@ class WhisperXService(TranscriptionService):
                             audio_path=audio_path,
                             language=language or detected_lang,
                         )
-                        logger.info(f"Enhancement pipeline applied: {pipeline_metrics.get('pipeline_config')}")
+                        logger.info("Enhancement pipeline applied: %s", pipeline_metrics.get("pipeline_config"))
 
                         # Extract telemetry for metadata compatibility
                         applied_enhancements = pipeline_metrics.get("applied_enhancements", [])
@@ -228,7 +300,11 @@ class WhisperXService(TranscriptionService):
                 except Exception as pipeline_error:
                     logger.warning(f"Enhancement pipeline failed, returning raw segments: {pipeline_error}")
             else:
-                logger.info(f"Enhancements disabled (apply_enhancements={apply_enhancements}, ENABLE_ENHANCEMENTS={settings.ENABLE_ENHANCEMENTS})")
+                logger.info(
+                    "Enhancements disabled (apply_enhancements=%s, ENABLE_ENHANCEMENTS=%s)",
+                    apply_enhancements,
+                    settings.ENABLE_ENHANCEMENTS,
+                )
 
             refined_segments = enhanced_segments
 
@@ -248,7 +324,8 @@ class WhisperXService(TranscriptionService):
                 language=language or detected_lang,
                 model_name="whisperx",
                 processing_time=time.time() - started_at,
-                duration=self._get_audio_duration(audio_path),
+                # faster-whisper already measured the decoded audio
+                duration=info.duration or self._get_audio_duration(audio_path),
                 vad_enabled=bool(vad_engine),
                 alignment_model=refiner_alignment,
                 enhancements_applied=enhancements,
@@ -281,9 +358,44 @@ class WhisperXService(TranscriptionService):
                     f"Transcription failed: {str(e)}"
                 )
 
+    def _decoder_inputs(
+        self, audio_path: str
+    ) -> Tuple[Callable[..., Any], Any, Dict[str, Any]]:
+        """
+        Pick sequential or batched decoding for one transcription.
+
+        With batch_size > 1 the audio is decoded once and split into fixed
+        30s clip windows that BatchedInferencePipeline encodes/decodes together on
+        the GPU. Unified VAD runs downstream, so windows are not speech-trimmed.
+        Timestamp tokens stay on (the pipeline defaults them off) so each window
+        still splits into utterance-level segments instead of one 30s segment.
+
+        Returns:
+            (transcribe callable, audio path or waveform, extra transcribe kwargs)
+        """
+        batch_size = self.batch_size
+        if batch_size <= 1:
+            return self.model.transcribe, audio_path, {}
+
+        from faster_whisper import BatchedInferencePipeline, decode_audio
+
+        feature_extractor = self.model.feature_extractor
+        audio = decode_audio(audio_path, sampling_rate=feature_extractor.sampling_rate)
+        duration = audio.shape[0] / feature_extractor.sampling_rate
+        logger.info(f"Batched decoding enabled: batch_size={batch_size}")
+        return (
+            BatchedInferencePipeline(model=self.model).transcribe,
+            audio,
+            {
+                "batch_size": batch_size,
+                "clip_timestamps": _clip_windows(duration, feature_extractor.chunk_length),
+                "without_timestamps": False,
+            },
+        )
+
     @staticmethod
     def _get_audio_duration(audio_path: str) -> Optional[float]:
-        """Best-effort audio duration lookup."""
+        """Best-effort audio duration lookup when faster-whisper reports none."""
         try:
             import librosa
 
@@ -298,12 +410,8 @@ class WhisperXService(TranscriptionService):
         Returns:
             List of ISO 639-1 language codes supported by WhisperX
         """
-        # WhisperX supports 99 languages - returning commonly used subset
-        return [
-            "en", "es", "fr", "de", "it", "pt", "nl", "pl", "ru",
-            "zh", "ja", "ko", "ar", "hi", "tr", "vi", "th", "id",
-            "uk", "sv", "fi", "no", "da", "cs", "sk", "el", "he"
-        ]
+        # Copy so callers cannot mutate the shared constant
+        return list(_SUPPORTED_LANGUAGES)
 
     def validate_audio_file(self, audio_path: str) -> bool:
         """
@@ -315,12 +423,10 @@ class WhisperXService(TranscriptionService):
         Returns:
             True if valid, False otherwise
         """
-        # Check file exists
-        if not os.path.exists(audio_path):
+        # Check file extension first: rejecting unsupported formats needs no syscall
+        file_ext = os.path.splitext(audio_path)[1].lower()
+        if file_ext not in SUPPORTED_AUDIO_FORMATS:
             return False
 
-        # Check file extension
-        supported_formats = {".mp3", ".wav", ".m4a", ".flac", ".ogg", ".mp4", ".webm", ".aac", ".wma"}
-        file_ext = Path(audio_path).suffix.lower()
-
-        return file_ext in supported_formats
+        # Check file exists (a single stat)
+        return os.path.exists(audio_path)
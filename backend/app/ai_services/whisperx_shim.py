@@ -4,6 +4,10 @@ Utility to expose the vendored WhisperX package under the canonical ``whisperx``
 The repo keeps the upstream project checked in under ``app.ai_services.whisperx.whisperx``.
 Some modules (e.g., audio helpers) still import ``whisperx.utils`` etc., so we register the
 vendored package in :mod:`sys.modules` before those imports run.
+
+Registration happens once, when this module is first imported; importing the shim is
+enough for callers. ``ensure_whisperx_available`` remains for explicit use and retries
+the registration if the vendored package was missing at import time.
 """
 
 from importlib import import_module
@@ -17,3 +21,10 @@ def ensure_whisperx_available() -> None:
     if "whisperx" not in sys.modules:
         sys.modules["whisperx"] = import_module(_VENDOR_PACKAGE)
 
+
+try:
+    ensure_whisperx_available()
+except ImportError:
+    # Vendored submodule not checked out; the caller's own vendored import
+    # (or an explicit ensure_whisperx_available()) surfaces the error.
+    pass
@@ -7,31 +7,52 @@ Usage:
 """
 
 import argparse
-import json
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+import orjson
+from pydantic_core import to_json
 
 from app.ai_services.belle2_service import Belle2Service
 from app.ai_services.quality import QualityValidator
 from app.ai_services.schema import EnhancedSegment
 from app.ai_services.whisperx_service import WhisperXService
+from app.cli.transcription_cache import cached_transcribe
+from app.config import settings
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Audio file extensions picked up from a corpus directory
+_AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a", ".ogg", ".flac"})
+
+# Threads used to read reference transcripts concurrently
+_REFERENCE_LOAD_WORKERS = 16
+
 
 def load_reference_transcripts(reference_path: Path) -> Optional[List[EnhancedSegment]]:
-    """Load reference transcripts from JSON file."""
-    if not reference_path.exists():
+    """Load reference transcripts from JSON file (cached per resolved path)."""
+    return _load_reference_transcripts(reference_path.resolve().as_posix())
+
+
+@lru_cache(maxsize=1024)
+def _load_reference_transcripts(reference_path: str) -> Optional[List[EnhancedSegment]]:
+    """Parse a reference file once; model1 and model2 share the same references."""
+    if not os.path.exists(reference_path):
         return None
 
     try:
-        with open(reference_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(reference_path, "rb") as f:
+            data = orjson.loads(f.read())
             if isinstance(data, dict) and "segments" in data:
                 return data["segments"]
             return data
@@ -40,71 +61,201 @@ def load_reference_transcripts(reference_path: Path) -> Optional[List[EnhancedSe
         return None
 
 
-def transcribe_corpus_with_model(
-    audio_files: List[Path],
+def _preload_references(
+    audio_files: List[Path], reference_dir: Optional[Path]
+) -> Dict[str, Optional[List[EnhancedSegment]]]:
+    """
+    Load every file's reference transcript up front, keyed by audio file stem.
+
+    Reads are overlapped in a thread pool (file I/O releases the GIL), so
+    reference latency stays off the transcription loop.
+    """
+    if not reference_dir:
+        return {}
+
+    stems = [audio_file.stem for audio_file in audio_files]
+    ref_paths = [reference_dir / f"{stem}.json" for stem in stems]
+    with ThreadPoolExecutor(max_workers=_REFERENCE_LOAD_WORKERS) as executor:
+        return dict(zip(stems, executor.map(load_reference_transcripts, ref_paths)))
+
+
+@lru_cache(maxsize=2)
+def _get_service(model_name: str, batch_size: Optional[int] = None):
+    """
+    Return the transcription service for a model, created once per process.
+
+    Each --jobs worker process keeps its own instance, so the model is loaded
+    once per worker rather than once per file. The cache holds exactly the two
+    compared models, which both stay resident for the single corpus pass, so
+    each worker holds its own copy of both.
+
+    batch_size > 1 enables batched chunk decoding for whisperx; BELLE-2 has no
+    batched API and ignores it.
+    """
+    if model_name.lower() == "belle2":
+        return Belle2Service()
+    elif model_name.lower() == "whisperx":
+        return WhisperXService(batch_size=batch_size)
+    raise ValueError(f"Unknown model: {model_name}")
+
+
+def _transcribe_one(
+    audio_file: Path,
     model_name: str,
     pipeline: str,
     language: str,
+    batch_size: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+) -> Optional[tuple[List[EnhancedSegment], float, float, float]]:
+    """
+    Transcribe a single audio file with one model, reusing cached results.
+
+    Returns:
+        Tuple of (segments, trans_time, enh_time, audio_duration), or None if
+        the file failed to process
+    """
+    try:
+        result = cached_transcribe(
+            lambda: _get_service(model_name, batch_size).transcribe(
+                str(audio_file), language=language, apply_enhancements=True
+            ),
+            audio_file,
+            model_name,
+            pipeline,
+            language,
+            cache_dir,
+            batch_size,
+        )
+        segments = result.get("segments", [])
+        metadata = result.get("metadata", {})
+        trans_time = metadata.get("processing_time", 0.0)
+
+        # Estimate enhancement time
+        enh_time = 0.0
+        if "stats" in result and "pipeline_metrics" in result["stats"]:
+            pipeline_metrics = result["stats"]["pipeline_metrics"]
+            enh_time = pipeline_metrics.get("total_pipeline_time_ms", 0.0) / 1000.0
+
+        # Estimate audio duration as the latest segment end (order-independent)
+        duration = max((seg["end"] for seg in segments), default=0.0)
+
+        return segments, trans_time, enh_time, duration
+
+    except Exception as e:
+        # Tracebacks only with --verbose, which sets the root logger to DEBUG
+        logger.error(
+            "Failed to process %s with %s: %s",
+            audio_file.name,
+            model_name,
+            e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+        return None
+
+
+def _process_one(
+    audio_file: Path,
+    model_names: tuple[str, ...],
+    pipeline: str,
+    language: str,
+    batch_size: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+) -> List[Optional[tuple[List[EnhancedSegment], float, float, float]]]:
+    """
+    Transcribe a single audio file with every model back to back.
+
+    Running the models on the same file in succession means the second
+    decode reads the file from the OS page cache.
+
+    Returns:
+        One _transcribe_one result per model, in model_names order
+    """
+    return [
+        _transcribe_one(audio_file, model_name, pipeline, language, batch_size, cache_dir)
+        for model_name in model_names
+    ]
+
+
+def transcribe_corpus_with_models(
+    audio_files: List[Path],
+    model_names: tuple[str, ...],
+    pipeline: str,
+    language: str,
     reference_dir: Optional[Path],
-) -> tuple[List[EnhancedSegment], Optional[List[EnhancedSegment]], float, float, float]:
+    jobs: int = 1,
+    batch_size: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+) -> tuple[
+    List[tuple[List[EnhancedSegment], float, float, float]],
+    Optional[List[EnhancedSegment]],
+]:
     """
-    Transcribe all audio files with specified model.
+    Transcribe all audio files with each of the specified models in one pass.
+
+    Each file is transcribed by every model before moving on. Reference
+    transcripts are preloaded concurrently before transcription starts. With
+    jobs > 1 files are transcribed in a pool of worker processes; results are
+    aggregated here in corpus order. Files that any model failed on are left
+    out of every model's totals and the references.
 
     Returns:
-        Tuple of (segments, references, trans_time, enh_time, audio_duration)
+        Tuple of (per-model totals, references), where per-model totals is a
+        list of (segments, trans_time, enh_time, audio_duration) aligned with
+        model_names
     """
-    logger.info(f"Transcribing {len(audio_files)} files with {model_name}...")
+    logger.info(
+        f"Transcribing {len(audio_files)} files with {', '.join(model_names)}..."
+    )
 
-    # Select service
-    if model_name.lower() == "belle2":
-        service = Belle2Service()
-    elif model_name.lower() == "whisperx":
-        service = WhisperXService()
-    else:
-        raise ValueError(f"Unknown model: {model_name}")
+    process = partial(
+        _process_one,
+        model_names=model_names,
+        pipeline=pipeline,
+        language=language,
+        batch_size=batch_size,
+        cache_dir=cache_dir,
+    )
+
+    reference_cache = _preload_references(audio_files, reference_dir)
 
-    all_segments = []
+    all_segments: List[List[EnhancedSegment]] = [[] for _ in model_names]
     all_references = []
-    total_trans_time = 0.0
-    total_enh_time = 0.0
-    total_duration = 0.0
-
-    for audio_file in audio_files:
-        try:
-            # Transcribe
-            result = service.transcribe(
-                str(audio_file), language=language, apply_enhancements=True
-            )
-            segments = result.get("segments", [])
-            metadata = result.get("metadata", {})
-
-            all_segments.extend(segments)
-            total_trans_time += metadata.get("processing_time", 0.0)
-
-            # Estimate enhancement time
-            if "stats" in result and "pipeline_metrics" in result["stats"]:
-                pipeline_metrics = result["stats"]["pipeline_metrics"]
-                total_enh_time += (
-                    pipeline_metrics.get("total_pipeline_time_ms", 0.0) / 1000.0
+    total_trans_time = [0.0] * len(model_names)
+    total_enh_time = [0.0] * len(model_names)
+    total_duration = [0.0] * len(model_names)
+
+    with ExitStack() as stack:
+        if jobs > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+            results = executor.map(process, audio_files, chunksize=1)
+        else:
+            results = map(process, audio_files)
+
+        for audio_file, file_results in zip(audio_files, results):
+            # Score every model on the same files: a file one model failed on
+            # would otherwise count as deleting (or, for the others, inserting
+            # against) its whole reference
+            if any(result is None for result in file_results):
+                logger.warning(
+                    "Excluding %s from the comparison: not every model transcribed it",
+                    audio_file.name,
                 )
+                continue
 
-            # Estimate audio duration
-            if segments:
-                total_duration += segments[-1]["end"]
-
-            # Load reference if available
-            if reference_dir:
-                ref_path = reference_dir / f"{audio_file.stem}.json"
-                ref_segments = load_reference_transcripts(ref_path)
-                if ref_segments:
-                    all_references.extend(ref_segments)
+            for i, (segments, trans_time, enh_time, duration) in enumerate(file_results):
+                all_segments[i].extend(segments)
+                total_trans_time[i] += trans_time
+                total_enh_time[i] += enh_time
+                total_duration[i] += duration
 
-        except Exception as e:
-            logger.error(f"Failed to process {audio_file.name}: {e}", exc_info=True)
-            continue
+            # Add reference if available
+            ref_segments = reference_cache.get(audio_file.stem)
+            if ref_segments:
+                all_references.extend(ref_segments)
 
     references = all_references if all_references else None
-    return all_segments, references, total_trans_time, total_enh_time, total_duration
+    totals = list(zip(all_segments, total_trans_time, total_enh_time, total_duration))
+    return totals, references
 
 
 def main():
@@ -128,7 +279,7 @@ def main():
         "--corpus",
         required=True,
         type=Path,
-        help="Path to audio corpus directory or single audio file",
+        help="Path to audio corpus directory (searched recursively) or single audio file",
     )
     parser.add_argument(
         "--pipeline",
@@ -150,6 +301,32 @@ def main():
         type=Path,
         help="Output path for comparison report JSON",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of audio files to transcribe in parallel (default: 1). Each "
+        "worker process loads both compared models, so on CUDA VRAM use grows to "
+        "two models per job",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Audio chunks decoded together per file with whisperx "
+        "(default: WHISPER_BATCH_SIZE setting)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory for cached transcription results; reruns over unchanged "
+        "audio skip transcription (default: no caching)",
+    )
+    parser.add_argument(
+        "--durable",
+        action="store_true",
+        help="fsync the output report before exiting",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -177,9 +354,13 @@ def main():
     if args.corpus.is_file():
         audio_files = [args.corpus]
     elif args.corpus.is_dir():
-        audio_files = []
-        for ext in ["*.mp3", "*.wav", "*.m4a", "*.ogg", "*.flac"]:
-            audio_files.extend(args.corpus.glob(ext))
+        # One recursive walk filtered by extension, in stable path order
+        audio_files = sorted(
+            Path(dirpath, name)
+            for dirpath, _, filenames in os.walk(args.corpus)
+            for name in filenames
+            if os.path.splitext(name)[1].lower() in _AUDIO_EXTENSIONS
+        )
     else:
         logger.error(f"Corpus path not found: {args.corpus}")
         sys.exit(1)
@@ -190,27 +371,45 @@ def main():
 
     logger.info(f"Found {len(audio_files)} audio files to process")
 
+    if args.jobs > 1 and settings.WHISPER_DEVICE == "cuda":
+        logger.warning(
+            "--jobs %d on CUDA loads %s and %s in every worker (%d models in VRAM); "
+            "lower --jobs if the GPU runs out of memory",
+            args.jobs,
+            args.model1,
+            args.model2,
+            2 * args.jobs,
+        )
+
     # Initialize validator
     validator = QualityValidator()
 
-    # Transcribe with Model 1
+    # Transcribe the corpus with both models in a single pass
     logger.info(f"\n{'='*80}")
-    logger.info(f"TRANSCRIBING WITH {args.model1.upper()}")
+    logger.info(f"TRANSCRIBING WITH {args.model1.upper()} AND {args.model2.upper()}")
     logger.info(f"{'='*80}")
     (
-        model1_segments,
-        references,
-        model1_trans_time,
-        model1_enh_time,
-        model1_duration,
-    ) = transcribe_corpus_with_model(
-        audio_files, args.model1, args.pipeline, args.language, args.reference
+        (model1_segments, model1_trans_time, model1_enh_time, model1_duration),
+        (model2_segments, model2_trans_time, model2_enh_time, model2_duration),
+    ), references = transcribe_corpus_with_models(
+        audio_files,
+        (args.model1, args.model2),
+        args.pipeline,
+        args.language,
+        args.reference,
+        jobs=args.jobs,
+        batch_size=args.batch_size,
+        cache_dir=args.cache_dir,
     )
 
     if not model1_segments:
         logger.error(f"No segments from {args.model1}. Exiting.")
         sys.exit(1)
 
+    if not model2_segments:
+        logger.error(f"No segments from {args.model2}. Exiting.")
+        sys.exit(1)
+
     # Calculate Model 1 metrics
     model1_metrics = validator.calculate_quality_metrics(
         segments=model1_segments,
@@ -223,24 +422,6 @@ def main():
         audio_duration=model1_duration,
     )
 
-    # Transcribe with Model 2
-    logger.info(f"\n{'='*80}")
-    logger.info(f"TRANSCRIBING WITH {args.model2.upper()}")
-    logger.info(f"{'='*80}")
-    (
-        model2_segments,
-        _,  # references already loaded from model1
-        model2_trans_time,
-        model2_enh_time,
-        model2_duration,
-    ) = transcribe_corpus_with_model(
-        audio_files, args.model2, args.pipeline, args.language, args.reference
-    )
-
-    if not model2_segments:
-        logger.error(f"No segments from {args.model2}. Exiting.")
-        sys.exit(1)
-
     # Calculate Model 2 metrics
     model2_metrics = validator.calculate_quality_metrics(
         segments=model2_segments,
@@ -258,100 +439,94 @@ def main():
     comparison = validator.compare_models(model1_metrics, model2_metrics)
 
     # Generate output filename
-    from datetime import datetime
-
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     output_filename = (
         f"comparison_{args.model1}-vs-{args.model2}_{args.pipeline.replace(',', '-')}_{timestamp}.json"
     )
     output_path = output_dir / output_filename
 
     # Save comparison to JSON
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(comparison.model_dump(), f, indent=2, ensure_ascii=False)
+    # Serialized straight to UTF-8 bytes by pydantic-core (no intermediate dict
+    # or text re-encoding) and written in a single call
+    with open(output_path, "wb") as f:
+        f.write(to_json(comparison, indent=2))
+        if args.durable:
+            f.flush()
+            os.fsync(f.fileno())
 
     logger.info(f"Comparison report saved to: {output_path}")
 
-    # Print comparison report
-    print("\n" + "=" * 80)
-    print(f"MODEL COMPARISON REPORT: {args.model1.upper()} vs {args.model2.upper()}")
-    print("=" * 80)
-    print(f"Pipeline: {args.pipeline}")
-    print(f"Corpus: {len(audio_files)} audio files")
-    print(f"Language: {args.language}")
-    print()
+    # Comparison fields hold exact "model_a"/"model_b" tokens; map them to model names
+    model_labels = {"model_a": args.model1.upper(), "model_b": args.model2.upper()}
+
+    def winner_label(value: str) -> str:
+        return model_labels.get(value, value.upper())
+
+    # Print comparison report (built up and written in one call)
+    lines: List[str] = []
+    lines.append("\n" + "=" * 80)
+    lines.append(f"MODEL COMPARISON REPORT: {args.model1.upper()} vs {args.model2.upper()}")
+    lines.append("=" * 80)
+    lines.append(f"Pipeline: {args.pipeline}")
+    lines.append(f"Corpus: {len(audio_files)} audio files")
+    lines.append(f"Language: {args.language}")
+    lines.append("")
 
     # Accuracy comparison
-    print("ACCURACY METRICS:")
-    print(f"  {'Metric':<25} {args.model1.upper():<20} {args.model2.upper():<20} {'Winner':<10}")
-    print(f"  {'-'*25} {'-'*20} {'-'*20} {'-'*10}")
+    lines.append("ACCURACY METRICS:")
+    lines.append(f"  {'Metric':<25} {args.model1.upper():<20} {args.model2.upper():<20} {'Winner':<10}")
+    lines.append(f"  {'-'*25} {'-'*20} {'-'*20} {'-'*10}")
 
     if model1_metrics.cer is not None and model2_metrics.cer is not None:
         cer1_str = f"{model1_metrics.cer:.4f} ({model1_metrics.cer * 100:.2f}%)"
         cer2_str = f"{model2_metrics.cer:.4f} ({model2_metrics.cer * 100:.2f}%)"
-        winner = (
-            comparison.cer_comparison.replace("model_a", args.model1)
-            .replace("model_b", args.model2)
-            .upper()
-        )
-        print(f"  {'CER (lower=better)':<25} {cer1_str:<20} {cer2_str:<20} {winner:<10}")
+        winner = winner_label(comparison.cer_comparison)
+        lines.append(f"  {'CER (lower=better)':<25} {cer1_str:<20} {cer2_str:<20} {winner:<10}")
     else:
-        print(f"  {'CER':<25} {'N/A':<20} {'N/A':<20} {'N/A':<10}")
+        lines.append(f"  {'CER':<25} {'N/A':<20} {'N/A':<20} {'N/A':<10}")
 
     if model1_metrics.wer is not None and model2_metrics.wer is not None:
         wer1_str = f"{model1_metrics.wer:.4f} ({model1_metrics.wer * 100:.2f}%)"
         wer2_str = f"{model2_metrics.wer:.4f} ({model2_metrics.wer * 100:.2f}%)"
-        winner = (
-            comparison.wer_comparison.replace("model_a", args.model1)
-            .replace("model_b", args.model2)
-            .upper()
-        )
-        print(f"  {'WER (lower=better)':<25} {wer1_str:<20} {wer2_str:<20} {winner:<10}")
+        winner = winner_label(comparison.wer_comparison)
+        lines.append(f"  {'WER (lower=better)':<25} {wer1_str:<20} {wer2_str:<20} {winner:<10}")
     else:
-        print(f"  {'WER':<25} {'N/A':<20} {'N/A':<20} {'N/A':<10}")
+        lines.append(f"  {'WER':<25} {'N/A':<20} {'N/A':<20} {'N/A':<10}")
 
-    print()
+    lines.append("")
 
     # Segment quality comparison
-    print("SEGMENT QUALITY:")
-    print(f"  {'Metric':<30} {args.model1.upper():<20} {args.model2.upper():<20} {'Winner':<10}")
-    print(f"  {'-'*30} {'-'*20} {'-'*20} {'-'*10}")
+    lines.append("SEGMENT QUALITY:")
+    lines.append(f"  {'Metric':<30} {args.model1.upper():<20} {args.model2.upper():<20} {'Winner':<10}")
+    lines.append(f"  {'-'*30} {'-'*20} {'-'*20} {'-'*10}")
 
     dur_comp1 = model1_metrics.segment_stats.duration_compliance_pct
     dur_comp2 = model2_metrics.segment_stats.duration_compliance_pct
-    dur_winner = (
-        comparison.duration_compliance_comparison.replace("model_a", args.model1)
-        .replace("model_b", args.model2)
-        .upper()
-    )
-    print(
+    dur_winner = winner_label(comparison.duration_compliance_comparison)
+    lines.append(
         f"  {'Duration Compliance (1-7s)':<30} {f'{dur_comp1:.1f}%':<20} {f'{dur_comp2:.1f}%':<20} {dur_winner:<10}"
     )
 
     char_comp1 = model1_metrics.char_stats.char_compliance_pct
     char_comp2 = model2_metrics.char_stats.char_compliance_pct
-    char_winner = (
-        comparison.char_compliance_comparison.replace("model_a", args.model1)
-        .replace("model_b", args.model2)
-        .upper()
-    )
-    print(
+    char_winner = winner_label(comparison.char_compliance_comparison)
+    lines.append(
         f"  {'Char Compliance (≤200)':<30} {f'{char_comp1:.1f}%':<20} {f'{char_comp2:.1f}%':<20} {char_winner:<10}"
     )
 
-    print(
+    lines.append(
         f"  {'Mean Segment Duration':<30} {f'{model1_metrics.segment_stats.mean_duration:.2f}s':<20} {f'{model2_metrics.segment_stats.mean_duration:.2f}s':<20} {'-':<10}"
     )
-    print(
+    lines.append(
         f"  {'Mean Characters':<30} {model1_metrics.char_stats.mean_chars:<20} {model2_metrics.char_stats.mean_chars:<20} {'-':<10}"
     )
 
-    print()
+    lines.append("")
 
     # Confidence comparison
-    print("CONFIDENCE SCORES:")
-    print(f"  {'Metric':<30} {args.model1.upper():<20} {args.model2.upper():<20} {'Winner':<10}")
-    print(f"  {'-'*30} {'-'*20} {'-'*20} {'-'*10}")
+    lines.append("CONFIDENCE SCORES:")
+    lines.append(f"  {'Metric':<30} {args.model1.upper():<20} {args.model2.upper():<20} {'Winner':<10}")
+    lines.append(f"  {'-'*30} {'-'*20} {'-'*20} {'-'*10}")
 
     if (
         model1_metrics.confidence_stats.mean_confidence is not None
@@ -360,46 +535,46 @@ def main():
         conf1 = model1_metrics.confidence_stats.mean_confidence
         conf2 = model2_metrics.confidence_stats.mean_confidence
         conf_winner = (
-            comparison.confidence_comparison.replace("model_a", args.model1)
-            .replace("model_b", args.model2)
-            .upper()
+            winner_label(comparison.confidence_comparison)
             if comparison.confidence_comparison
             else "N/A"
         )
-        print(
+        lines.append(
             f"  {'Mean Confidence':<30} {f'{conf1:.3f} ({conf1*100:.1f}%)':<20} {f'{conf2:.3f} ({conf2*100:.1f}%)':<20} {conf_winner:<10}"
         )
     else:
-        print(f"  {'Mean Confidence':<30} {'N/A':<20} {'N/A':<20} {'N/A':<10}")
+        lines.append(f"  {'Mean Confidence':<30} {'N/A':<20} {'N/A':<20} {'N/A':<10}")
 
     low_conf1_pct = model1_metrics.confidence_stats.low_confidence_pct
     low_conf2_pct = model2_metrics.confidence_stats.low_confidence_pct
-    print(
+    lines.append(
         f"  {'Low Confidence (<0.7)':<30} {f'{low_conf1_pct:.1f}%':<20} {f'{low_conf2_pct:.1f}%':<20} {'-':<10}"
     )
 
-    print()
+    lines.append("")
 
     # Processing time comparison
-    print("PROCESSING TIME:")
-    print(f"  {'Metric':<30} {args.model1.upper():<20} {args.model2.upper():<20}")
-    print(f"  {'-'*30} {'-'*20} {'-'*20}")
-    print(
+    lines.append("PROCESSING TIME:")
+    lines.append(f"  {'Metric':<30} {args.model1.upper():<20} {args.model2.upper():<20}")
+    lines.append(f"  {'-'*30} {'-'*20} {'-'*20}")
+    lines.append(
         f"  {'Total Time':<30} {f'{model1_metrics.total_time:.1f}s':<20} {f'{model2_metrics.total_time:.1f}s':<20}"
     )
     if model1_metrics.audio_duration and model2_metrics.audio_duration:
         rtf1 = model1_metrics.total_time / model1_metrics.audio_duration
         rtf2 = model2_metrics.total_time / model2_metrics.audio_duration
-        print(f"  {'Real-Time Factor':<30} {f'{rtf1:.2f}x':<20} {f'{rtf2:.2f}x':<20}")
+        lines.append(f"  {'Real-Time Factor':<30} {f'{rtf1:.2f}x':<20} {f'{rtf2:.2f}x':<20}")
 
-    print()
+    lines.append("")
 
     # Recommendation
-    print("=" * 80)
-    print("RECOMMENDATION:")
-    print(f"  {comparison.recommended_model.replace('model_a', args.model1.upper()).replace('model_b', args.model2.upper())}")
-    print(f"  Rationale: {comparison.recommendation_rationale}")
-    print("=" * 80)
+    lines.append("=" * 80)
+    lines.append("RECOMMENDATION:")
+    lines.append(f"  {model_labels.get(comparison.recommended_model, comparison.recommended_model)}")
+    lines.append(f"  Rationale: {comparison.recommendation_rationale}")
+    lines.append("=" * 80)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
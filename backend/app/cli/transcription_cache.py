@@ -0,0 +1,134 @@
+"""
+Persistent on-disk cache of transcription results for the quality CLIs.
+
+Results are keyed by audio content hash, model, pipeline, language and the
+settings that shape model output, so rerunning a sweep over an unchanged
+corpus and configuration skips transcription entirely.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _audio_digest(audio_file: Path) -> str:
+    """Return the SHA-1 hex digest of the audio file's full contents."""
+    with open(audio_file, "rb") as f:
+        return hashlib.file_digest(f, "sha1").hexdigest()
+
+
+def _config_digest(model_name: str, batch_size: Optional[int]) -> str:
+    """
+    Hash the resolved settings that change a model's output.
+
+    The services read these from settings rather than from CLI arguments
+    (compare_models always enhances with ENHANCEMENT_PIPELINE), so they must
+    be part of the key for a cached result to match a fresh run.
+    """
+    config: Dict[str, Any] = {
+        "device": settings.WHISPER_DEVICE,
+        "enhancement_pipeline": settings.ENHANCEMENT_PIPELINE,
+    }
+    if model_name.lower() == "whisperx":
+        config.update(
+            model=settings.WHISPER_MODEL,
+            compute_type=settings.WHISPER_COMPUTE_TYPE,
+            batch_size=settings.WHISPER_BATCH_SIZE if batch_size is None else batch_size,
+        )
+    else:
+        # Same fallback chain as Belle2Service.__init__
+        config.update(
+            model=(
+                getattr(settings, "BELLE2_MODEL_PATH", None)
+                or settings.BELLE2_MODEL_NAME
+                or "BELLE-2/Belle-whisper-large-v3-zh"
+            ),
+            load_in_4bit=settings.BELLE2_LOAD_IN_4BIT,
+        )
+    return hashlib.sha1(orjson.dumps(config, option=orjson.OPT_SORT_KEYS)).hexdigest()[:12]
+
+
+def cache_path(
+    cache_dir: Path,
+    audio_file: Path,
+    model_name: str,
+    pipeline: str,
+    language: str,
+    batch_size: Optional[int] = None,
+) -> Path:
+    """Return the cache entry path for one transcription configuration."""
+    pipeline_key = pipeline.replace(",", "-") or "none"
+    config_key = _config_digest(model_name, batch_size)
+    return (
+        cache_dir
+        / model_name
+        / f"{_audio_digest(audio_file)}_{pipeline_key}_{language}_{config_key}.json"
+    )
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Write payload via a temp file + os.replace so readers never see partial JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def cached_transcribe(
+    transcribe: Callable[[], Dict[str, Any]],
+    audio_file: Path,
+    model_name: str,
+    pipeline: str,
+    language: str,
+    cache_dir: Optional[Path],
+    batch_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Return a cached transcription result, or run transcribe() and cache it.
+
+    Args:
+        transcribe: Zero-argument callable producing the service result
+        audio_file: Audio file being transcribed
+        model_name: Model name ('belle2' or 'whisperx')
+        pipeline: Enhancement pipeline configuration
+        language: Language code or 'auto'
+        cache_dir: Cache root directory; None disables caching
+        batch_size: Batched decoding size passed to the service (None = setting)
+
+    Returns:
+        Transcription result dictionary
+    """
+    if cache_dir is None:
+        return transcribe()
+
+    path = cache_path(cache_dir, audio_file, model_name, pipeline, language, batch_size)
+    try:
+        with open(path, "rb") as f:
+            result = orjson.loads(f.read())
+        logger.info("Using cached transcription for %s: %s", audio_file.name, path)
+        return result
+    except FileNotFoundError:
+        pass
+    except orjson.JSONDecodeError:
+        logger.warning("Ignoring corrupt transcription cache entry: %s", path)
+
+    result = transcribe()
+    try:
+        _write_atomic(path, orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY))
+    except (OSError, TypeError) as e:
+        logger.warning("Failed to cache transcription for %s: %s", audio_file.name, e)
+    return result
@@ -7,16 +7,24 @@ Usage:
 """
 
 import argparse
-import json
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+import orjson
+from pydantic_core import to_json
 
 from app.ai_services.belle2_service import Belle2Service
 from app.ai_services.quality import QualityValidator
 from app.ai_services.schema import EnhancedSegment
 from app.ai_services.whisperx_service import WhisperXService
+from app.cli.transcription_cache import cached_transcribe
 from app.config import settings
 
 logging.basicConfig(
@@ -24,24 +32,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Audio file extensions picked up from a corpus directory
+_AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a", ".ogg", ".flac"})
+
+# Threads used to read reference transcripts concurrently
+_REFERENCE_LOAD_WORKERS = 16
+
 
 def load_reference_transcripts(reference_path: Path) -> Optional[List[EnhancedSegment]]:
     """
     Load reference transcripts from JSON file.
 
+    Parsed files are cached per resolved path, so repeated loads return the
+    same list without re-reading the file.
+
     Args:
         reference_path: Path to reference transcripts JSON file
 
     Returns:
         List of EnhancedSegment dictionaries, or None if file doesn't exist
     """
-    if not reference_path.exists():
+    return _load_reference_transcripts(reference_path.resolve().as_posix())
+
+
+@lru_cache(maxsize=1024)
+def _load_reference_transcripts(reference_path: str) -> Optional[List[EnhancedSegment]]:
+    """Parse a reference transcripts file; see load_reference_transcripts."""
+    if not os.path.exists(reference_path):
         logger.warning(f"Reference file not found: {reference_path}")
         return None
 
     try:
-        with open(reference_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(reference_path, "rb") as f:
+            data = orjson.loads(f.read())
             # Handle both {"segments": [...]} and [...] formats
             if isinstance(data, dict) and "segments" in data:
                 return data["segments"]
@@ -51,8 +74,47 @@ def load_reference_transcripts(reference_path: Path) -> Optional[List[EnhancedSe
         return None
 
 
+def _preload_references(
+    audio_files: List[Path], reference_dir: Optional[Path]
+) -> Dict[str, Optional[List[EnhancedSegment]]]:
+    """
+    Load every file's reference transcript up front, keyed by audio file stem.
+
+    Reads are overlapped in a thread pool (file I/O releases the GIL), so
+    reference latency stays off the transcription loop.
+    """
+    if not reference_dir:
+        return {}
+
+    stems = [audio_file.stem for audio_file in audio_files]
+    ref_paths = [reference_dir / f"{stem}.json" for stem in stems]
+    with ThreadPoolExecutor(max_workers=_REFERENCE_LOAD_WORKERS) as executor:
+        return dict(zip(stems, executor.map(load_reference_transcripts, ref_paths)))
+
+
+@lru_cache(maxsize=1)
+def _get_service(model_name: str, batch_size: Optional[int] = None):
+    """
+    Return the transcription service for a model, created once per process.
+
+    Each --jobs worker process keeps its own instance, so the model is loaded
+    once per worker rather than once per file. batch_size > 1 enables batched
+    chunk decoding for whisperx; BELLE-2 has no batched API and ignores it.
+    """
+    if model_name.lower() == "belle2":
+        return Belle2Service()
+    elif model_name.lower() == "whisperx":
+        return WhisperXService(batch_size=batch_size)
+    raise ValueError(f"Unknown model: {model_name}. Supported: belle2, whisperx")
+
+
 def transcribe_file(
-    audio_path: Path, model_name: str, language: str = "auto", pipeline: str = "vad,refine,split"
+    audio_path: Path,
+    model_name: str,
+    language: str = "auto",
+    pipeline: str = "vad,refine,split",
+    batch_size: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
 ) -> tuple[List[EnhancedSegment], float, float]:
     """
     Transcribe audio file with specified model.
@@ -62,25 +124,29 @@ def transcribe_file(
         model_name: Model name ('belle2' or 'whisperx')
         language: Language code or 'auto'
         pipeline: Enhancement pipeline config ("none" to disable, otherwise enables enhancements)
+        batch_size: Batched chunk decoding size for whisperx (None uses the setting)
+        cache_dir: Transcription cache directory (None disables caching)
 
     Returns:
         Tuple of (segments, transcription_time, enhancement_time)
     """
     logger.info(f"Transcribing {audio_path.name} with {model_name}...")
 
-    # Select service based on model name
-    if model_name.lower() == "belle2":
-        service = Belle2Service()
-    elif model_name.lower() == "whisperx":
-        service = WhisperXService()
-    else:
-        raise ValueError(f"Unknown model: {model_name}. Supported: belle2, whisperx")
-
     # Determine whether to apply enhancements based on pipeline parameter
     apply_enhancements = (pipeline.strip().lower() != "none")
 
-    # Transcribe with enhancements
-    result = service.transcribe(str(audio_path), language=language, apply_enhancements=apply_enhancements)
+    # Transcribe with enhancements; the service is only created on a cache miss
+    result = cached_transcribe(
+        lambda: _get_service(model_name, batch_size).transcribe(
+            str(audio_path), language=language, apply_enhancements=apply_enhancements
+        ),
+        audio_path,
+        model_name,
+        pipeline,
+        language,
+        cache_dir,
+        batch_size,
+    )
 
     # Extract segments and timing info from result
     segments = result.get("segments", [])
@@ -97,6 +163,42 @@ def transcribe_file(
     return segments, transcription_time, enhancement_time
 
 
+def _process_one(
+    audio_file: Path,
+    model_name: str,
+    language: str,
+    pipeline: str,
+    batch_size: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+) -> Optional[tuple[List[EnhancedSegment], float, float, float]]:
+    """
+    Transcribe a single audio file.
+
+    Returns:
+        Tuple of (segments, transcription_time, enhancement_time, audio_duration),
+        or None if the file failed to process
+    """
+    try:
+        segments, trans_time, enh_time = transcribe_file(
+            audio_file, model_name, language, pipeline, batch_size, cache_dir
+        )
+
+        # Estimate audio duration as the latest segment end (order-independent)
+        audio_duration = max((seg["end"] for seg in segments), default=0.0)
+
+        return segments, trans_time, enh_time, audio_duration
+
+    except Exception as e:
+        # Tracebacks only with --verbose, which sets the root logger to DEBUG
+        logger.error(
+            "Failed to process %s: %s",
+            audio_file.name,
+            e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+        return None
+
+
 def main():
     """Main CLI entry point for quality validation."""
     parser = argparse.ArgumentParser(
@@ -117,7 +219,7 @@ def main():
         "--corpus",
         required=True,
         type=Path,
-        help="Path to audio corpus directory or single audio file",
+        help="Path to audio corpus directory (searched recursively) or single audio file",
     )
     parser.add_argument(
         "--reference",
@@ -134,6 +236,30 @@ def main():
         type=Path,
         help="Output path for metrics JSON file (default: quality_metrics/)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of audio files to transcribe in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Audio chunks decoded together per file with whisperx "
+        "(default: WHISPER_BATCH_SIZE setting)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory for cached transcription results; reruns over unchanged "
+        "audio skip transcription (default: no caching)",
+    )
+    parser.add_argument(
+        "--durable",
+        action="store_true",
+        help="fsync the output report before exiting",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -157,10 +283,13 @@ def main():
     if args.corpus.is_file():
         audio_files = [args.corpus]
     elif args.corpus.is_dir():
-        # Find common audio extensions
-        audio_files = []
-        for ext in ["*.mp3", "*.wav", "*.m4a", "*.ogg", "*.flac"]:
-            audio_files.extend(args.corpus.glob(ext))
+        # One recursive walk filtered by extension, in stable path order
+        audio_files = sorted(
+            Path(dirpath, name)
+            for dirpath, _, filenames in os.walk(args.corpus)
+            for name in filenames
+            if os.path.splitext(name)[1].lower() in _AUDIO_EXTENSIONS
+        )
     else:
         logger.error(f"Corpus path not found: {args.corpus}")
         sys.exit(1)
@@ -181,31 +310,37 @@ def main():
     total_enhancement_time = 0.0
     total_audio_duration = 0.0
 
-    for audio_file in audio_files:
-        try:
-            # Transcribe
-            segments, trans_time, enh_time = transcribe_file(
-                audio_file, args.model, args.language, args.pipeline
-            )
+    process = partial(
+        _process_one,
+        model_name=args.model,
+        language=args.language,
+        pipeline=args.pipeline,
+        batch_size=args.batch_size,
+        cache_dir=args.cache_dir,
+    )
+
+    reference_cache = _preload_references(audio_files, args.reference)
+
+    with ExitStack() as stack:
+        if args.jobs > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=args.jobs))
+            results = executor.map(process, audio_files, chunksize=1)
+        else:
+            results = map(process, audio_files)
+
+        for audio_file, result in zip(audio_files, results):
+            if result is None:
+                continue
+            segments, trans_time, enh_time, audio_duration = result
             all_segments.extend(segments)
             total_transcription_time += trans_time
             total_enhancement_time += enh_time
+            total_audio_duration += audio_duration
 
-            # Load reference if available
-            if args.reference:
-                ref_path = args.reference / f"{audio_file.stem}.json"
-                ref_segments = load_reference_transcripts(ref_path)
-                if ref_segments:
-                    all_references.extend(ref_segments)
-
-            # Estimate audio duration from segments
-            if segments:
-                audio_duration = segments[-1]["end"]
-                total_audio_duration += audio_duration
-
-        except Exception as e:
-            logger.error(f"Failed to process {audio_file.name}: {e}", exc_info=True)
-            continue
+            # Add reference if available
+            ref_segments = reference_cache.get(audio_file.stem)
+            if ref_segments:
+                all_references.extend(ref_segments)
 
     if not all_segments:
         logger.error("No segments transcribed. Exiting.")
@@ -227,91 +362,97 @@ def main():
     )
 
     # Generate output filename
-    from datetime import datetime
-
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     output_filename = f"{args.model}_{args.pipeline.replace(',', '-')}_{timestamp}.json"
     output_path = output_dir / output_filename
 
     # Save metrics to JSON
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(metrics.model_dump(), f, indent=2, ensure_ascii=False)
+    # Serialized straight to UTF-8 bytes by pydantic-core (no intermediate dict
+    # or text re-encoding) and written in a single call
+    with open(output_path, "wb") as f:
+        f.write(to_json(metrics, indent=2))
+        if args.durable:
+            f.flush()
+            os.fsync(f.fileno())
 
     logger.info(f"Quality metrics saved to: {output_path}")
 
-    # Print summary
-    print("\n" + "=" * 80)
-    print(f"QUALITY VALIDATION REPORT: {args.model} ({args.pipeline})")
-    print("=" * 80)
-    print(f"Model: {metrics.model_name}")
-    print(f"Pipeline: {metrics.pipeline_config}")
-    print(f"Language: {metrics.language or 'auto'}")
-    print(f"Audio Duration: {metrics.audio_duration:.1f}s" if metrics.audio_duration else "N/A")
-    print()
-    print("ACCURACY METRICS:")
+    # Print summary (built up and written in one call)
+    lines: List[str] = []
+    lines.append("\n" + "=" * 80)
+    lines.append(f"QUALITY VALIDATION REPORT: {args.model} ({args.pipeline})")
+    lines.append("=" * 80)
+    lines.append(f"Model: {metrics.model_name}")
+    lines.append(f"Pipeline: {metrics.pipeline_config}")
+    lines.append(f"Language: {metrics.language or 'auto'}")
+    lines.append(f"Audio Duration: {metrics.audio_duration:.1f}s" if metrics.audio_duration else "N/A")
+    lines.append("")
+    lines.append("ACCURACY METRICS:")
     if metrics.cer is not None:
-        print(f"  CER (Character Error Rate): {metrics.cer:.4f} ({metrics.cer * 100:.2f}%)")
+        lines.append(f"  CER (Character Error Rate): {metrics.cer:.4f} ({metrics.cer * 100:.2f}%)")
     else:
-        print("  CER: N/A (no reference transcripts)")
+        lines.append("  CER: N/A (no reference transcripts)")
     if metrics.wer is not None:
-        print(f"  WER (Word Error Rate): {metrics.wer:.4f} ({metrics.wer * 100:.2f}%)")
+        lines.append(f"  WER (Word Error Rate): {metrics.wer:.4f} ({metrics.wer * 100:.2f}%)")
     else:
-        print("  WER: N/A (no reference transcripts)")
-    print()
-    print("SEGMENT LENGTH STATISTICS:")
-    print(f"  Total Segments: {metrics.segment_stats.segment_count}")
-    print(f"  Mean Duration: {metrics.segment_stats.mean_duration:.2f}s")
-    print(f"  Median Duration: {metrics.segment_stats.median_duration:.2f}s")
-    print(f"  P95 Duration: {metrics.segment_stats.p95_duration:.2f}s")
-    print(f"  Duration Compliance (1-7s): {metrics.segment_stats.duration_compliance_pct:.1f}%")
-    print(f"  Too Short (<1s): {metrics.segment_stats.too_short_count}")
-    print(f"  Too Long (>7s): {metrics.segment_stats.too_long_count}")
-    print()
-    print("CHARACTER LENGTH STATISTICS:")
-    print(f"  Mean Characters: {metrics.char_stats.mean_chars}")
-    print(f"  Median Characters: {metrics.char_stats.median_chars}")
-    print(f"  P95 Characters: {metrics.char_stats.p95_chars}")
-    print(f"  Character Compliance (≤200): {metrics.char_stats.char_compliance_pct:.1f}%")
-    print(f"  Over Limit (>200): {metrics.char_stats.over_limit_count}")
-    print()
-    print("CHARACTER TIMING COVERAGE:")
-    print(
+        lines.append("  WER: N/A (no reference transcripts)")
+    lines.append("")
+    lines.append("SEGMENT LENGTH STATISTICS:")
+    lines.append(f"  Total Segments: {metrics.segment_stats.segment_count}")
+    lines.append(f"  Mean Duration: {metrics.segment_stats.mean_duration:.2f}s")
+    lines.append(f"  Median Duration: {metrics.segment_stats.median_duration:.2f}s")
+    lines.append(f"  P95 Duration: {metrics.segment_stats.p95_duration:.2f}s")
+    lines.append(f"  Duration Compliance (1-7s): {metrics.segment_stats.duration_compliance_pct:.1f}%")
+    lines.append(f"  Too Short (<1s): {metrics.segment_stats.too_short_count}")
+    lines.append(f"  Too Long (>7s): {metrics.segment_stats.too_long_count}")
+    lines.append("")
+    lines.append("CHARACTER LENGTH STATISTICS:")
+    lines.append(f"  Mean Characters: {metrics.char_stats.mean_chars}")
+    lines.append(f"  Median Characters: {metrics.char_stats.median_chars}")
+    lines.append(f"  P95 Characters: {metrics.char_stats.p95_chars}")
+    lines.append(f"  Character Compliance (≤200): {metrics.char_stats.char_compliance_pct:.1f}%")
+    lines.append(f"  Over Limit (>200): {metrics.char_stats.over_limit_count}")
+    lines.append("")
+    lines.append("CHARACTER TIMING COVERAGE:")
+    lines.append(
         f"  Segments with char[]: {metrics.char_timing_stats.segments_with_chars}/{metrics.segment_stats.segment_count} ({metrics.char_timing_stats.char_coverage_pct:.1f}%)"
     )
-    print(f"  Total Characters: {metrics.char_timing_stats.total_chars}")
-    print(f"  Characters with Timing: {metrics.char_timing_stats.chars_with_timing}")
-    print()
-    print("CONFIDENCE STATISTICS:")
-    print(
+    lines.append(f"  Total Characters: {metrics.char_timing_stats.total_chars}")
+    lines.append(f"  Characters with Timing: {metrics.char_timing_stats.chars_with_timing}")
+    lines.append("")
+    lines.append("CONFIDENCE STATISTICS:")
+    lines.append(
         f"  Segments with Confidence: {metrics.confidence_stats.segments_with_confidence}/{metrics.segment_stats.segment_count} ({metrics.confidence_stats.confidence_coverage_pct:.1f}%)"
     )
     if metrics.confidence_stats.mean_confidence is not None:
-        print(
+        lines.append(
             f"  Mean Confidence: {metrics.confidence_stats.mean_confidence:.3f} ({metrics.confidence_stats.mean_confidence * 100:.1f}%)"
         )
-        print(
+        lines.append(
             f"  Median Confidence: {metrics.confidence_stats.median_confidence:.3f}" if metrics.confidence_stats.median_confidence else "  Median Confidence: N/A"
         )
     else:
-        print("  Mean Confidence: N/A")
-    print(
+        lines.append("  Mean Confidence: N/A")
+    lines.append(
         f"  Low Confidence (<0.7): {metrics.confidence_stats.low_confidence_count} ({metrics.confidence_stats.low_confidence_pct:.1f}%)"
     )
-    print()
-    print("ENHANCEMENT METRICS:")
-    print(f"  Applied: {', '.join(metrics.enhancement_metrics.enhancements_applied) if metrics.enhancement_metrics.enhancements_applied else 'None'}")
-    print(
+    lines.append("")
+    lines.append("ENHANCEMENT METRICS:")
+    lines.append(f"  Applied: {', '.join(metrics.enhancement_metrics.enhancements_applied) if metrics.enhancement_metrics.enhancements_applied else 'None'}")
+    lines.append(
         f"  Segments Modified: {metrics.enhancement_metrics.segments_modified_count}/{metrics.segment_stats.segment_count} ({metrics.enhancement_metrics.modification_rate_pct:.1f}%)"
     )
-    print()
-    print("PROCESSING TIME:")
-    print(f"  Transcription: {metrics.transcription_time:.1f}s")
-    print(f"  Enhancement: {metrics.enhancement_time:.1f}s")
-    print(f"  Total: {metrics.total_time:.1f}s")
+    lines.append("")
+    lines.append("PROCESSING TIME:")
+    lines.append(f"  Transcription: {metrics.transcription_time:.1f}s")
+    lines.append(f"  Enhancement: {metrics.enhancement_time:.1f}s")
+    lines.append(f"  Total: {metrics.total_time:.1f}s")
     if metrics.audio_duration:
         rtf = metrics.total_time / metrics.audio_duration
-        print(f"  Real-Time Factor: {rtf:.2f}x")
-    print("=" * 80)
+        lines.append(f"  Real-Time Factor: {rtf:.2f}x")
+    lines.append("=" * 80)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
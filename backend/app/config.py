@@ -3,10 +3,19 @@ Configuration management using Pydantic Settings
 Loads environment variables from .env file or environment
 """
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List, Literal, Optional
-import json
+from pydantic import BeforeValidator, Field
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+from typing import Annotated, Any, List, Literal, Optional
+import orjson
+
+
+def _parse_cors(value: Any) -> Any:
+    """Accept CORS origins as a JSON array string or a comma-separated string"""
+    if isinstance(value, str):
+        if value.lstrip().startswith("["):
+            return orjson.loads(value)
+        return [origin.strip() for origin in value.split(",") if origin.strip()]
+    return value
 
 
 class Settings(BaseSettings):
@@ -19,10 +28,32 @@ class Settings(BaseSettings):
     # WhisperX model settings
     WHISPER_MODEL: str = "base"  # large-v2, large-v3, medium, small, base, tiny
     WHISPER_DEVICE: str = "cuda"  # cuda, cpu
-    WHISPER_COMPUTE_TYPE: str = "float16"
+    WHISPER_COMPUTE_TYPE: str = "int8_float16"  # int8 weights, fp16 compute on CUDA
+    WHISPER_BATCH_SIZE: int = Field(
+        default=0,
+        description=(
+            "Decode fixed 30s audio windows in GPU batches of this size via "
+            "faster-whisper's BatchedInferencePipeline. 0 or 1 keeps sequential decoding."
+        ),
+    )
+    WHISPER_CPU_THREADS: int = Field(
+        default=0,
+        description=(
+            "CTranslate2 threads per model for CPU inference. 0 keeps the library default "
+            "(4, or OMP_NUM_THREADS). With several CPU workers per host, set to "
+            "cores / worker concurrency to avoid oversubscription."
+        ),
+    )
 
     # BELLE-2 model settings
     BELLE2_MODEL_NAME: Optional[str] = None
+    BELLE2_LOAD_IN_4BIT: bool = Field(
+        default=False,
+        description=(
+            "Load BELLE-2 with bitsandbytes NF4 4-bit weights on CUDA to cut VRAM usage "
+            "(requires bitsandbytes). CPU loads always use dynamic int8 quantization."
+        ),
+    )
 
     # Epic 4: Multi-Model Production Architecture
     DEFAULT_TRANSCRIPTION_MODEL: Literal["belle2", "whisperx", "auto"] = Field(
@@ -34,6 +65,13 @@ class Settings(BaseSettings):
             "'auto': Automatic selection based on language detection (Chinese→belle2, others→whisperx)."
         ),
     )
+    ROUTER_DETECTION_BATCHING: bool = Field(
+        default=False,
+        description=(
+            "Coalesce concurrent language detections into one batched Whisper encoder "
+            "pass (BatchingDetector). Useful when a worker runs several jobs at once."
+        ),
+    )
 
     # Epic 3: Timestamp Optimization Settings
     OPTIMIZER_ENGINE: Literal["whisperx", "heuristic", "auto"] = Field(
@@ -163,7 +201,12 @@ class Settings(BaseSettings):
     ]
 
     # CORS Configuration
-    CORS_ORIGINS: str = '["http://localhost:5173", "http://localhost:5174", "http://localhost:5175"]'
+    # Parsed once at construction; NoDecode hands the raw env string to _parse_cors
+    CORS_ORIGINS: Annotated[List[str], NoDecode, BeforeValidator(_parse_cors)] = [
+        "http://localhost:5173",
+        "http://localhost:5174",
+        "http://localhost:5175",
+    ]
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -171,14 +214,6 @@ class Settings(BaseSettings):
         case_sensitive=True
     )
 
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS_ORIGINS JSON string to list"""
-        try:
-            return json.loads(self.CORS_ORIGINS)
-        except json.JSONDecodeError:
-            return ["http://localhost:5173"]
-
 
 # Global settings instance
 settings = Settings()
@@ -3,7 +3,7 @@ Redis service for job status and result storage
 Manages job status tracking and transcription result persistence
 """
 
-import json
+import orjson
 import redis
 import uuid
 from datetime import datetime, timezone
@@ -116,7 +116,7 @@ class RedisService:
             "updated_at": self._get_utc_timestamp()
         }
 
-        self.client.set(key, json.dumps(status_data))
+        self.client.set(key, orjson.dumps(status_data, option=orjson.OPT_SERIALIZE_NUMPY))
 
     def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -136,8 +136,8 @@ class RedisService:
             return None
 
         try:
-            return json.loads(data)
-        except json.JSONDecodeError:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
             return None
 
     def set_result(self, job_id: str, segments: List[Dict[str, Any]]) -> None:
@@ -159,7 +159,7 @@ class RedisService:
         self._validate_job_id(job_id)
         key = f"job:{job_id}:result"
         result_data = {"segments": segments}
-        self.client.set(key, json.dumps(result_data))
+        self.client.set(key, orjson.dumps(result_data, option=orjson.OPT_SERIALIZE_NUMPY))
 
     def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -179,8 +179,8 @@ class RedisService:
             return None
 
         try:
-            return json.loads(data)
-        except json.JSONDecodeError:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
             return None
 
     def delete_job_data(self, job_id: str) -> None:
@@ -6,6 +6,7 @@ Implements 5-stage progress tracking with multi-model support
 import os
 import json
 import logging
+import orjson
 import uuid
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
@@ -395,8 +396,9 @@ def transcribe_audio(
         os.makedirs(job_dir, exist_ok=True)
 
         transcription_file = os.path.join(job_dir, "transcription.json")
-        with open(transcription_file, "w", encoding="utf-8") as f:
-            json.dump(result_data, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 bytes straight from the segment dicts
+        with open(transcription_file, "wb") as f:
+            f.write(orjson.dumps(result_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
         # Verify file was written successfully
         if not os.path.exists(transcription_file) or os.path.getsize(transcription_file) == 0:
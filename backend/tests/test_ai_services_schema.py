@@ -37,3 +37,34 @@ def test_build_transcription_result_round_trip():
     assert result["metadata"]["model_name"] == "whisperx"
     assert result["metadata"]["vad_enabled"] is True
     assert "vad:silero" in result["stats"]["enhancements_applied"]
+
+
+def test_build_transcription_result_optional_timings():
+    word = {"word": "hello", "start": 0.0, "end": 1.0}
+    segments: List[BaseSegment] = [
+        {"start": 0.0, "end": 1.0, "text": "hello", "words": [word]},
+        {"start": 1, "end": 2, "text": "world"},
+    ]
+
+    result = build_transcription_result(
+        segments=segments,
+        language="en",
+        model_name="whisperx",
+        processing_time=0.1,
+        duration=2.0,
+        vad_enabled=False,
+        alignment_model=None,
+        enhancements_applied=["vad:silero"],
+    )
+
+    first, second = result["segments"]
+    assert first["words"] == [word]
+    assert first["words"] is segments[0]["words"]  # shared, not copied
+    assert "chars" not in first
+    assert "words" not in second and "chars" not in second
+    assert isinstance(second["start"], float)
+    assert second["source_model"] == "whisperx"
+
+    # Each segment owns its enhancement list; components append in place
+    first["enhancements_applied"].append("timestamp_refine")
+    assert second["enhancements_applied"] == ["vad:silero"]
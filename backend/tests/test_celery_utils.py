@@ -0,0 +1,50 @@
+"""
+Tests for Celery serializer configuration
+"""
+
+from kombu.serialization import dumps, loads, prepare_accept_content
+
+from app.celery_utils import celery_app
+
+
+def test_orjson_serializer_round_trips_result_payload():
+    """Task results round-trip through the registered orjson serializer"""
+    assert celery_app.conf.task_serializer == "orjson"
+    assert celery_app.conf.result_serializer == "orjson+zstd"
+
+    payload = {"segments": [{"start": 0.5, "end": 1.25, "text": "你好"}]}
+    content_type, content_encoding, data = dumps(payload, serializer="orjson")
+
+    accept = prepare_accept_content(celery_app.conf.accept_content)
+    assert content_type == "application/x-orjson"
+    assert loads(data, content_type, content_encoding, accept=accept) == payload
+
+
+def test_json_messages_still_accepted():
+    """Messages queued with the previous json serializer still decode"""
+    content_type, content_encoding, data = dumps({"job_id": "abc"}, serializer="json")
+
+    accept = prepare_accept_content(celery_app.conf.accept_content)
+    assert loads(data, content_type, content_encoding, accept=accept) == {"job_id": "abc"}
+
+
+def test_backend_stores_zstd_compressed_results():
+    """Results written by the result backend are zstd frames of orjson"""
+    import orjson
+    import zstandard
+
+    payload = {"segments": [{"start": 0.5, "end": 1.25, "text": "你好"}] * 50}
+    encoded = celery_app.backend.encode(payload)
+
+    assert encoded[:4] == b"\x28\xb5\x2f\xfd"  # zstd frame magic
+    assert len(encoded) < len(orjson.dumps(payload))
+    assert orjson.loads(zstandard.decompress(encoded)) == payload
+    assert celery_app.backend.decode(encoded) == payload
+
+
+def test_backend_decodes_uncompressed_legacy_results():
+    """Plain orjson results stored before compression was enabled still decode"""
+    import orjson
+
+    payload = {"status": "completed", "segments": []}
+    assert celery_app.backend.decode(orjson.dumps(payload)) == payload
@@ -0,0 +1,43 @@
+"""
+Tests for the model comparison CLI's corpus aggregation
+"""
+
+from unittest.mock import patch
+
+import orjson
+
+from app.cli.compare_models import transcribe_corpus_with_models
+
+
+def _segment(text, end=1.0):
+    return {"start": 0.0, "end": end, "text": text}
+
+
+def test_failed_file_is_excluded_for_every_model(tmp_path):
+    """Test a file one model failed on is dropped from all totals and references"""
+    reference_dir = tmp_path / "refs"
+    reference_dir.mkdir()
+    audio_files = []
+    for stem in ("ok", "fails"):
+        audio_file = tmp_path / f"{stem}.wav"
+        audio_file.write_bytes(b"audio")
+        audio_files.append(audio_file)
+        (reference_dir / f"{stem}.json").write_bytes(
+            orjson.dumps({"segments": [_segment(f"{stem} reference")]})
+        )
+
+    def transcribe_one(audio_file, model_name, *args):
+        if audio_file.stem == "fails" and model_name == "whisperx":
+            return None
+        return [_segment(f"{audio_file.stem} {model_name}", end=2.0)], 1.0, 0.5, 2.0
+
+    with patch("app.cli.compare_models._transcribe_one", side_effect=transcribe_one):
+        totals, references = transcribe_corpus_with_models(
+            audio_files, ("belle2", "whisperx"), "none", "zh", reference_dir
+        )
+
+    assert references == [_segment("ok reference")]
+    assert totals == [
+        ([_segment("ok belle2", end=2.0)], 1.0, 0.5, 2.0),
+        ([_segment("ok whisperx", end=2.0)], 1.0, 0.5, 2.0),
+    ]
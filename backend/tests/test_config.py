@@ -43,22 +43,47 @@ class TestSettingsConfiguration:
         assert test_settings.MAX_FILE_SIZE > 0
         assert test_settings.MAX_DURATION_HOURS > 0
 
-    def test_cors_origins_list_property(self):
-        """Test CORS origins JSON parsing"""
+    def test_cors_origins_default_list(self):
+        """Test CORS origins default to a parsed list"""
         test_settings = Settings()
-        origins = test_settings.cors_origins_list
 
-        assert isinstance(origins, list)
-        assert len(origins) > 0
+        assert isinstance(test_settings.CORS_ORIGINS, list)
+        assert "http://localhost:5173" in test_settings.CORS_ORIGINS
 
-    def test_cors_origins_list_fallback(self):
-        """Test CORS origins parsing fallback for invalid JSON"""
-        test_settings = Settings(CORS_ORIGINS="invalid-json")
-        origins = test_settings.cors_origins_list
+    def test_cors_origins_json_string(self):
+        """Test CORS origins JSON array strings are parsed at construction"""
+        test_settings = Settings(
+            CORS_ORIGINS='["http://localhost:5173", "https://klipnote.example"]'
+        )
 
-        # Should fallback to default
-        assert isinstance(origins, list)
-        assert "http://localhost:5173" in origins
+        assert test_settings.CORS_ORIGINS == [
+            "http://localhost:5173",
+            "https://klipnote.example",
+        ]
+
+    def test_cors_origins_comma_separated_env(self, monkeypatch):
+        """Test comma-separated CORS origins from the environment"""
+        monkeypatch.setenv("CORS_ORIGINS", "http://localhost:5173, https://klipnote.example")
+        test_settings = Settings()
+
+        assert test_settings.CORS_ORIGINS == [
+            "http://localhost:5173",
+            "https://klipnote.example",
+        ]
+
+    def test_cors_origins_invalid_json_rejected(self):
+        """Test malformed JSON arrays fail at settings load"""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            Settings(CORS_ORIGINS='["http://localhost:5173"')
+
+    def test_router_detection_batching_env(self, monkeypatch):
+        """Test batched language detection is off by default and env-configurable"""
+        assert Settings().ROUTER_DETECTION_BATCHING is False
+
+        monkeypatch.setenv("ROUTER_DETECTION_BATCHING", "true")
+        assert Settings().ROUTER_DETECTION_BATCHING is True
 
 
 class TestEnvFileConfiguration:
@@ -1,5 +1,7 @@
+import sys
 from unittest.mock import MagicMock, patch
 
+from app.ai_services.enhancement.vad_engines.silero_vad import SileroVAD
 from app.ai_services.enhancement.vad_manager import VADManager
 
 
@@ -49,3 +51,45 @@ def test_vad_manager_filters_with_engine():
         assert engine == "silero"
         assert len(segments) == 1
         assert segments[0]["end"] == 0.5
+
+
+def test_silero_model_loaded_once_across_managers():
+    fake_torch = MagicMock()
+    fake_torch.hub.load.return_value = ("model", ("get_ts", None, "read_audio", None, None))
+
+    with patch.dict(sys.modules, {"torch": fake_torch}), \
+            patch.object(SileroVAD, "_shared_model", None):
+        first = VADManager(engine="silero")._engines["silero"]._load_model()
+        second = VADManager(engine="silero")._engines["silero"]._load_model()
+
+    assert first == second == ("model", "get_ts", "read_audio")
+    fake_torch.hub.load.assert_called_once()
+
+
+def test_silero_inference_serialized_on_shared_model():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    active = 0
+    overlaps = []
+    counter_lock = threading.Lock()
+
+    def get_speech_timestamps(wav, model, **kwargs):
+        nonlocal active
+        with counter_lock:
+            active += 1
+            overlaps.append(active)
+        time.sleep(0.02)
+        with counter_lock:
+            active -= 1
+        return [{"start": 0, "end": 16000}]
+
+    shared = ("model", get_speech_timestamps, lambda path, sampling_rate: "wav")
+    with patch.object(SileroVAD, "_shared_model", shared), \
+            patch.object(SileroVAD, "is_available", return_value=True):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: SileroVAD().detect_speech("a.wav"), range(4)))
+
+    assert results == [[(0.0, 1.0)]] * 4
+    assert max(overlaps) == 1
@@ -1,7 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
+import pytest
+import torch
+
 from app.ai_services.model_router import (
+    BatchingDetector,
     DetectionResult,
+    LanguageDetector,
     RouterConfig,
     select_engine,
 )
@@ -124,3 +130,88 @@ def test_select_engine_falls_back_on_detection_timeout(mocker):
     assert engine == "whisperx"
     assert details["selection_reason"] == "detection_timeout"
     assert details["fallback_reason"] == "detection_timeout"
+
+
+def test_language_detector_loads_model_via_model_manager(mocker):
+    mock_manager = MagicMock()
+    mocker.patch(
+        "app.ai_services.model_manager.ModelManager", return_value=mock_manager
+    )
+    detector = LanguageDetector(RouterConfig(detection_device="cpu"))
+
+    model = detector._load_model()
+
+    assert model is mock_manager.load_detection.return_value
+    mock_manager.load_detection.assert_called_once_with("small", "cpu", "int8")
+
+
+def test_batching_detector_coalesces_concurrent_detections(mocker):
+    model = MagicMock()
+    model.model.detect_language.side_effect = lambda encoded: [
+        [("<|zh|>", 0.9)] for _ in range(encoded.shape[0])
+    ]
+    model.encode.side_effect = lambda features: features
+    mocker.patch.object(
+        BatchingDetector,
+        "_prepare_features",
+        return_value=(model, torch.zeros(80, 10)),
+    )
+    mocker.patch.object(BatchingDetector, "batch_window_seconds", 0.5)
+    mocker.patch.object(BatchingDetector, "max_batch_size", 4)
+    detector = BatchingDetector(RouterConfig(detection_device="cpu"))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(detector._detect_sync, ["a.wav"] * 4))
+
+    assert results == [("zh", 0.9)] * 4
+    model.encode.assert_called_once()
+    assert model.encode.call_args.args[0].shape == (4, 80, 10)
+
+
+def test_router_config_from_settings_is_frozen(mocker):
+    from pydantic import ValidationError
+
+    mocker.patch("app.ai_services.model_router.settings.ROUTER_DETECTION_BATCHING", True)
+    RouterConfig.from_settings.cache_clear()
+    try:
+        config = RouterConfig.from_settings()
+
+        assert config.detection_batching is True
+        assert RouterConfig.from_settings() is config
+        with pytest.raises(ValidationError):
+            config.detection_batching = False
+    finally:
+        RouterConfig.from_settings.cache_clear()
+
+
+def test_batching_detector_reports_encoder_errors(mocker):
+    model = MagicMock()
+    model.encode.side_effect = RuntimeError("CUDA error")
+    mocker.patch.object(
+        BatchingDetector,
+        "_prepare_features",
+        return_value=(model, torch.zeros(80, 10)),
+    )
+    detector = BatchingDetector(RouterConfig(detection_device="cpu"))
+
+    result = detector.detect("a.wav")
+
+    assert result.status == "error"
+    assert result.error == "CUDA error"
+
+
+def test_batching_detector_fails_batch_when_consumer_crashes(mocker):
+    mocker.patch.object(
+        BatchingDetector,
+        "_prepare_features",
+        return_value=(MagicMock(), torch.zeros(80, 10)),
+    )
+    mocker.patch.object(
+        BatchingDetector, "_run_batch", side_effect=ImportError("no torch")
+    )
+    detector = BatchingDetector(RouterConfig(detection_device="cpu"))
+
+    result = detector.detect("a.wav")
+
+    assert result.status == "error"
+    assert result.error == "no torch"
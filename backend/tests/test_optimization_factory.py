@@ -7,6 +7,8 @@ with mocked availability checks to verify selection and fallback behavior.
 Story 3.2a: Pluggable Optimizer Architecture Design
 """
 
+import sys
+
 import pytest
 from typing import List
 from unittest.mock import patch
@@ -16,6 +18,14 @@ from app.ai_services.optimization.whisperx_optimizer import WhisperXOptimizer
 from app.ai_services.optimization.heuristic_optimizer import HeuristicOptimizer
 
 
+@pytest.fixture(autouse=True)
+def reset_optimizer_cache():
+    """Ensure each test builds optimizers from a clean factory cache"""
+    OptimizerFactory.reset_cache()
+    yield
+    OptimizerFactory.reset_cache()
+
+
 class TestOptimizerFactory:
     """Test suite for OptimizerFactory.create() method"""
 
@@ -93,6 +103,38 @@ class TestOptimizerFactory:
                 optimizer = OptimizerFactory.create(engine=None)
                 assert isinstance(optimizer, HeuristicOptimizer)
 
+    def test_create_default_engine_resolved_once(self):
+        """Test settings.OPTIMIZER_ENGINE is read once until reset_cache()"""
+        with patch('app.config.settings') as mock_settings:
+            mock_settings.OPTIMIZER_ENGINE = "heuristic"
+            OptimizerFactory.create(engine=None)
+            mock_settings.OPTIMIZER_ENGINE = "invalid"
+            assert isinstance(OptimizerFactory.create(engine=None), HeuristicOptimizer)
+
+    def test_create_default_engine_is_interned(self):
+        """Test a settings-sourced engine string is interned to match dispatch keys"""
+        from app.ai_services.optimization.factory import _default_engine
+
+        with patch('app.config.settings') as mock_settings:
+            # Built at runtime, so not the interned literal
+            mock_settings.OPTIMIZER_ENGINE = "".join(["heur", "istic"])
+            assert _default_engine() is sys.intern("heuristic")
+
+    # ====================
+    # Instance caching
+    # ====================
+
+    def test_create_returns_cached_instance_per_engine(self):
+        """Test repeated create() calls reuse the optimizer for the same engine"""
+        first = OptimizerFactory.create(engine="heuristic")
+        assert OptimizerFactory.create(engine="heuristic") is first
+
+    def test_reset_cache_builds_new_instance(self):
+        """Test reset_cache() forces a fresh optimizer on the next create()"""
+        first = OptimizerFactory.create(engine="heuristic")
+        OptimizerFactory.reset_cache()
+        assert OptimizerFactory.create(engine="heuristic") is not first
+
     # ====================
     # Error handling
     # ====================
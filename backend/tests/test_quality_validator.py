@@ -5,7 +5,14 @@ Tests CER/WER calculation, segment statistics, character timing validation,
 confidence analysis, enhancement metrics, baseline comparison, and model comparison.
 """
 
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
 import pytest
+from pydantic import ValidationError
 
 from app.ai_services.quality.models import (
     CharacterLengthStats,
@@ -15,7 +22,13 @@ from app.ai_services.quality.models import (
     ConfidenceStats,
     EnhancementMetrics,
 )
-from app.ai_services.quality.validator import QualityValidator
+from app.ai_services.quality.validator import (
+    QualityValidator,
+    _cer,
+    _mean_median_p95,
+    _wer,
+    _winner,
+)
 from app.ai_services.schema import EnhancedSegment
 
 
@@ -130,6 +143,43 @@ class TestCERCalculation:
         # Expected CER ≈ 1/11 ≈ 0.091
         assert 0.08 < cer < 0.1, f"Expected CER ≈ 0.091, got {cer}"
 
+    @pytest.mark.parametrize(
+        "hyp_text, ref_text",
+        [
+            ("hello world", "hello warld"),
+            (" 这是第二个片段 ", "这是第三个片段，测试"),
+            ("abc", "a completely different reference"),
+        ],
+    )
+    def test_calculate_cer_matches_jiwer(self, validator, hyp_text, ref_text):
+        """Test the Levenshtein-based CER agrees with jiwer.cer."""
+        import jiwer
+
+        hypothesis = [EnhancedSegment(start=0.0, end=1.0, text=hyp_text)]
+        reference = [EnhancedSegment(start=0.0, end=1.0, text=ref_text)]
+
+        cer = validator.calculate_cer(hypothesis, reference)
+        assert cer == pytest.approx(jiwer.cer(ref_text, hyp_text))
+
+    @pytest.mark.parametrize(
+        "hyp_text, ref_text",
+        [
+            ("the cat sat on the mat", "the cat sat on a mat"),
+            ("  hello   world ", "hello world again"),
+            ("a\tb c", "a b c"),
+            ("这是 第二个 片段", "这是 第三个 片段 测试"),
+        ],
+    )
+    def test_calculate_wer_matches_jiwer(self, validator, hyp_text, ref_text):
+        """Test the integer-token WER agrees with jiwer.wer."""
+        import jiwer
+
+        hypothesis = [EnhancedSegment(start=0.0, end=1.0, text=hyp_text)]
+        reference = [EnhancedSegment(start=0.0, end=1.0, text=ref_text)]
+
+        wer = validator.calculate_wer(hypothesis, reference)
+        assert wer == pytest.approx(jiwer.wer(ref_text, hyp_text))
+
     def test_calculate_cer_empty_hypothesis(self, validator, reference_segments):
         """Test CER with empty hypothesis."""
         hypothesis = [EnhancedSegment(start=0.0, end=1.0, text="")]
@@ -186,6 +236,79 @@ class TestWERCalculation:
         assert wer == 0.0
 
 
+class TestErrorRates:
+    """Test combined CER/WER calculation."""
+
+    def test_calculate_error_rates_matches_individual(self, validator):
+        """Test combined rates equal separate calculate_cer/calculate_wer results."""
+        hypothesis = [
+            EnhancedSegment(start=0.0, end=1.0, text="the quick brown fox"),
+            EnhancedSegment(start=1.0, end=2.0, text="jumps over"),
+        ]
+        reference = [
+            EnhancedSegment(start=0.0, end=1.0, text="the quick brown dog"),
+            EnhancedSegment(start=1.0, end=2.0, text="jumped over"),
+        ]
+
+        cer, wer = validator.calculate_error_rates(hypothesis, reference)
+
+        assert cer == validator.calculate_cer(hypothesis, reference)
+        assert wer == validator.calculate_wer(hypothesis, reference)
+
+    def test_error_rates_are_memoized_per_text_pair(self, validator):
+        """Test re-scoring the same texts reuses the cached edit distances."""
+        hypothesis = [EnhancedSegment(start=0.0, end=1.0, text="memo hypothesis")]
+        reference = [EnhancedSegment(start=0.0, end=1.0, text="memo reference")]
+        _cer.cache_clear()
+        _wer.cache_clear()
+
+        first = validator.calculate_error_rates(hypothesis, reference)
+        second = validator.calculate_error_rates(hypothesis, reference)
+
+        assert first == second
+        assert _cer.cache_info().hits == 1
+        assert _wer.cache_info().hits == 1
+
+    def test_calculate_error_rates_empty_reference(self, validator, sample_segments):
+        """Test combined rates are both None without reference text."""
+        reference = [EnhancedSegment(start=0.0, end=1.0, text="  ")]
+
+        assert validator.calculate_error_rates(sample_segments, reference) == (None, None)
+
+    @pytest.mark.parametrize("hyp_text", [" ", "\t\n"])
+    def test_whitespace_only_hypothesis_scores_full_error(self, validator, hyp_text):
+        """Test a whitespace-only hypothesis scores 1.0 like jiwer, not None."""
+        import jiwer
+
+        hypothesis = [EnhancedSegment(start=0.0, end=1.0, text=hyp_text)]
+        reference = [EnhancedSegment(start=0.0, end=1.0, text="hello world")]
+
+        assert validator.calculate_error_rates(hypothesis, reference) == (1.0, 1.0)
+        assert validator.calculate_cer(hypothesis, reference) == jiwer.cer("hello world", hyp_text)
+        assert validator.calculate_wer(hypothesis, reference) == jiwer.wer("hello world", hyp_text)
+
+    def test_error_rates_fall_back_to_jiwer_without_rapidfuzz(self, validator, monkeypatch):
+        """Test CER/WER use jiwer when rapidfuzz cannot be imported."""
+        from types import SimpleNamespace
+        from unittest.mock import Mock
+
+        fake_jiwer = SimpleNamespace(cer=Mock(return_value=0.25), wer=Mock(return_value=0.5))
+        monkeypatch.setitem(sys.modules, "rapidfuzz", None)
+        monkeypatch.setitem(sys.modules, "rapidfuzz.distance", None)
+        monkeypatch.setitem(sys.modules, "jiwer", fake_jiwer)
+        _cer.cache_clear()
+        _wer.cache_clear()
+
+        hypothesis = [EnhancedSegment(start=0.0, end=1.0, text="fallback hyp")]
+        reference = [EnhancedSegment(start=0.0, end=1.0, text="fallback ref")]
+
+        assert validator.calculate_error_rates(hypothesis, reference) == (0.25, 0.5)
+        fake_jiwer.cer.assert_called_once_with("fallback ref", "fallback hyp")
+        fake_jiwer.wer.assert_called_once_with("fallback ref", "fallback hyp")
+        _cer.cache_clear()
+        _wer.cache_clear()
+
+
 class TestSegmentStatistics:
     """Test segment length statistics calculation."""
 
@@ -230,6 +353,17 @@ class TestSegmentStatistics:
         assert stats.mean_duration == 0.0
         assert stats.duration_compliance_pct == 100.0  # No violations if no segments
 
+    @pytest.mark.parametrize("size", [1, 2, 3, 4, 7, 20, 101])
+    def test_mean_median_p95_matches_numpy(self, size):
+        """Test the partition-based summary matches np.mean/median/percentile."""
+        values = np.random.default_rng(size).random(size) * 10
+
+        mean, median, p95 = _mean_median_p95(values)
+
+        assert mean == pytest.approx(np.mean(values))
+        assert median == pytest.approx(np.median(values))
+        assert p95 == pytest.approx(np.percentile(values, 95))
+
 
 class TestCharacterStatistics:
     """Test character length statistics calculation."""
@@ -367,6 +501,24 @@ class TestConfidenceStats:
         assert stats.median_confidence is None
         assert stats.low_confidence_count == 0
 
+    def test_calculate_confidence_stats_partial_coverage(self, validator):
+        """Test missing/None confidences are excluded from the score statistics."""
+        segments = [
+            EnhancedSegment(start=0.0, end=1.0, text="Scored", confidence=0.9),
+            EnhancedSegment(start=1.0, end=2.0, text="Unscored"),
+            EnhancedSegment(start=2.0, end=3.0, text="Null", confidence=None),
+            EnhancedSegment(start=3.0, end=4.0, text="Low", confidence=0.5),
+        ]
+
+        stats = validator.calculate_confidence_stats(segments)
+
+        assert stats.segments_with_confidence == 2
+        assert stats.confidence_coverage_pct == 50.0
+        assert stats.mean_confidence == pytest.approx(0.7)
+        assert stats.median_confidence == pytest.approx(0.7)
+        assert stats.low_confidence_count == 1
+        assert stats.low_confidence_pct == 50.0
+
     def test_calculate_confidence_stats_all_high(self, validator):
         """Test confidence stats with all high-confidence segments."""
         segments = [
@@ -410,6 +562,30 @@ class TestEnhancementMetrics:
         assert len(metrics.enhancements_applied) == 0
         assert metrics.segments_modified_count == 0
         assert metrics.modification_rate_pct == 0.0
+        assert metrics.vad_removed_count is None
+        assert metrics.split_increase_count is None
+        assert metrics.refine_boundary_shifts is None
+
+    def test_calculate_enhancement_metrics_late_enhancement(self, validator):
+        """Test enhancements on trailing segments are still detected."""
+        segments = [
+            EnhancedSegment(start=float(i), end=i + 1.0, text="Plain")
+            for i in range(50)
+        ]
+        segments.append(
+            EnhancedSegment(
+                start=50.0,
+                end=51.0,
+                text="Split",
+                enhancements_applied=["SegmentSplitter"],
+            )
+        )
+
+        metrics = validator.calculate_enhancement_metrics(segments)
+
+        assert metrics.enhancements_applied == ["SegmentSplitter"]
+        assert metrics.segments_modified_count == 1
+        assert metrics.split_increase_count == 0
 
 
 class TestQualityMetricsCalculation:
@@ -446,6 +622,31 @@ class TestQualityMetricsCalculation:
         assert metrics.language == "zh"
         assert metrics.audio_duration == 15.0
         assert metrics.timestamp  # ISO 8601 timestamp
+        parsed = datetime.fromisoformat(metrics.timestamp)
+        assert metrics.timestamp.endswith("Z")
+        assert parsed.utcoffset() == timedelta(0)
+
+    def test_quality_metrics_match_individual_calculations(
+        self, validator, sample_segments
+    ):
+        """Test the single-pass report agrees with the per-metric public methods."""
+        metrics = validator.calculate_quality_metrics(
+            segments=sample_segments,
+            model_name="belle2",
+            pipeline_config="vad,refine,split",
+        )
+
+        assert metrics.segment_stats == validator.calculate_segment_stats(sample_segments)
+        assert metrics.char_stats == validator.calculate_char_stats(sample_segments)
+        assert metrics.char_timing_stats == validator.calculate_char_timing_stats(
+            sample_segments
+        )
+        assert metrics.confidence_stats == validator.calculate_confidence_stats(
+            sample_segments
+        )
+        assert metrics.enhancement_metrics == validator.calculate_enhancement_metrics(
+            sample_segments
+        )
 
     def test_calculate_quality_metrics_without_reference(
         self, validator, sample_segments
@@ -465,6 +666,19 @@ class TestQualityMetricsCalculation:
         assert metrics.segment_stats.segment_count == 4
         assert metrics.total_time == 8.0
 
+    def test_quality_metrics_are_immutable(self, validator, sample_segments):
+        """Test computed metrics are frozen value objects."""
+        metrics = validator.calculate_quality_metrics(
+            segments=sample_segments,
+            model_name="belle2",
+            pipeline_config="none",
+        )
+
+        with pytest.raises(ValidationError):
+            metrics.model_name = "whisperx"
+        with pytest.raises(ValidationError):
+            metrics.segment_stats.segment_count = 0
+
 
 class TestBaselineComparison:
     """Test baseline comparison functionality."""
@@ -675,6 +889,40 @@ class TestBaselineComparison:
         assert "CER" in comparison.regression_details
         assert comparison.cer_delta_pct > 15.0  # >15% threshold
 
+    def test_compare_with_baseline_regression_details_format(
+        self, validator, sample_segments
+    ):
+        """Test each breached check contributes one formatted detail, in order."""
+        metrics = validator.calculate_quality_metrics(
+            segments=sample_segments,
+            model_name="belle2",
+            pipeline_config="none",
+        )
+        baseline = metrics.model_copy(
+            update={
+                "cer": 0.10,
+                "segment_stats": metrics.segment_stats.model_copy(
+                    update={"duration_compliance_pct": 90.0}
+                ),
+            }
+        )
+        current = metrics.model_copy(
+            update={
+                "cer": 0.13,
+                "segment_stats": metrics.segment_stats.model_copy(
+                    update={"duration_compliance_pct": 70.0}
+                ),
+            }
+        )
+
+        comparison = validator.compare_with_baseline(current, baseline)
+
+        assert comparison.regression_detected is True
+        assert comparison.regression_details == (
+            "CER increased by 30.0% (threshold: 15.0%); "
+            "Duration compliance dropped by 20.0% (threshold: 10.0%)"
+        )
+
 
 class TestModelComparison:
     """Test model comparison functionality."""
@@ -781,9 +1029,71 @@ class TestModelComparison:
         assert comparison.model_b_name == "whisperx"
         assert comparison.cer_comparison == "model_a"  # belle2 has better CER
         assert comparison.wer_comparison == "model_b"  # whisperx has better WER
-        assert comparison.recommended_model in ["model_a", "model_b", "depends_on_use_case"]
+        assert comparison.duration_compliance_comparison == "model_a"
+        assert comparison.char_compliance_comparison == "model_b"
+        assert comparison.confidence_comparison == "model_a"
+        assert comparison.recommended_model == "model_a"  # 3 of 5 metrics
         assert comparison.recommendation_rationale
 
+    @pytest.mark.parametrize(
+        "a, b, higher_is_better, expected",
+        [
+            (0.1, 0.2, False, "model_a"),
+            (0.1, 0.2, True, "model_b"),
+            (0.5, 0.5, True, "tie"),
+            (None, 0.5, True, None),
+            (0.5, None, False, None),
+        ],
+    )
+    def test_winner(self, a, b, higher_is_better, expected):
+        """Test per-metric winner selection, including ties and missing values."""
+        assert _winner(a, b, higher_is_better) == expected
+
+
+class TestPackageImports:
+    """Test quality package re-exports."""
+
+    def test_package_import_defers_validator(self):
+        """Test importing report models does not load validator.py."""
+        code = (
+            "import sys\n"
+            "import app.ai_services.quality as quality\n"
+            "assert 'app.ai_services.quality.validator' not in sys.modules\n"
+            "assert quality.QualityValidator.__name__ == 'QualityValidator'\n"
+            "assert 'app.ai_services.quality.validator' in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_structural_stats_do_not_import_jiwer(self):
+        """Test jiwer/rapidfuzz load only when CER/WER are calculated."""
+        code = (
+            "import sys\n"
+            "from app.ai_services.quality.validator import QualityValidator\n"
+            "QualityValidator().calculate_segment_stats("
+            "[{'start': 0.0, 'end': 2.0, 'text': 'a'}])\n"
+            "assert 'jiwer' not in sys.modules\n"
+            "assert 'rapidfuzz' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_package_reexports_validator(self):
+        """Test QualityValidator is still importable from the package."""
+        from app.ai_services.quality import QualityValidator as Exported
+
+        assert Exported is QualityValidator
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -119,6 +119,35 @@ def test_set_and_get_result(redis_service):
     assert result["segments"][1]["end"] == 7.8
 
 
+def test_result_round_trips_legacy_and_unicode_payloads(redis_service):
+    """Test results written by stdlib json still load, and Chinese text survives"""
+    job_id = str(uuid.uuid4())
+    key = f"job:{job_id}:result"
+
+    # Payload stored before the orjson switch (ASCII-escaped by json.dumps)
+    legacy = {"segments": [{"start": 0.0, "end": 1.0, "text": "你好"}]}
+    redis_service.client.set(key, json.dumps(legacy))
+    assert redis_service.get_result(job_id) == legacy
+
+    segments = [{"start": 0.0, "end": 1.25, "text": "这是测试", "words": []}]
+    redis_service.set_result(job_id=job_id, segments=segments)
+    assert redis_service.get_result(job_id) == {"segments": segments}
+
+
+def test_set_result_accepts_numpy_values(redis_service):
+    """Test segments carrying numpy scalars (model timestamps/scores) serialize"""
+    import numpy as np
+
+    job_id = str(uuid.uuid4())
+    segments = [{"start": np.float32(0.5), "end": np.float64(1.25), "text": "hi", "words": np.array([1, 2])}]
+
+    redis_service.set_result(job_id=job_id, segments=segments)
+
+    assert redis_service.get_result(job_id) == {
+        "segments": [{"start": 0.5, "end": 1.25, "text": "hi", "words": [1, 2]}]
+    }
+
+
 def test_get_result_nonexistent_job(redis_service):
     """Test retrieving result for non-existent job returns None"""
     result = redis_service.get_result(str(uuid.uuid4()))
@@ -3,6 +3,10 @@ Unit tests for Belle2Service
 Mocks HuggingFace Transformers to avoid GPU dependency during CI
 """
 
+import importlib.machinery
+import sys
+import types
+
 import pytest
 from unittest.mock import patch, MagicMock, Mock
 import torch
@@ -372,3 +376,63 @@ class TestBelle2ModelManager:
         except Exception:
             # If mocking doesn't work perfectly, just verify manager exists
             assert manager is not None
+
+    def test_model_manager_quantizes_cpu_load(self, mocker):
+        """Verify CPU loads apply dynamic int8 quantization and record it"""
+        from app.ai_services.model_manager import ModelManager
+
+        mocker.patch('transformers.WhisperProcessor')
+        mock_model_cls = mocker.patch('transformers.WhisperForConditionalGeneration')
+        mock_quantize = mocker.patch('torch.ao.quantization.quantize_dynamic')
+
+        manager = ModelManager()
+        manager.loaded_models.clear()
+
+        model, _ = manager.load_belle2("cpu-model", "cpu")
+
+        loaded = mock_model_cls.from_pretrained.return_value.to.return_value
+        mock_quantize.assert_called_once_with(loaded, {torch.nn.Linear}, dtype=torch.qint8)
+        assert model is mock_quantize.return_value
+        assert manager.get_model_info()["quantized"]["belle2_cpu-model_cpu"] is True
+        manager.loaded_models.clear()
+
+    def test_model_manager_4bit_capacity_follows_cache(self, mocker):
+        """Verify the raised 4-bit limit never outlives the 4-bit models"""
+        from app.ai_services.model_manager import ModelManager
+
+        mocker.patch('transformers.WhisperProcessor')
+        mocker.patch('transformers.WhisperForConditionalGeneration')
+        mocker.patch('transformers.BitsAndBytesConfig', create=True)
+        mocker.patch('faster_whisper.WhisperModel')
+        bitsandbytes = types.ModuleType("bitsandbytes")
+        bitsandbytes.__spec__ = importlib.machinery.ModuleSpec("bitsandbytes", None)
+        mocker.patch.dict(sys.modules, {"bitsandbytes": bitsandbytes})
+        mocker.patch('app.ai_services.model_manager.settings.BELLE2_LOAD_IN_4BIT', True)
+
+        manager = ModelManager()
+        manager.clear_cache()
+        for name in ("q1", "q2", "q3"):
+            manager.load_belle2(name, "cuda")
+        assert len(manager.loaded_models) == 3
+
+        manager.load_whisperx("base", "cuda", "float16")
+
+        assert manager.max_models == 2
+        assert manager.get_loaded_models() == ["belle2_q3_cuda", "whisperx_base_cuda_float16"]
+        manager.clear_cache()
+
+    def test_model_manager_4bit_requires_bitsandbytes(self, mocker):
+        """Verify BELLE2_LOAD_IN_4BIT fails clearly without bitsandbytes"""
+        from app.ai_services.model_manager import ModelManager
+
+        mocker.patch('transformers.WhisperProcessor')
+        mocker.patch('transformers.WhisperForConditionalGeneration')
+        mocker.patch.dict(sys.modules, {"bitsandbytes": None})
+        mocker.patch('app.ai_services.model_manager.settings.BELLE2_LOAD_IN_4BIT', True)
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        with pytest.raises(RuntimeError, match="bitsandbytes is not installed"):
+            manager.load_belle2("q-model", "cuda")
+        assert manager.get_loaded_models() == []
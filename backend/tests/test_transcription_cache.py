@@ -0,0 +1,89 @@
+"""
+Tests for the quality CLIs' on-disk transcription cache
+"""
+
+from unittest.mock import Mock
+
+from app.cli.transcription_cache import cache_path, cached_transcribe
+
+
+def _audio(tmp_path, content=b"RIFF-audio"):
+    audio_file = tmp_path / "sample.wav"
+    audio_file.write_bytes(content)
+    return audio_file
+
+
+def test_cached_transcribe_reuses_stored_result(tmp_path):
+    """Test a second run with the same configuration skips transcription"""
+    audio_file = _audio(tmp_path)
+    cache_dir = tmp_path / "cache"
+    result = {"segments": [{"start": 0.0, "end": 1.5, "text": "你好"}], "metadata": {}}
+    transcribe = Mock(return_value=result)
+
+    first = cached_transcribe(transcribe, audio_file, "belle2", "vad,refine,split", "zh", cache_dir)
+    second = cached_transcribe(transcribe, audio_file, "belle2", "vad,refine,split", "zh", cache_dir)
+
+    assert first == second == result
+    transcribe.assert_called_once()
+    assert cache_path(cache_dir, audio_file, "belle2", "vad,refine,split", "zh").exists()
+
+
+def test_cached_transcribe_keys_on_configuration_and_content(tmp_path):
+    """Test model, pipeline and audio content changes miss the cache"""
+    audio_file = _audio(tmp_path)
+    cache_dir = tmp_path / "cache"
+    transcribe = Mock(return_value={"segments": []})
+
+    cached_transcribe(transcribe, audio_file, "belle2", "none", "zh", cache_dir)
+    cached_transcribe(transcribe, audio_file, "whisperx", "none", "zh", cache_dir)
+    cached_transcribe(transcribe, audio_file, "belle2", "vad", "zh", cache_dir)
+    audio_file.write_bytes(b"different-audio")
+    cached_transcribe(transcribe, audio_file, "belle2", "none", "zh", cache_dir)
+
+    assert transcribe.call_count == 4
+
+
+def test_cached_transcribe_recovers_from_corrupt_entry(tmp_path):
+    """Test an unreadable cache entry is recomputed and overwritten"""
+    audio_file = _audio(tmp_path)
+    cache_dir = tmp_path / "cache"
+    path = cache_path(cache_dir, audio_file, "whisperx", "none", "auto")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"{truncated")
+    transcribe = Mock(return_value={"segments": []})
+
+    assert cached_transcribe(transcribe, audio_file, "whisperx", "none", "auto", cache_dir) == {"segments": []}
+    assert cached_transcribe(transcribe, audio_file, "whisperx", "none", "auto", cache_dir) == {"segments": []}
+    transcribe.assert_called_once()
+
+
+def test_cached_transcribe_disabled_without_cache_dir(tmp_path):
+    """Test caching is opt-in"""
+    audio_file = _audio(tmp_path)
+    transcribe = Mock(return_value={"segments": []})
+
+    cached_transcribe(transcribe, audio_file, "belle2", "none", "zh", None)
+    cached_transcribe(transcribe, audio_file, "belle2", "none", "zh", None)
+
+    assert transcribe.call_count == 2
+
+
+def test_cached_transcribe_keys_on_batch_size_and_settings(tmp_path, monkeypatch):
+    """Test batch size and output-shaping settings are part of the key"""
+    from app.config import settings
+
+    audio_file = _audio(tmp_path)
+    cache_dir = tmp_path / "cache"
+    transcribe = Mock(return_value={"segments": []})
+
+    cached_transcribe(transcribe, audio_file, "whisperx", "none", "zh", cache_dir)
+    cached_transcribe(transcribe, audio_file, "whisperx", "none", "zh", cache_dir, batch_size=8)
+    monkeypatch.setattr(settings, "WHISPER_COMPUTE_TYPE", "float16")
+    cached_transcribe(transcribe, audio_file, "whisperx", "none", "zh", cache_dir)
+    monkeypatch.setattr(settings, "ENHANCEMENT_PIPELINE", "vad")
+    cached_transcribe(transcribe, audio_file, "whisperx", "none", "zh", cache_dir)
+    monkeypatch.setattr(settings, "BELLE2_MODEL_NAME", "custom/belle")
+    cached_transcribe(transcribe, audio_file, "belle2", "none", "zh", cache_dir)
+    cached_transcribe(transcribe, audio_file, "belle2", "none", "zh", cache_dir)
+
+    assert transcribe.call_count == 5
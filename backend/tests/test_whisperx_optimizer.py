@@ -9,36 +9,36 @@ Story 3.2b: WhisperX Integration Validation
 
 import pytest
 from unittest.mock import patch, MagicMock, mock_open
-from app.ai_services.optimization.whisperx_optimizer import WhisperXOptimizer
+from app.ai_services.optimization.whisperx_optimizer import (
+    WhisperXOptimizer,
+    _cuda_available,
+    _has_module,
+    _whisperx_available,
+)
 from app.ai_services.optimization.base import OptimizationResult
 
+MODULE = 'app.ai_services.optimization.whisperx_optimizer'
+
 
 class TestWhisperXOptimizerAvailability:
     """Test WhisperXOptimizer.is_available() dependency checking"""
 
+    def setup_method(self):
+        _whisperx_available.cache_clear()
+        _cuda_available.cache_clear()
+
+    def teardown_method(self):
+        _whisperx_available.cache_clear()
+        _cuda_available.cache_clear()
+
     def test_is_available_success(self):
         """Test is_available() returns True when dependencies installed and CUDA available"""
-        # Create a mock that simulates successful imports
-        def mock_import(name, *args, **kwargs):
-            if name == 'whisperx':
-                return MagicMock()
-            elif name == 'pyannote.audio':
-                return MagicMock()
-            elif name == 'torch':
-                mock_torch = MagicMock()
-                mock_torch.cuda.is_available.return_value = True
-                return mock_torch
-            return MagicMock()
-
-        with patch('builtins.__import__', side_effect=mock_import):
-            # Need to reload the is_available code with mocked imports
-            # Since is_available uses try/import, we patch at execution time
-            with patch('app.ai_services.optimization.whisperx_optimizer.torch') as mock_torch:
-                mock_torch.cuda.is_available.return_value = True
-                # Call is_available which will try to import
-                # For simplicity, just verify the logic works
-                # This test verifies the structure, actual import testing happens in integration
-                pass
+        mock_torch = MagicMock()
+        mock_torch.cuda.is_available.return_value = True
+
+        with patch(f'{MODULE}._has_module', return_value=True), \
+                patch.dict('sys.modules', {'torch': mock_torch}):
+            assert WhisperXOptimizer.is_available() is True
 
     def test_is_available_no_cuda(self):
         """Test is_available() returns False when CUDA unavailable"""
@@ -46,39 +46,54 @@ class TestWhisperXOptimizerAvailability:
         mock_torch = MagicMock()
         mock_torch.cuda.is_available.return_value = False
 
-        with patch.dict('sys.modules', {
-            'whisperx': MagicMock(),
-            'pyannote.audio': MagicMock(),
-            'torch': mock_torch
-        }):
+        with patch(f'{MODULE}._has_module', return_value=True), \
+                patch.dict('sys.modules', {'torch': mock_torch}):
             # is_available should return False when CUDA unavailable
             result = WhisperXOptimizer.is_available()
             assert result is False
 
     def test_is_available_import_error(self):
-        """Test is_available() returns False when imports fail"""
-        # Simulate ImportError by removing modules from sys.modules
-        with patch.dict('sys.modules', {
-            'whisperx': None,
-            'pyannote.audio': None,
-            'torch': None
-        }, clear=False):
-            # Force import to fail
-            import sys
-            original_modules = sys.modules.copy()
-
-            # Remove the modules to force ImportError
-            modules_to_remove = ['whisperx', 'pyannote.audio', 'pyannote', 'torch']
-            for mod in modules_to_remove:
-                if mod in sys.modules:
-                    del sys.modules[mod]
-
-            try:
-                result = WhisperXOptimizer.is_available()
-                assert result is False
-            finally:
-                # Restore sys.modules
-                sys.modules.update(original_modules)
+        """Test is_available() returns False without importing torch when packages are missing"""
+        mock_torch = MagicMock()
+
+        with patch(f'{MODULE}._has_module', side_effect=lambda name: name == 'torch'), \
+                patch.dict('sys.modules', {'torch': mock_torch}):
+            assert WhisperXOptimizer.is_available() is False
+
+        mock_torch.cuda.is_available.assert_not_called()
+
+    def test_has_module_does_not_import(self):
+        """Test _has_module() locates modules without executing them"""
+        import sys
+
+        assert _has_module('json') is True
+        assert _has_module('definitely_not_a_module_xyz') is False
+        assert 'definitely_not_a_module_xyz' not in sys.modules
+
+    def test_is_available_memoizes_probe(self):
+        """Test is_available() only probes dependencies once per process"""
+        mock_torch = MagicMock()
+        mock_torch.cuda.is_available.return_value = False
+
+        with patch(f'{MODULE}._has_module', return_value=True), \
+                patch.dict('sys.modules', {'torch': mock_torch}):
+            assert WhisperXOptimizer.is_available() is False
+            assert WhisperXOptimizer.is_available() is False
+
+        mock_torch.cuda.is_available.assert_called_once()
+
+    def test_cuda_probe_survives_dependency_recheck(self):
+        """Test the CUDA probe runs once even if the dependency check is re-run"""
+        mock_torch = MagicMock()
+        mock_torch.cuda.is_available.return_value = True
+
+        with patch(f'{MODULE}._has_module', return_value=True), \
+                patch.dict('sys.modules', {'torch': mock_torch}):
+            assert WhisperXOptimizer.is_available() is True
+            _whisperx_available.cache_clear()
+            assert WhisperXOptimizer.is_available() is True
+
+        mock_torch.cuda.is_available.assert_called_once()
 
 
 class TestWhisperXOptimizerInitialization:
@@ -89,9 +104,23 @@ class TestWhisperXOptimizerInitialization:
         """Test __init__() succeeds when dependencies available"""
         optimizer = WhisperXOptimizer()
 
-        assert optimizer.align_model is None
-        assert optimizer.align_metadata is None
-        assert optimizer._whisperx is None
+        assert len(optimizer._align_cache) == 0
+        # whisperx is imported lazily on first access, not in __init__
+        assert not hasattr(optimizer, "_whisperx_module")
+        # Slotted: no per-instance __dict__
+        assert not hasattr(optimizer, "__dict__")
+
+    @patch.object(WhisperXOptimizer, 'is_available', return_value=True)
+    def test_whisperx_module_imported_once(self, mock_is_available):
+        """Test the whisperx module is imported on first access and cached"""
+        optimizer = WhisperXOptimizer()
+        mock_module = MagicMock()
+
+        with patch.dict('sys.modules', {'whisperx': mock_module}):
+            assert optimizer._whisperx is mock_module
+
+        # Cached on the instance; no re-import once sys.modules is restored
+        assert optimizer._whisperx is mock_module
 
     @patch.object(WhisperXOptimizer, 'is_available', return_value=False)
     def test_init_fails_when_unavailable(self, mock_is_available):
@@ -188,8 +217,37 @@ class TestWhisperXOptimizerOptimize:
         assert mock_whisperx.load_align_model.call_count == 1  # Still 1, not 2
 
         # Verify model is cached
-        assert optimizer.align_model == mock_model
-        assert optimizer.align_metadata == mock_metadata
+        assert optimizer._align_cache["zh"] == (mock_model, mock_metadata)
+
+    @patch.object(WhisperXOptimizer, 'is_available', return_value=True)
+    def test_optimize_caches_align_model_per_language(self, mock_is_available):
+        """Test optimize() loads one alignment model per language with LRU eviction"""
+        optimizer = WhisperXOptimizer()
+
+        mock_whisperx = MagicMock()
+        mock_whisperx.load_align_model.side_effect = (
+            lambda language_code, device: (f"model_{language_code}", f"meta_{language_code}")
+        )
+        mock_whisperx.load_audio.return_value = "audio_data"
+        mock_whisperx.align.return_value = {
+            "segments": [{"start": 0.0, "end": 2.0, "text": "test", "words": []}]
+        }
+        optimizer._whisperx = mock_whisperx
+
+        test_segments = [{"start": 0.0, "end": 2.0, "text": "test"}]
+
+        optimizer.optimize(test_segments, "test.mp3", language="zh")
+        optimizer.optimize(test_segments, "test.mp3", language="en")
+        optimizer.optimize(test_segments, "test.mp3", language="zh")
+        assert mock_whisperx.load_align_model.call_count == 2
+
+        # The English model must be used for English audio, not the cached zh one
+        assert mock_whisperx.align.call_args_list[1].args[1] == "model_en"
+
+        # Third language evicts the least recently used one ("en")
+        optimizer.optimize(test_segments, "test.mp3", language="ja")
+        assert list(optimizer._align_cache) == ["zh", "ja"]
+        assert mock_whisperx.load_align_model.call_count == 3
 
     @patch.object(WhisperXOptimizer, 'is_available', return_value=True)
     def test_optimize_handles_multiple_segments(self, mock_is_available):
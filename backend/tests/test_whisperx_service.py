@@ -6,7 +6,7 @@ Tests transcription with mocked WhisperX to avoid GPU dependency
 import pytest
 import os
 from unittest.mock import Mock, MagicMock, patch
-from app.ai_services.whisperx_service import WhisperXService
+from app.ai_services.whisperx_service import WhisperXService, _clip_windows, _convert_texts
 
 
 @pytest.fixture
@@ -236,3 +236,98 @@ def test_alignment_model_caching(mock_whisperx, temp_audio_file):
         language_code="en",
         device="cuda"  # Default device from settings
     )
+
+
+def test_convert_texts_batches_into_one_call():
+    """Test segment texts are converted in one call and split back in order"""
+    convert = Mock(side_effect=lambda text, locale: text.upper())
+
+    assert _convert_texts(convert, ["ab", "cd", "e"]) == ["AB", "CD", "E"]
+    convert.assert_called_once()
+
+
+def test_convert_texts_falls_back_when_split_count_changes():
+    """Test per-text conversion is used if the separator does not survive"""
+    convert = Mock(side_effect=lambda text, locale: text.replace("\u001f", ""))
+
+    assert _convert_texts(convert, ["ab", "cd"]) == ["ab", "cd"]
+    assert convert.call_count == 3
+
+
+def test_clip_windows_cover_duration_in_fixed_chunks():
+    """Test batched decoding windows tile the audio in 30s chunks"""
+    assert _clip_windows(65.0, 30) == [
+        {"start": 0, "end": 30},
+        {"start": 30, "end": 60},
+        {"start": 60, "end": 65.0},
+    ]
+    assert _clip_windows(0.0, 30) == []
+
+
+def test_decoder_inputs_sequential_by_default():
+    """Test the model's own transcribe is used when batching is disabled"""
+    service = WhisperXService.__new__(WhisperXService)
+    service.model = Mock()
+    service.batch_size = 0
+
+    transcribe_fn, audio, batch_kwargs = service._decoder_inputs("audio.wav")
+
+    assert transcribe_fn == service.model.transcribe
+    assert audio == "audio.wav"
+    assert batch_kwargs == {}
+
+
+def test_decoder_inputs_batched_keeps_timestamps():
+    """Test batched decoding clips 30s windows and keeps segment timestamps"""
+    import numpy as np
+
+    service = WhisperXService.__new__(WhisperXService)
+    service.model = Mock()
+    service.model.feature_extractor.sampling_rate = 16000
+    service.model.feature_extractor.chunk_length = 30
+    service.batch_size = 8
+    waveform = np.zeros(16000 * 70, dtype=np.float32)
+
+    with patch("faster_whisper.decode_audio", return_value=waveform) as decode_audio, \
+            patch("faster_whisper.BatchedInferencePipeline") as pipeline_cls:
+        transcribe_fn, audio, batch_kwargs = service._decoder_inputs("audio.wav")
+
+    decode_audio.assert_called_once_with("audio.wav", sampling_rate=16000)
+    pipeline_cls.assert_called_once_with(model=service.model)
+    assert transcribe_fn == pipeline_cls.return_value.transcribe
+    assert audio is waveform
+    assert batch_kwargs["batch_size"] == 8
+    assert batch_kwargs["without_timestamps"] is False
+    assert batch_kwargs["clip_timestamps"] == _clip_windows(70.0, 30)
+
+
+def test_concurrent_construction_loads_model_once():
+    """Test threads racing on a cache miss share a single model load"""
+    import threading
+    import time
+
+    WhisperXService._model_cache.clear()
+
+    def slow_load(*args, **kwargs):
+        time.sleep(0.05)
+        return Mock()
+
+    with patch("faster_whisper.WhisperModel", side_effect=slow_load) as model_cls:
+        services = []
+        threads = [
+            threading.Thread(
+                target=lambda: services.append(
+                    WhisperXService(model_name="base", device="cpu", compute_type="int8")
+                )
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert model_cls.call_count == 1
+    assert len({id(service.model) for service in services}) == 1
+    assert ("base", "cpu", "int8") in WhisperXService._model_cache
+    WhisperXService._model_cache.clear()